@@ -0,0 +1,37 @@
+from app.database.storage import get_db
+
+# (colección, claves, opciones). Los nombres son los que pone Mongo por
+# defecto (username_1, username_1_active_1...), así que volver a crearlos
+# no hace nada: el bootstrap se puede correr en cada arranque.
+INDEXES = [
+    # register_user / user_exists / alta masiva
+    ("users", [("username", 1)], {"unique": True}),
+    # verify_user: {"username": ..., "active": True}
+    ("users", [("username", 1), ("active", 1)], {}),
+    # add_winner busca por usuario; el salón de la fama ordena por fecha
+    ("hall_of_fame", [("username", 1)], {}),
+    ("hall_of_fame", [("completed_at", -1)], {}),
+]
+
+
+def ensure_indexes(db=None):
+    """Crea los índices que falten. Devuelve los nombres de los que quedaron creados."""
+    db = db if db is not None else get_db()
+    created = []
+    for collection, keys, options in INDEXES:
+        try:
+            created.append(f"{collection}.{db[collection].create_index(keys, **options)}")
+        except Exception as e:
+            # p. ej. usuarios repetidos que impiden el índice único
+            print(f"⚠️ No se pudo crear el índice {collection} {keys}: {e}")
+    return created
+
+
+if __name__ == "__main__":
+    # python -m app.database.indexes
+    try:
+        names = ensure_indexes()
+    except Exception as e:
+        print("❌ Error conectando a la base de datos:", e)
+        raise SystemExit(1)
+    print(f"✅ Índices listos: {', '.join(names)}")
@@ -0,0 +1,352 @@
+import copy
+import json
+import os
+import sys
+import tempfile
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# Datos iniciales (versionados en el repositorio): solo se leen, la
+# primera vez que una colección no existe todavía en la carpeta del usuario
+SEED_DIR = Path(__file__).resolve().parents[2] / "data"
+
+
+def user_data_dir():
+    """
+    Carpeta por defecto de la base local: <datos del usuario>/db, junto a la
+    partida guardada (misma regla que game/guardado.py carpeta_usuario,
+    incluida la variable AVR_DATOS).
+    """
+    forced = os.environ.get("AVR_DATOS")
+    if forced:
+        return Path(forced) / "db"
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / "AvatarsVsRooks" / "db"
+
+# Colección -> (archivo, clave de la lista dentro del archivo)
+COLLECTION_FILES = {
+    "users": ("users.json", "users"),
+    "hall_of_fame": ("winners.json", "winners"),
+}
+
+
+class DuplicateKeyError(Exception):
+    """Se intentó insertar un valor repetido en un índice único."""
+
+
+class InsertOneResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+
+class InsertManyResult:
+    def __init__(self, inserted_ids):
+        self.inserted_ids = inserted_ids
+
+
+class DeleteResult:
+    def __init__(self, deleted_count):
+        self.deleted_count = deleted_count
+
+
+# --------------------------------------------
+# SERIALIZACIÓN (fechas como {"$date": iso}, igual que el JSON extendido de Mongo)
+# --------------------------------------------
+def _to_json(value):
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def _from_json(obj):
+    if len(obj) == 1 and "$date" in obj:
+        return datetime.fromisoformat(obj["$date"])
+    return obj
+
+
+def _is_in(cond):
+    return isinstance(cond, dict) and "$in" in cond
+
+
+def _match(value, cond):
+    if _is_in(cond):
+        return value in cond["$in"]
+    return value == cond
+
+
+def _key(keys):
+    """
+    Nombre, campos y especificación [(campo, dirección), ...] de un índice
+    a partir de 'campo' o [(campo, dirección), ...].
+    """
+    if isinstance(keys, str):
+        keys = [(keys, 1)]
+    keys = [(field, direction) for field, direction in keys]
+    fields = tuple(field for field, _ in keys)
+    name = "_".join(f"{field}_{direction}" for field, direction in keys)
+    return name, fields, keys
+
+
+class LocalCursor:
+    """Resultado de find(): se puede ordenar, limitar e iterar."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, field, direction=1):
+        # Los documentos sin el campo van al final, como en Mongo con orden descendente
+        present = [d for d in self._docs if d.get(field) is not None]
+        missing = [d for d in self._docs if d.get(field) is None]
+        present.sort(key=lambda d: d[field], reverse=direction < 0)
+        self._docs = present + missing
+        return self
+
+    def limit(self, n):
+        if n:
+            self._docs = self._docs[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self._docs)
+
+
+class LocalCollection:
+    """
+    Colección en memoria con la misma interfaz que usa el juego de pymongo
+    (find_one, find, insert_one, insert_many, count_documents, delete_many,
+    create_index). Los filtros son de igualdad campo a campo, o
+    {"campo": {"$in": [valores]}}.
+
+    Cada índice es un dict {valores: [documentos]}, así que buscar por
+    un campo indexado no recorre la colección. Siempre hay un índice único
+    sobre _id.
+    """
+
+    def __init__(self, database, name, docs):
+        self.database = database
+        self.name = name
+        self._docs = []
+        self._indexes = {"_id_": (("_id",), True, {})}
+        # La dirección no cambia las búsquedas por igualdad; se guarda solo
+        # para que index_information() responda como pymongo
+        self._index_keys = {"_id_": [("_id", 1)]}
+        for doc in docs:
+            doc.setdefault("_id", uuid.uuid4().hex)
+            self._index_doc(doc)
+            self._docs.append(doc)
+
+    # --------------------------------------------
+    # ÍNDICES
+    # --------------------------------------------
+    def create_index(self, keys, unique=False, name=None):
+        """Crea el índice si no existe (idempotente). Devuelve su nombre."""
+        default_name, fields, spec = _key(keys)
+        name = name or default_name
+        with self.database.lock:
+            if name in self._indexes:
+                return name
+            entries = {}
+            for doc in self._docs:
+                value = tuple(doc.get(field) for field in fields)
+                if unique and value in entries:
+                    raise DuplicateKeyError(f"{self.name}.{name}: valor repetido {value}")
+                entries.setdefault(value, []).append(doc)
+            self._indexes[name] = (fields, unique, entries)
+            self._index_keys[name] = spec
+            return name
+
+    def index_information(self):
+        return {
+            name: {"key": list(self._index_keys[name]), "unique": unique}
+            for name, (_, unique, _) in self._indexes.items()
+        }
+
+    def _index_doc(self, doc):
+        for name, (fields, unique, entries) in self._indexes.items():
+            value = tuple(doc.get(field) for field in fields)
+            if unique and value in entries:
+                raise DuplicateKeyError(f"{self.name}.{name}: valor repetido {value}")
+        for fields, _, entries in self._indexes.values():
+            entries.setdefault(tuple(doc.get(field) for field in fields), []).append(doc)
+
+    def _unindex_doc(self, doc):
+        for fields, _, entries in self._indexes.values():
+            value = tuple(doc.get(field) for field in fields)
+            bucket = entries.get(value, [])
+            bucket[:] = [d for d in bucket if d is not doc]
+            if not bucket:
+                entries.pop(value, None)
+
+    def _candidates(self, query):
+        """Documentos a revisar: los de un índice que cubra el filtro, o todos."""
+        best = None
+        for fields, _, entries in self._indexes.values():
+            if all(field in query for field in fields):
+                if best is None or len(fields) > len(best[0]):
+                    best = (fields, entries)
+        if best is None:
+            return self._docs
+        fields, entries = best
+
+        # Con $in se junta el grupo de cada valor pedido
+        keys = [()]
+        for field in fields:
+            cond = query[field]
+            values = dict.fromkeys(cond["$in"]) if _is_in(cond) else (cond,)
+            keys = [key + (value,) for key in keys for value in values]
+        if len(keys) == 1:
+            return entries.get(keys[0], [])
+        return [doc for key in keys for doc in entries.get(key, [])]
+
+    # --------------------------------------------
+    # CONSULTAS
+    # --------------------------------------------
+    def _matches(self, query):
+        query = query or {}
+        return [
+            doc for doc in self._candidates(query)
+            if all(_match(doc.get(field), cond) for field, cond in query.items())
+        ]
+
+    @staticmethod
+    def _project(doc, projection):
+        doc = copy.deepcopy(doc)
+        if not projection:
+            return doc
+        if all(not v for k, v in projection.items() if k != "_id"):
+            for field in projection:
+                doc.pop(field, None)
+            return doc
+        keep = {field for field, v in projection.items() if v}
+        if projection.get("_id", 1):
+            keep.add("_id")
+        return {k: v for k, v in doc.items() if k in keep}
+
+    def find_one(self, query=None, projection=None):
+        with self.database.lock:
+            found = self._matches(query)
+            return self._project(found[0], projection) if found else None
+
+    def find(self, query=None, projection=None):
+        with self.database.lock:
+            return LocalCursor([self._project(doc, projection) for doc in self._matches(query)])
+
+    def count_documents(self, query):
+        with self.database.lock:
+            return len(self._matches(query))
+
+    # --------------------------------------------
+    # ESCRITURAS (cada una se guarda a disco al terminar)
+    # --------------------------------------------
+    def insert_one(self, document):
+        return InsertOneResult(self.insert_many([document]).inserted_ids[0])
+
+    def insert_many(self, documents, ordered=True):
+        """
+        Inserta todos los documentos y escribe el archivo una sola vez.
+        Si uno viola un índice único se detiene ahí (ordered=True) o lo
+        salta; en ambos casos lo insertado se guarda y se lanza
+        DuplicateKeyError con `inserted_ids` y `errors` (índice, mensaje).
+        """
+        inserted, errors = [], []
+        with self.database.lock:
+            for i, document in enumerate(documents):
+                doc = copy.deepcopy(document)
+                doc.setdefault("_id", uuid.uuid4().hex)
+                try:
+                    self._index_doc(doc)
+                except DuplicateKeyError as e:
+                    errors.append((i, str(e)))
+                    if ordered:
+                        break
+                    continue
+                self._docs.append(doc)
+                document["_id"] = doc["_id"]
+                inserted.append(doc["_id"])
+            if inserted:
+                self.database.save(self.name)
+        if errors:
+            error = DuplicateKeyError(errors[0][1])
+            error.inserted_ids = inserted
+            error.errors = errors
+            raise error
+        return InsertManyResult(inserted)
+
+    def delete_many(self, query):
+        with self.database.lock:
+            doomed = self._matches(query)
+            if doomed:
+                for doc in doomed:
+                    self._unindex_doc(doc)
+                doomed_ids = {id(doc) for doc in doomed}
+                self._docs = [doc for doc in self._docs if id(doc) not in doomed_ids]
+                self.database.save(self.name)
+            return DeleteResult(len(doomed))
+
+
+class LocalDatabase:
+    """
+    Base de datos local en archivos JSON (users.json, winners.json...).
+
+    Cada colección se lee completa la primera vez que se pide y se guarda
+    entera, de forma atómica, después de cada escritura. Pensada para un
+    solo proceso (kioscos sin red, CI, pruebas de carga); el lock hace
+    seguro usarla desde varios hilos.
+
+    Sin data_dir se usa user_data_dir(), y una colección que todavía no
+    tiene archivo ahí arranca con la copia de data/ del repositorio, que
+    nunca se escribe. Con un data_dir explícito no hay datos iniciales
+    salvo que se pase seed_dir.
+    """
+
+    def __init__(self, data_dir=None, seed_dir=None):
+        if data_dir:
+            self.data_dir = Path(data_dir)
+            self.seed_dir = Path(seed_dir) if seed_dir else None
+        else:
+            self.data_dir = user_data_dir()
+            self.seed_dir = Path(seed_dir) if seed_dir else SEED_DIR
+        self.lock = threading.RLock()
+        self._collections = {}
+
+    def __getitem__(self, name):
+        with self.lock:
+            if name not in self._collections:
+                self._collections[name] = LocalCollection(self, name, self._load(name))
+            return self._collections[name]
+
+    def _location(self, name, folder=None):
+        filename, key = COLLECTION_FILES.get(name, (f"{name}.json", name))
+        return (folder or self.data_dir) / filename, key
+
+    def _load(self, name):
+        path, key = self._location(name)
+        if not path.exists() and self.seed_dir is not None:
+            path, key = self._location(name, self.seed_dir)
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f, object_hook=_from_json).get(key, [])
+
+    def save(self, name):
+        path, key = self._location(name)
+        content = json.dumps(
+            {key: self._collections[name]._docs}, default=_to_json, ensure_ascii=False, indent=2
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
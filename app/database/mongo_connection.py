@@ -2,22 +2,56 @@ from pymongo.mongo_client import MongoClient
 from pymongo.server_api import ServerApi
 from dotenv import load_dotenv
 import os
+import threading
 
-load_dotenv()  # Carga las variables del .env
+# El cliente se crea la primera vez que se usa, no al importar: con una
+# URI mongodb+srv el constructor resuelve el SRV de Atlas y, sin red,
+# eso puede trabar el arranque de la aplicación.
+_client = None
+_lock = threading.Lock()
 
-MONGO_USER = os.getenv("MONGO_USER")
-MONGO_PASSWORD = os.getenv("MONGO_PASSWORD")
-MONGO_CLUSTER = os.getenv("MONGO_CLUSTER")
-MONGO_DB_NAME = os.getenv("MONGO_DB", "AVR")
 
-URI = f"mongodb+srv://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_CLUSTER}/?appName=AVR"
+def get_client():
+    """
+    Devuelve el MongoClient, creándolo en el primer uso.
+
+    El constructor (DNS del SRV) corre fuera del lock: un hilo que pide el
+    cliente mientras otro lo está creando no queda esperando detrás de él.
+    Si dos hilos lo crean a la vez, se queda el primero y el otro se cierra.
+    """
+    global _client
+    if _client is not None:
+        return _client
+    load_dotenv()  # Carga las variables del .env
+    user = os.getenv("MONGO_USER")
+    password = os.getenv("MONGO_PASSWORD")
+    cluster = os.getenv("MONGO_CLUSTER")
+    uri = f"mongodb+srv://{user}:{password}@{cluster}/?appName=AVR"
+    client = MongoClient(uri, server_api=ServerApi("1"))
+    with _lock:
+        if _client is None:
+            _client = client
+            return _client
+    client.close()
+    return _client
+
+
+def get_db():
+    return get_client()[os.getenv("MONGO_DB", "AVR")]
+
+
+def __getattr__(name):
+    # Compatibilidad con `from app.database.mongo_connection import db, client`
+    if name == "client":
+        return get_client()
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-client = MongoClient(URI, server_api=ServerApi("1"))
-db = client[MONGO_DB_NAME]
 
 def test_connection():
     try:
-        client.admin.command("ping")
+        get_client().admin.command("ping")
         print("✅ Conectado a MongoDB correctamente")
         return True  # ← Asegúrate de que esto esté aquí
     except Exception as e:
@@ -25,4 +59,4 @@ def test_connection():
         return False
 
 if __name__ == "__main__":
-    test_connection()
\ No newline at end of file
+    test_connection()
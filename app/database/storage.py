@@ -0,0 +1,54 @@
+import os
+import threading
+from dotenv import load_dotenv
+
+# Backend de datos, elegido con la variable AVR_STORAGE (en el .env o el entorno):
+#   "mongo"  MongoDB Atlas (app/database/mongo_connection.py), por defecto
+#   "local"  archivos JSON en la carpeta de datos del usuario (o en
+#            AVR_LOCAL_DIR), sin red; data/ del repositorio son los datos iniciales
+BACKENDS = ("mongo", "local")
+
+_db = None
+_lock = threading.Lock()
+
+
+def get_backend():
+    load_dotenv()
+    backend = os.getenv("AVR_STORAGE", "mongo").strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"AVR_STORAGE inválido: {backend!r} (usa uno de {', '.join(BACKENDS)})")
+    return backend
+
+
+def get_db():
+    """Base de datos del backend configurado; db["users"], db["hall_of_fame"], ..."""
+    global _db
+    if _db is not None:
+        return _db
+    if get_backend() == "local":
+        with _lock:
+            if _db is None:
+                from app.database.local_db import LocalDatabase
+                from app.database.indexes import ensure_indexes
+                db = LocalDatabase(os.getenv("AVR_LOCAL_DIR"))
+                # Los índices locales viven en memoria: se arman al abrir la base
+                ensure_indexes(db)
+                _db = db
+            return _db
+
+    # Mongo: el cliente se crea fuera del lock (puede tardar en resolver el
+    # SRV), así el hilo de la interfaz no espera detrás del ping de fondo
+    from app.database.mongo_connection import get_db as get_mongo_db
+    db = get_mongo_db()
+    with _lock:
+        if _db is None:
+            _db = db
+        return _db
+
+
+def test_connection():
+    if get_backend() == "local":
+        print(f"✅ Usando base de datos local en {get_db().data_dir}")
+        return True
+    from app.database.mongo_connection import test_connection as test_mongo
+    return test_mongo()
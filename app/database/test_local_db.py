@@ -0,0 +1,118 @@
+"""
+Pruebas de la base de datos local en JSON (LocalDatabase / LocalCollection).
+
+Uso:
+    python -m pytest app/database/test_local_db.py
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database.local_db import DuplicateKeyError, LocalDatabase  # noqa: E402
+
+
+@pytest.fixture
+def users(tmp_path):
+    collection = LocalDatabase(tmp_path)["users"]
+    collection.create_index("username", unique=True)
+    return collection
+
+
+def test_indice_unico(users):
+    users.insert_one({"username": "ana", "password": "x"})
+    with pytest.raises(DuplicateKeyError):
+        users.insert_one({"username": "ana", "password": "y"})
+    assert users.count_documents({"username": "ana"}) == 1
+    # Crear el mismo índice otra vez no falla
+    assert users.create_index("username", unique=True) == "username_1"
+
+
+def test_indice_unico_sobre_datos_repetidos(tmp_path):
+    collection = LocalDatabase(tmp_path)["users"]
+    collection.insert_many([{"username": "ana"}, {"username": "ana"}])
+    with pytest.raises(DuplicateKeyError):
+        collection.create_index("username", unique=True)
+
+
+def test_index_information(users):
+    users.create_index([("completed_at", -1)])
+    info = users.index_information()
+    assert info["_id_"] == {"key": [("_id", 1)], "unique": True}
+    assert info["username_1"] == {"key": [("username", 1)], "unique": True}
+    assert info["completed_at_-1"] == {"key": [("completed_at", -1)], "unique": False}
+
+
+def test_find_con_in_y_proyeccion(users):
+    users.insert_many([{"username": u, "password": u * 2} for u in ("ana", "beto", "caro")])
+    encontrados = users.find({"username": {"$in": ["caro", "ana", "nadie", "ana"]}},
+                             {"username": 1, "_id": 0})
+    assert sorted(d["username"] for d in encontrados) == ["ana", "caro"]
+
+    assert users.find_one({"username": "beto"}, {"password": 0, "_id": 0}) == {"username": "beto"}
+    assert users.find_one({"username": "beto"}, {"_id": 0}) == {"username": "beto", "password": "betobeto"}
+    assert users.find_one({"username": "nadie"}) is None
+
+
+def test_find_ordenado_y_limitado(users):
+    users.insert_many([{"username": u, "n": n} for u, n in (("a", 2), ("b", 3), ("c", 1), ("d", None))])
+    assert [d["username"] for d in users.find().sort("n", -1)] == ["b", "a", "c", "d"]
+    assert [d["username"] for d in users.find().sort("n").limit(2)] == ["c", "a"]
+
+
+def test_insert_many_desordenado_informa_cada_repetido(users):
+    users.insert_one({"username": "ana"})
+    docs = [{"username": "beto"}, {"username": "ana"}, {"username": "caro"}, {"username": "beto"}]
+    with pytest.raises(DuplicateKeyError) as info:
+        users.insert_many(docs, ordered=False)
+    assert [i for i, _ in info.value.errors] == [1, 3]
+    assert info.value.inserted_ids == [docs[0]["_id"], docs[2]["_id"]]
+    assert users.count_documents({}) == 3
+
+
+def test_insert_many_ordenado_se_detiene(users):
+    docs = [{"username": "ana"}, {"username": "ana"}, {"username": "beto"}]
+    with pytest.raises(DuplicateKeyError) as info:
+        users.insert_many(docs)
+    assert [i for i, _ in info.value.errors] == [1]
+    assert len(info.value.inserted_ids) == 1
+    assert users.find_one({"username": "beto"}) is None
+
+
+def test_delete_many_actualiza_el_indice(users):
+    users.insert_many([{"username": "ana"}, {"username": "beto"}])
+    assert users.delete_many({"username": "ana"}).deleted_count == 1
+    users.insert_one({"username": "ana"})
+    assert users.count_documents({}) == 2
+
+
+def test_persistencia(tmp_path):
+    users = LocalDatabase(tmp_path)["users"]
+    users.insert_one({"username": "ana"})
+    assert [p.name for p in tmp_path.iterdir()] == ["users.json"]
+
+    otra = LocalDatabase(tmp_path)["users"]
+    assert otra.find_one({"username": "ana"})["_id"] == users.find_one({"username": "ana"})["_id"]
+
+
+def test_datos_iniciales_no_se_escriben(tmp_path):
+    semilla = tmp_path / "semilla"
+    semilla.mkdir()
+    original = json.dumps({"users": [{"_id": "1", "username": "ana"}]})
+    (semilla / "users.json").write_text(original, encoding="utf-8")
+
+    datos = tmp_path / "datos"
+    users = LocalDatabase(datos, seed_dir=semilla)["users"]
+    assert users.find_one({"username": "ana"}) is not None
+    users.insert_one({"username": "beto"})
+
+    assert (semilla / "users.json").read_text(encoding="utf-8") == original
+    assert LocalDatabase(datos)["users"].count_documents({}) == 2
+
+
+def test_carpeta_por_defecto(tmp_path, monkeypatch):
+    monkeypatch.setenv("AVR_DATOS", str(tmp_path))
+    assert LocalDatabase().data_dir == tmp_path / "db"
@@ -1,9 +1,10 @@
 from PySide6.QtWidgets import QMainWindow, QMessageBox
 from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt
 from pathlib import Path
 from app.ui.ui_ventana_inicio import Ui_AvatarsVSRooks
-from app.utils.auth import verify_user, register_user
-from app.database.mongo_connection import test_connection
+from app.utils.auth_service import AuthService
+from app.utils.connection_checker import ConnectionChecker
 from menu_dev.menu_window import MenuWindow
 
 class LoginWindow(QMainWindow):
@@ -12,13 +13,11 @@ class LoginWindow(QMainWindow):
         self.ui = Ui_AvatarsVSRooks()
         self.ui.setupUi(self)
         
-        # Verificar conexión a MongoDB al iniciar
-        if not test_connection():
-            QMessageBox.critical(
-                self,
-                "Error de conexión",
-                "No se pudo conectar a la base de datos.\nVerifica tu conexión a internet."
-            )
+        # Verificar conexión a la base de datos al iniciar, sin bloquear la ventana
+        self.connection_checker = ConnectionChecker(self)
+        self.connection_checker.finished.connect(self.on_connection_checked)
+        self.ui.statusbar.showMessage("🔌 Conectando a la base de datos...")
+        self.connection_checker.start()
         
         # Configurar imagen de fondo
         image_path = Path(__file__).parent.parent / "ui" / "images" / "fondo.jpg"
@@ -34,13 +33,44 @@ class LoginWindow(QMainWindow):
         else:
             print(f"❌ Imagen no encontrada en: {image_path}")
         
+        # Login y registro corren en segundo plano (PBKDF2 + base de datos)
+        self.auth_service = AuthService(self)
+        self.auth_service.login_finished.connect(self.on_login_finished)
+        self.auth_service.register_finished.connect(self.on_register_finished)
+        self._button_texts = {}
+
         # Conectar botones
         self.ui.btnEntrar.clicked.connect(self.handle_login)
         self.ui.btn_registrarse.clicked.connect(self.handle_register)
         self.menu_window = None
+
+    def set_busy(self, button=None, text=None):
+        """Deshabilita los botones mientras hay una operación en curso; sin argumentos, los restaura"""
+        for btn in (self.ui.btnEntrar, self.ui.btn_registrarse):
+            if button is None:
+                btn.setText(self._button_texts.pop(btn, btn.text()))
+            btn.setEnabled(button is None)
+        if button is not None:
+            self._button_texts[button] = button.text()
+            button.setText(text)
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
     
+    def on_connection_checked(self, ok):
+        """Resultado del ping a la base de datos (llega desde ConnectionChecker)"""
+        if ok:
+            self.ui.statusbar.showMessage("✅ Conectado a la base de datos", 3000)
+            return
+        self.ui.statusbar.showMessage("❌ Sin conexión a la base de datos")
+        QMessageBox.critical(
+            self,
+            "Error de conexión",
+            "No se pudo conectar a la base de datos.\nVerifica tu conexión a internet."
+        )
+
     def handle_register(self):
-        """Maneja el registro de nuevos usuarios en MongoDB"""
+        """Maneja el registro de nuevos usuarios"""
         username = self.ui.txtUsuario.text().strip()
         password = self.ui.txtPassword.text().strip()
         
@@ -69,9 +99,13 @@ class LoginWindow(QMainWindow):
             )
             return
         
-        # Intentar registrar en MongoDB
-        success, message = register_user(username, password)
-        
+        # Registrar en segundo plano; el resultado llega a on_register_finished
+        self.set_busy(self.ui.btn_registrarse, "⏳ Registrando...")
+        self.auth_service.register(username, password)
+
+    def on_register_finished(self, username, success, message):
+        """Resultado de AuthService.register"""
+        self.set_busy()
         if success:
             QMessageBox.information(
                 self,
@@ -89,7 +123,7 @@ class LoginWindow(QMainWindow):
             )
     
     def handle_login(self):
-        """Maneja el inicio de sesión con MongoDB"""
+        """Maneja el inicio de sesión"""
         username = self.ui.txtUsuario.text().strip()
         password = self.ui.txtPassword.text().strip()
         
@@ -102,8 +136,14 @@ class LoginWindow(QMainWindow):
             )
             return
         
-        # Verificar credenciales en MongoDB
-        if verify_user(username, password):
+        # Verificar credenciales en segundo plano; el resultado llega a on_login_finished
+        self.set_busy(self.ui.btnEntrar, "⏳ Verificando...")
+        self.auth_service.login(username, password)
+
+    def on_login_finished(self, username, ok):
+        """Resultado de AuthService.login"""
+        self.set_busy()
+        if ok:
             print(f"✅ Login exitoso para: {username}")
             
             self.menu_window = MenuWindow()
@@ -1,7 +1,7 @@
 import hashlib
 import base64
 import os
-from app.database.mongo_connection import db
+from app.database.storage import get_db
 
 # Configuración de hash
 ITERATIONS = 130000
@@ -25,10 +25,22 @@ def hash_password(password, salt=None):
         'hash': base64.b64encode(pwd_hash).decode('utf-8')
     }
 
+def new_user_document(username, password, role="user"):
+    """Documento listo para insertar en users (incluye el hash PBKDF2)"""
+    hashed = hash_password(password)
+    return {
+        "username": username,
+        "salt": hashed['salt'],
+        "hash": hashed['hash'],
+        "iterations": ITERATIONS,
+        "role": role,
+        "active": True
+    }
+
 def verify_user(username, password):
-    """Verifica las credenciales del usuario en MongoDB"""
+    """Verifica las credenciales del usuario en la base de datos"""
     try:
-        collection = db["users"]
+        collection = get_db()["users"]
         user = collection.find_one({"username": username, "active": True})
         
         if not user:
@@ -51,28 +63,18 @@ def verify_user(username, password):
         return False
 
 def register_user(username, password):
-    """Registra un nuevo usuario en MongoDB"""
+    """Registra un nuevo usuario en la base de datos"""
     try:
-        collection = db["users"]
+        collection = get_db()["users"]
         
         # Verificar si el usuario ya existe
         if collection.find_one({"username": username}):
             return False, "El usuario ya existe"
         
-        # Hashear la contraseña
-        hashed = hash_password(password)
+        # Crear documento del usuario (con la contraseña hasheada)
+        new_user = new_user_document(username, password)
         
-        # Crear documento del usuario
-        new_user = {
-            "username": username,
-            "salt": hashed['salt'],
-            "hash": hashed['hash'],
-            "iterations": ITERATIONS,
-            "role": "user",
-            "active": True
-        }
-        
-        # Insertar en MongoDB
+        # Insertar en la base de datos
         result = collection.insert_one(new_user)
         
         if result.inserted_id:
@@ -85,10 +87,23 @@ def register_user(username, password):
         print(f"❌ Error en register_user: {e}")
         return False, f"Error: {str(e)}"
 
+def create_user(username, password, role="user"):
+    """Crea un usuario con el rol indicado. Devuelve False si ya existe"""
+    try:
+        collection = get_db()["users"]
+        if collection.find_one({"username": username}):
+            return False
+        collection.insert_one(new_user_document(username, password, role))
+        print(f"✅ Usuario creado: {username} ({role})")
+        return True
+    except Exception as e:
+        print(f"❌ Error en create_user: {e}")
+        return False
+
 def user_exists(username):
-    """Verifica si un usuario existe en MongoDB"""
+    """Verifica si un usuario existe en la base de datos"""
     try:
-        collection = db["users"]
+        collection = get_db()["users"]
         return collection.count_documents({"username": username}) > 0
     except Exception as e:
         print(f"❌ Error verificando usuario: {e}")
@@ -97,7 +112,7 @@ def user_exists(username):
 def get_user_info(username):
     """Obtiene la información completa de un usuario"""
     try:
-        collection = db["users"]
+        collection = get_db()["users"]
         user = collection.find_one({"username": username}, {"hash": 0, "salt": 0})
         return user
     except Exception as e:
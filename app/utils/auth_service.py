@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtCore import QObject, Signal
+from app.utils.auth import verify_user, register_user
+
+
+class AuthService(QObject):
+    """
+    Login y registro sin trabar la interfaz.
+
+    verify_user y register_user (PBKDF2 de 130.000 iteraciones más la
+    consulta a la base) corren en un pool de hilos; hashlib suelta el GIL
+    mientras calcula el hash, así que la ventana sigue respondiendo.
+    Cada llamada devuelve un Future y, al terminar, emite la señal
+    correspondiente, que Qt entrega en el hilo de la ventana.
+    """
+
+    login_finished = Signal(str, bool)              # usuario, ok
+    register_finished = Signal(str, bool, str)      # usuario, ok, mensaje
+
+    def __init__(self, parent=None, max_workers=2):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="auth")
+
+    def login(self, username, password):
+        future = self._executor.submit(verify_user, username, password)
+        future.add_done_callback(lambda f: self._emit(
+            self.login_finished, username, self._result(f, False)
+        ))
+        return future
+
+    def register(self, username, password):
+        future = self._executor.submit(register_user, username, password)
+        future.add_done_callback(lambda f: self._emit(
+            self.register_finished, username, *self._result(f, (False, "Error inesperado al registrar"))
+        ))
+        return future
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _result(future, default):
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"❌ Error en el servicio de autenticación: {e}")
+            return default
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # La ventana se cerró antes de que terminara la operación
+            pass
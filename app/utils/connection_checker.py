@@ -0,0 +1,45 @@
+import threading
+from PySide6.QtCore import QObject, Signal
+from app.database.storage import test_connection
+from app.database.indexes import ensure_indexes
+
+
+class ConnectionChecker(QObject):
+    """
+    Prueba la conexión a la base de datos en un hilo aparte.
+
+    El ping (y la creación del cliente de Mongo, que resuelve DNS y hace
+    el handshake TLS) nunca corre en el hilo de la interfaz; el resultado
+    llega con la señal `finished(bool)`, que Qt entrega en el hilo de la
+    ventana que la conectó. Con conexión, en el mismo hilo se asegura que
+    existan los índices (ensure_indexes es idempotente).
+    """
+
+    finished = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.connected = None   # None = todavía no se sabe
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self.connected = None
+        self._thread = threading.Thread(target=self._run, name="db-ping", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            ok = test_connection()
+            if ok:
+                ensure_indexes()
+        except Exception as e:
+            print("❌ Error probando la conexión:", e)
+            ok = False
+        self.connected = ok
+        try:
+            self.finished.emit(ok)
+        except RuntimeError:
+            # La ventana se cerró antes de que terminara el ping
+            pass
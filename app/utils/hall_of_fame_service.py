@@ -0,0 +1,88 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from PySide6.QtCore import QObject, Signal
+from app.database.storage import get_db
+
+# Un solo hilo para todo el salón de la fama: las operaciones quedan en
+# orden (un ganador nuevo aparece en la siguiente carga) y la primera
+# llamada a get_db(), que puede crear el cliente de Mongo, nunca corre
+# en el hilo de la interfaz.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hall-of-fame")
+
+
+def fetch_winners():
+    """Ganadores ordenados por fecha (más reciente primero)."""
+    return list(get_db()["hall_of_fame"].find().sort("completed_at", -1))
+
+
+def clear_winners():
+    """Borra todos los ganadores. Devuelve cuántos se eliminaron."""
+    return get_db()["hall_of_fame"].delete_many({}).deleted_count
+
+
+def add_winner(username):
+    """Agrega un ganador si todavía no está. Devuelve True si lo agregó."""
+    try:
+        collection = get_db()["hall_of_fame"]
+
+        # Verificar si ya completó el juego
+        if collection.find_one({"username": username}):
+            print(f"ℹ️ {username} ya está en el Salón de la Fama")
+            return False
+
+        result = collection.insert_one({
+            "username": username,
+            "completed_at": datetime.now()
+        })
+        if result.inserted_id:
+            print(f"🏆 {username} agregado al Salón de la Fama!")
+            return True
+        return False
+
+    except Exception as e:
+        print(f"❌ Error agregando ganador: {e}")
+        return False
+
+
+def add_winner_async(username):
+    """add_winner en el hilo del salón de la fama. Devuelve un Future."""
+    return _executor.submit(add_winner, username)
+
+
+class HallOfFameService(QObject):
+    """
+    Lectura y borrado del salón de la fama sin trabar la interfaz.
+
+    Igual que AuthService: cada operación corre en el hilo del salón de
+    la fama, devuelve un Future y al terminar emite su señal, que Qt
+    entrega en el hilo de la ventana. El texto de error es "" si salió bien.
+    """
+
+    winners_loaded = Signal(object, str)    # lista de ganadores, error
+    history_cleared = Signal(int, str)      # eliminados, error
+
+    def load(self):
+        future = _executor.submit(fetch_winners)
+        future.add_done_callback(lambda f: self._emit(self.winners_loaded, *self._result(f, [])))
+        return future
+
+    def clear(self):
+        future = _executor.submit(clear_winners)
+        future.add_done_callback(lambda f: self._emit(self.history_cleared, *self._result(f, 0)))
+        return future
+
+    @staticmethod
+    def _result(future, default):
+        try:
+            return future.result(), ""
+        except Exception as e:
+            print(f"❌ Error en el salón de la fama: {e}")
+            return default, str(e)
+
+    @staticmethod
+    def _emit(signal, *args):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            # La ventana se cerró antes de que terminara la operación
+            pass
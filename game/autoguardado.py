@@ -0,0 +1,93 @@
+import queue
+import threading
+from cronometro import reloj
+
+
+INTERVALO_S = 10   # como mucho un autoguardado cada 10 s reales
+
+# Claves que cambian solo porque corre el reloj: no cuentan como cambio.
+# Incluye el RNG y los acumuladores de cooldown de cada unidad, que avanzan
+# en cada tick aunque nada visible cambie.
+CLAVES_RELOJ = ("tiempo_ms", "resto_ms", "eventos", "cronometro", "rng")
+CLAVES_RELOJ_UNIDAD = ("tiempo_desde_avance", "tiempo_desde_ataque")
+
+
+def firma(estado):
+    """Lo que cuenta como cambio de la partida: el estado sin el reloj."""
+    resultado = {clave: valor for clave, valor in estado.items() if clave not in CLAVES_RELOJ}
+    for clave in ("avatars", "rooks"):
+        if clave in resultado:
+            resultado[clave] = [
+                {k: v for k, v in unidad.items() if k not in CLAVES_RELOJ_UNIDAD}
+                for unidad in resultado[clave]
+            ]
+    return resultado
+
+
+class Autoguardado:
+    """
+    Autoguardado periódico sin trabar la interfaz.
+
+    El hilo de la UI solo toma la foto del estado (GameController.foto_estado(),
+    un dict de tipos básicos que no comparte nada con el motor) y la
+    encola; un hilo de fondo la serializa y la escribe con Guardado.
+    Las fotos se limitan a una cada `intervalo_s` segundos y se descartan
+    si nada cambió desde la anterior salvo el reloj (ver firma): unidades,
+    vida, monedas, economía, nivel y oleada sí cuentan.
+    """
+
+    def __init__(self, guardado, intervalo_s=INTERVALO_S):
+        self.guardado = guardado
+        self.intervalo_s = intervalo_s
+        self.guardados = 0
+        self.omitidos = 0
+        self._cola = queue.Queue()
+        self._ultima_firma = None
+        self._ultimo_envio = None
+        self._hilo = threading.Thread(target=self._trabajar, name="autoguardado", daemon=True)
+        self._hilo.start()
+
+    def toca(self):
+        """True si ya pasó el intervalo desde la última foto."""
+        if self._hilo is None:
+            return False
+        return self._ultimo_envio is None or reloj() - self._ultimo_envio >= self.intervalo_s
+
+    def solicitar(self, estado):
+        """Encola la foto para guardarla. Devuelve False si no cambió."""
+        self._ultimo_envio = reloj()
+        actual = firma(estado)
+        if actual == self._ultima_firma:
+            self.omitidos += 1
+            return False
+        self._ultima_firma = actual
+        self._cola.put(("guardar", estado))
+        return True
+
+    def marcar_salida(self, salida_segura):
+        """Cambia la marca de la partida guardada, en orden con los guardados pendientes."""
+        if self._hilo is not None:
+            self._cola.put(("marcar", salida_segura))
+
+    def cerrar(self):
+        """Termina los guardados pendientes y detiene el hilo."""
+        if self._hilo is None:
+            return
+        self._cola.put((None, None))
+        self._hilo.join()
+        self._hilo = None
+
+    def _trabajar(self):
+        while True:
+            tarea, dato = self._cola.get()
+            if tarea is None:
+                return
+            try:
+                if tarea == "guardar":
+                    # Autoguardado = partida en curso que se retoma al iniciar
+                    self.guardado.guardar(dato, salida_segura=True)
+                    self.guardados += 1
+                elif tarea == "marcar":
+                    self.guardado.marcar_salida(dato)
+            except Exception as e:
+                print(f"⚠️ Falló el autoguardado: {e}")
@@ -1,12 +1,18 @@
 class Avatar:
-    def __init__(self, fila, col, vida, ataque, vel_avance, vel_ataque, simbolo):
+    # Solo el estado que cambia vive en cada instancia; las estadísticas
+    # del tipo (vida inicial, ataque, velocidades, símbolo) son de la clase.
+    __slots__ = ("fila", "col", "vida", "tiempo_desde_avance", "tiempo_desde_ataque")
+
+    vida_inicial = 1
+    ataque = 0
+    vel_avance = 1  # segundos
+    vel_ataque = 1  # segundos
+    simbolo = "A"
+
+    def __init__(self, fila, col):
         self.fila = fila
         self.col = col
-        self.vida = vida
-        self.ataque = ataque
-        self.vel_avance = vel_avance  # segundos
-        self.vel_ataque = vel_ataque  # segundos
-        self.simbolo = simbolo
+        self.vida = self.vida_inicial
         self.tiempo_desde_avance = 0
         self.tiempo_desde_ataque = 0
     
@@ -41,48 +47,36 @@ class Avatar:
 # -------------------------
 
 class Flechador(Avatar):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=5,
-            ataque=2,
-            vel_avance=12,
-            vel_ataque=10,
-            simbolo="🏹"
-        )
+    __slots__ = ()
+    vida_inicial = 5
+    ataque = 2
+    vel_avance = 12
+    vel_ataque = 10
+    simbolo = "🏹"
 
 
 class Escudero(Avatar):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=10,
-            ataque=3,
-            vel_avance=10,
-            vel_ataque=15,
-            simbolo="🛡️"
-        )
+    __slots__ = ()
+    vida_inicial = 10
+    ataque = 3
+    vel_avance = 10
+    vel_ataque = 15
+    simbolo = "🛡️"
 
 
 class Leñador(Avatar):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=20,
-            ataque=9,
-            vel_avance=13,
-            vel_ataque=5,
-            simbolo="🪓"
-        )
+    __slots__ = ()
+    vida_inicial = 20
+    ataque = 9
+    vel_avance = 13
+    vel_ataque = 5
+    simbolo = "🪓"
 
 
 class Canibal(Avatar):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=25,
-            ataque=12,
-            vel_avance=14,
-            vel_ataque=3,
-            simbolo="🍖"
-        )
+    __slots__ = ()
+    vida_inicial = 25
+    ataque = 12
+    vel_avance = 14
+    vel_ataque = 3
+    simbolo = "🍖"
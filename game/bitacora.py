@@ -0,0 +1,167 @@
+import base64
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+import formato_partida
+from motor import MotorJuego
+
+
+# Tipos de entrada de la bitácora
+#   Acciones (se re-ejecutan al reproducir):
+#     "r" colocar rook      [t, "r", fila, col, tipo]
+#     "m" recoger moneda    [t, "m", fila, col]
+#     "e" cargar partida    [t, "e", estado en formato_partida, en base64]
+#   Eventos (se comparan al reproducir):
+#     "a" spawn de avatar   [t, "a", fila, col, clase]
+#     "c" spawn de moneda   [t, "c", fila, col, valor]
+#     "f" fin de partida    [t, "f", "victoria" | "derrota"]
+ACCIONES = ("r", "m", "e")
+EVENTOS = ("a", "c", "f")
+
+# Repeticiones que se conservan en la carpeta; las más viejas se borran
+MAX_REPETICIONES = 50
+
+
+class Bitacora:
+    """
+    Registro append-only de una sesión de juego.
+
+    La primera línea es una cabecera JSON (versión, semilla y tamaño del
+    tablero) y cada línea siguiente es una entrada compacta
+    [tiempo_ms, tipo, datos...]. Con la semilla y las acciones del jugador
+    se puede volver a jugar la sesión exacta sin interfaz.
+    """
+
+    VERSION = 2
+    VERSIONES_LEGIBLES = (1, 2)   # la 1 guardaba el estado de "e" como dict
+
+    def __init__(self, ruta=None):
+        self.ruta = ruta
+        self.cabecera = None
+        self.entradas = []
+        self._archivo = None
+        if ruta is not None:
+            carpeta = os.path.dirname(ruta)
+            if carpeta:
+                os.makedirs(carpeta, exist_ok=True)
+            # "x": cada sesión tiene su propio archivo, nunca se agrega a otro
+            self._archivo = open(ruta, "x", encoding="utf-8")
+
+    def escribir_cabecera(self, **datos):
+        self.cabecera = {"version": self.VERSION, **datos}
+        self._escribir(self.cabecera)
+
+    def registrar(self, tiempo_ms, tipo, *datos):
+        if tipo == "e":
+            datos = (codificar_checkpoint(datos[0]),)
+        entrada = [tiempo_ms, tipo, *datos]
+        self.entradas.append(entrada)
+        self._escribir(entrada)
+
+    def _escribir(self, obj):
+        if self._archivo is None:
+            return
+        self._archivo.write(json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._archivo.flush()
+
+    def cerrar(self):
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+
+    @staticmethod
+    def leer(ruta):
+        """Devuelve (cabecera, entradas) de un archivo de bitácora."""
+        with open(ruta, "r", encoding="utf-8") as f:
+            lineas = [json.loads(linea) for linea in f if linea.strip()]
+        if not lineas:
+            raise ValueError(f"Bitácora vacía: {ruta}")
+        # La cabecera es un dict y las entradas son listas
+        for numero, linea in enumerate(lineas[1:], start=2):
+            if isinstance(linea, dict):
+                raise ValueError(
+                    f"Bitácora con más de una cabecera (línea {numero}): {ruta}; "
+                    f"cada archivo debe tener una sola sesión"
+                )
+        return lineas[0], lineas[1:]
+
+
+def nueva_ruta(carpeta, conservar=MAX_REPETICIONES):
+    """
+    Ruta para la bitácora de una sesión nueva en `carpeta`.
+
+    Antes borra las más viejas para que, contando la nueva, queden como
+    mucho `conservar`. El nombre lleva fecha y un sufijo al azar (dos
+    sesiones del mismo segundo no comparten archivo), así que el orden
+    alfabético es el cronológico.
+    """
+    carpeta = Path(carpeta)
+    anteriores = sorted(carpeta.glob("partida_*.jsonl"))
+    for viejo in anteriores[:max(0, len(anteriores) - conservar + 1)]:
+        try:
+            viejo.unlink()
+        except OSError as e:
+            print(f"WARN: no se pudo borrar la repetición {viejo}: {e}")
+    nombre = time.strftime("partida_%Y%m%d_%H%M%S") + f"_{uuid.uuid4().hex[:8]}.jsonl"
+    return str(carpeta / nombre)
+
+
+def codificar_checkpoint(estado):
+    """Estado del motor en el formato binario de partida, como texto base64."""
+    return base64.b64encode(formato_partida.codificar(estado)).decode("ascii")
+
+
+def decodificar_checkpoint(dato):
+    if isinstance(dato, dict):
+        return dato
+    return formato_partida.decodificar(base64.b64decode(dato))["estado"]
+
+
+def reproducir(cabecera, entradas, verbose=False):
+    """
+    Re-ejecuta una sesión sin interfaz y a máxima velocidad.
+
+    Devuelve (motor, diferencia): diferencia es None si los eventos
+    generados coinciden con los registrados, o una tupla
+    (indice, esperado, obtenido) con la primera discrepancia.
+    """
+    if cabecera.get("version") not in Bitacora.VERSIONES_LEGIBLES:
+        raise ValueError(f"Versión de bitácora no soportada: {cabecera.get('version')}")
+
+    nueva = Bitacora()
+    motor = MotorJuego(
+        cabecera["filas"], cabecera["columnas"],
+        verbose=verbose, semilla=cabecera["semilla"], bitacora=nueva
+    )
+    motor.iniciar()
+
+    for tiempo_ms, tipo, *datos in entradas:
+        if tipo not in ACCIONES:
+            continue
+        motor.avanzar_hasta(tiempo_ms)
+        if tipo == "r":
+            motor.colocar_rook(*datos)
+        elif tipo == "m":
+            motor.recoger_moneda_en(*datos)
+        elif tipo == "e":
+            motor.restaurar_estado(decodificar_checkpoint(datos[0]))
+
+    # Llegar hasta el último instante registrado
+    if entradas:
+        motor.avanzar_hasta(entradas[-1][0])
+
+    esperados = [e for e in entradas if e[1] in EVENTOS]
+    obtenidos = [e for e in nueva.entradas if e[1] in EVENTOS]
+    for i, (esperado, obtenido) in enumerate(zip(esperados, obtenidos)):
+        if esperado != obtenido:
+            return motor, (i, esperado, obtenido)
+    if len(esperados) != len(obtenidos):
+        i = min(len(esperados), len(obtenidos))
+        return motor, (
+            i,
+            esperados[i] if i < len(esperados) else None,
+            obtenidos[i] if i < len(obtenidos) else None
+        )
+    return motor, None
@@ -1,204 +1,221 @@
 from PySide6.QtCore import QTimer
-import json
-import os
-from niveles_progresivos import NivelManager
+import math
+from motor import MotorJuego
+from bitacora import Bitacora, nueva_ruta
+from paso_fijo import BuclePasoFijo
+from guardado import Guardado, carpeta_usuario
+from autoguardado import Autoguardado
+
+CARPETA_REPETICIONES = "repeticiones"   # dentro de carpeta_usuario()
+FRAME_MS = 16   # frame de la velocidad sin límite (~60 fps)
 
 
 
 class GameController:
+    """
+    Puente entre el MotorJuego y la ventana Tablero.
+
+    El motor contiene todas las reglas; el controlador lo avanza con un
+    QTimer a través de un BuclePasoFijo (tiempo real medido, con
+    velocidad ajustable) y refleja sus eventos (al_*) en el tablero.
+
+    El timer es de un solo disparo y se arma para cuando haya algo que
+    hacer (ver programar_tick): entre eventos del motor el tablero no
+    cambia, así que la interfaz no se despierta en cada frame.
+    """
+
     def __init__(self, tablero):
         self.tablero = tablero
         self.tablero.colocar_rook_callback = self.colocar_rook
         self.tablero.game_controller = self    
-        self.avatars = []
-        self.rooks = []
-        self.monedas = []
-        self.economia = 0
-        self.game_over = False
-
-        
+        self.database = None
+        self._refresco_pendiente = False
+        self._sesion_cerrada = False
+        # Bitácora de la sesión (semilla + acciones) para poder reproducirla,
+        # junto a la partida guardada; se conservan las últimas MAX_REPETICIONES
+        self.bitacora = Bitacora(nueva_ruta(carpeta_usuario() / CARPETA_REPETICIONES))
+        self.motor = MotorJuego(
+            tablero.filas, tablero.columnas, observador=self, bitacora=self.bitacora
+        )
+        print(f"🎲 Semilla de la partida: {self.motor.semilla}")
 
-        # Timer del juego (1 tick por segundo)
+        # Timer del juego: cada disparo avanza el tiempo real transcurrido
+        self.bucle = BuclePasoFijo(self.motor)
+        # El cronómetro cuenta tiempo de juego, no tiempo de pared
+        self.tablero.cronometro.usar_fuente(self.motor.tiempo_juego)
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.tick)
-        self.timer.start(1000)  # 1 segundo por tick
-        self.niveles_progresivos = NivelManager(self) # se debe colocar acá
-        self.spawn_timer = QTimer()
-        self.spawn_timer.timeout.connect(self.niveles_progresivos.spawn_avatar)
-        self.coin_timer = QTimer()
-        self.coin_timer.timeout.connect(self.spawn_coin)
-        self.coin_timer.start(5000)
 
         # Niveles
-        self.niveles_progresivos.iniciar_nivel()
+        self.motor.iniciar()
 
-        # Persistencia
+        # Persistencia (archivo de partida en la carpeta del usuario)
+        self.guardado = Guardado()
         self.cargar_partida_si_corresponde()
+        self.autoguardado = Autoguardado(self.guardado)
 
         # Panel lateral
         self.actualizar_panel()
-
-        # Cargar partida si existe
-        self.actualizar_panel()
+        self.refrescar_si_pendiente()
+        self.programar_tick()
 
     # --------------------------------------------
-    # REGISTRO DE ENTIDADES
+    # ESTADO (delegado al motor)
     # --------------------------------------------
-    def agregar_avatar(self, avatar):
-        self.avatars.append(avatar)
-        self.tablero.actualizar_celda(avatar.fila, avatar.col, avatar.simbolo)
+    @property
+    def avatars(self):
+        return self.motor.avatars
+
+    @property
+    def rooks(self):
+        return self.motor.rooks
+
+    @property
+    def monedas(self):
+        return self.motor.monedas
 
-    def agregar_rook(self, rook):
-        self.rooks.append(rook)
-        self.tablero.actualizar_celda(rook.fila, rook.col, rook.simbolo)
+    @property
+    def economia(self):
+        return self.motor.economia
+
+    @property
+    def game_over(self):
+        return self.motor.game_over
+
+    @property
+    def niveles_progresivos(self):
+        return self.motor.niveles_progresivos
 
     # --------------------------------------------
     # TICK DEL JUEGO
     # --------------------------------------------
     def tick(self):
-        if self.game_over:
+        self.bucle.avanzar()
+        self.refrescar_si_pendiente()
+        self.tablero.actualizar_display_cronometro()
+        self.autoguardar()
+        self.programar_tick()
+
+    def programar_tick(self):
+        """
+        Arma el timer para el próximo evento del motor o el próximo
+        refresco del cronómetro, lo que llegue antes según la velocidad.
+        Con velocidad sin límite se avanza cada FRAME_MS.
+        """
+        if self._sesion_cerrada or self.bucle.pausado or self.motor.terminado():
             return
-
-        self.mover_avatars()
-        self.combate()
-        self.limpiar_muertos()
-        self.refrescar_tablero()
-        # Verificar si completó el nivel
-        if self.niveles_progresivos.oleada_actual >= self.niveles_progresivos.niveles[self.niveles_progresivos.nivel_actual]["oleadas"]:
-            if len(self.avatars) == 0:  # No quedan avatars
-                self.niveles_progresivos.completar_nivel()
-
-    # --------------------------------------------
-    # MOVIMIENTO DE AVATARS
-    # --------------------------------------------
-    def mover_avatars(self):
-        for avatar in self.avatars:
-
-            # Si un avatar llega a la fila roja → game over
-            if avatar.fila == 0:
-                self.game_over = True
-                self.tablero.actualizar_celda(0, 0, "💀GAME OVER💀")
-                self.timer.stop()
-                # ✅ Pausar cronómetro al perder
-                self.tablero.pausar_cronometro()
+        if self.bucle.velocidad is None:
+            espera = FRAME_MS
+        else:
+            espera = self.bucle.ms_hasta(self.motor.eventos.proximo())
+            if self.tablero.cronometro.corriendo():
+                refresco = 1000 / self.tablero.frecuencia_cronometro
+                espera = refresco if espera is None else min(espera, refresco)
+            if espera is None:
+                # Sin eventos pendientes ni cronómetro: nada que avanzar
                 return
+        self.timer.start(max(1, math.ceil(espera)))
 
-            # Movimiento si cooldown lo permite
-            if avatar.puede_mover(1):                
-                # Verificar si hay rook en la casilla hacia donde quiere avanzar
-                destino_fila = avatar.fila - 1
-                destino_col = avatar.col
-
-                hay_rook = any(
-                    r.fila == destino_fila and r.col == destino_col
-                    for r in self.rooks
-                )
-
-                if not hay_rook:
-                    # Mover
-                    avatar.fila -= 1
-
+    def autoguardar(self, forzar=False):
+        """Toma la foto del estado (barata) y la deja al hilo de autoguardado."""
+        if self.motor.terminado():
+            return
+        if forzar or self.autoguardado.toca():
+            self.autoguardado.solicitar(self.foto_estado())
+
+    def foto_estado(self):
+        """Estado del motor más el valor del cronómetro, listo para guardar."""
+        estado = self.motor.exportar_estado()
+        estado["cronometro"] = self.tablero.obtener_tiempo_cronometro()
+        return estado
+
+    def pausar_o_reanudar(self):
+        """Congela el reloj de juego (y el cronómetro) o lo retoma."""
+        if self.motor.terminado():
+            return
+        # En pausa el timer se detiene del todo: no hay nada que avanzar
+        if self.bucle.pausado:
+            self.bucle.reanudar()
+            self.tablero.iniciar_cronometro()
+            self.programar_tick()
+            print("▶️ Juego reanudado")
+        else:
+            self.timer.stop()
+            self.bucle.pausar()
+            self.tablero.pausar_cronometro()
+            self.autoguardar(forzar=True)
+            print("⏸️ Juego en pausa")
+
+    def cambiar_velocidad(self):
+        """Rota la velocidad del juego entre 1x, 2x, 8x y sin límite."""
+        velocidad = self.bucle.siguiente_velocidad()
+        print(f"⏩ Velocidad: {'sin límite' if velocidad is None else f'{velocidad}x'}")
+        # El próximo disparo depende de la velocidad
+        self.programar_tick()
 
     # --------------------------------------------
-    # COMBATE ENTRE AVATARS Y ROOKS
+    # EVENTOS DEL MOTOR
     # --------------------------------------------
-    def combate(self):
-        for avatar in self.avatars:
-            for rook in self.rooks:
+    def al_refrescar(self):
+        # Se agrupan todos los cambios del paso en un solo repintado
+        self._refresco_pendiente = True
 
-                # Mismo número de columna
-                if avatar.col == rook.col:
-
-                    # Si el avatar está justo delante del rook
-                    if avatar.fila == rook.fila + 1:
+    def al_cambiar_economia(self, economia):
+        self.actualizar_panel()
 
-                        # Avatar ataca
-                        if avatar.puede_atacar(1):
-                            rook.recibir_daño(avatar.ataque)
+    def al_iniciar_nivel(self, nombre, oleada, oleadas_totales, color):
+        self.tablero.mostrar_nivel(nombre, oleada, oleadas_totales, color)
+
+    def al_cambiar_oleada(self, oleada, oleadas_totales):
+        self.tablero.actualizar_oleada(oleada, oleadas_totales)
+
+    # Las pantallas que pintan sobre el tablero vacían antes el refresco
+    # pendiente para que no las tape en el mismo paso.
+    def al_transicion_nivel(self, nivel, nombre_nivel):
+        self.refrescar_si_pendiente()
+        self.tablero.mostrar_transicion_nivel(nivel, nombre_nivel)
+
+    # Una partida terminada no se retoma al volver a abrir el juego
+    def al_game_over(self):
+        self.autoguardado.marcar_salida(False)
+        self.refrescar_si_pendiente()
+        self.tablero.actualizar_celda(0, 0, "💀GAME OVER💀")
+        self.timer.stop()
+        # ✅ Pausar cronómetro al perder
+        self.tablero.pausar_cronometro()
 
-                        # Rook ataca
-                        if rook.puede_atacar(1):
-                            avatar.recibir_daño(rook.ataque)
-                            # Si el avatar muere → sumar economía
-                            if not avatar.esta_vivo():
-                                self.economia += 75
-                                print(f"Avatar derrotado. Economía = {self.economia}")
-                                self.actualizar_panel()
+    def al_victoria(self):
+        self.autoguardado.marcar_salida(False)
+        self.refrescar_si_pendiente()
+        self.timer.stop()
 
-                                # quitar del tablero y de la lista
-                                self.avatars.remove(avatar)
-                                break    # salir del loop de rooks para evitar errores
+        # Mostrar pantalla de victoria
+        self.tablero.mostrar_victoria()
 
-    # --------------------------------------------
-    # ELIMINAR ENTIDADES MUERTAS
-    # --------------------------------------------
-    def limpiar_muertos(self):
-        self.avatars = [a for a in self.avatars if a.esta_vivo()]
-        self.rooks = [r for r in self.rooks if r.esta_vivo()]
+        # Agregar al Hall of Fame
+        try:
+            from ventanas.hallOfFame import HallOfFameWindow
+            # Aquí necesitarías obtener el username del jugador
+            # Por ahora usaremos un placeholder
+            HallOfFameWindow.add_winner("Jugador")
+        except Exception as e:
+            print(f"⚠️ No se pudo agregar al Hall of Fame: {e}")
 
     # --------------------------------------------
     # ACTUALIZAR VISUAL DEL TABLERO
     # --------------------------------------------
     def refrescar_tablero(self):
-        # Limpiar todas las celdas menos la fila roja
-        for f in range(1, self.tablero.filas):
-            for c in range(self.tablero.columnas):
-                self.tablero.actualizar_celda(f, c, f"[{f},{c}]")
-
-        # Mostrar avatars
-        for avatar in self.avatars:
-            self.tablero.actualizar_celda(avatar.fila, avatar.col, avatar.simbolo)
+        self._refresco_pendiente = False
+        self.tablero.renderizar(self.motor.simbolos())
 
-        # Mostrar rooks
-        for rook in self.rooks:
-            self.tablero.actualizar_celda(rook.fila, rook.col, rook.simbolo)
-        for moneda in self.monedas:
-            self.tablero.actualizar_celda(moneda.fila, moneda.col, moneda.simbolo)
+    def refrescar_si_pendiente(self):
+        if self._refresco_pendiente:
+            self.refrescar_tablero()
 
     def colocar_rook(self, fila, col, tipo):
-        # Verificar colisiones
-        for r in self.rooks:
-            if r.fila == fila and r.col == col:
-                print("Ya hay una rook ahí.")
-                return
-
-        for a in self.avatars:
-            if a.fila == fila and a.col == col:
-                print("No se puede poner una rook encima de un avatar.")
-                return
-
-        for m in self.monedas:
-            if m.fila == fila and m.col == col:
-                print("No se puede poner una rook encima de una moneda.")
-                return
-
-        # Importar clases
-        from rooks import SandRook, RockRook, FireRook, WaterRook
-
-        # Seleccionar tipo
-        if tipo == 1:
-            nueva = SandRook(fila, col)
-        elif tipo == 2:
-            nueva = RockRook(fila, col)
-        elif tipo == 3:
-            nueva = FireRook(fila, col)
-        elif tipo == 4:
-            nueva = WaterRook(fila, col)
-        else:
-            print("Tipo inválido")
-            return
-        
-        if self.economia < nueva.costo:
-            print(f"No tienes suficiente economía. Necesitas {nueva.costo}, tienes {self.economia}.")
-            return
-
-        self.economia -= nueva.costo
-        print(f"Rook colocado. Economía restante: {self.economia}")
-        self.actualizar_panel()
-
-        # Añadir al juego
-        self.rooks.append(nueva)
-        self.tablero.actualizar_celda(fila, col, nueva.simbolo)
+        self.motor.colocar_rook(fila, col, tipo)
+        self.refrescar_si_pendiente()
 
     def spawn_avatar(self):
         # Manejado por NivelManager
@@ -245,183 +262,93 @@ class GameController:
 
     # Persistencia
     def cargar_partida_si_corresponde(self):
-        meta_file = "savegame_meta.json"
-        save_file = "savegame.json"
-    
-        if not os.path.exists(meta_file) or not os.path.exists(save_file):
+        partida = self.guardado.cargar()
+        if partida is None:
             return
-    
-        with open(meta_file, "r") as f:
-            meta = json.load(f)
-    
+
         # Si la última salida fue segura → cargar partida
-        if meta.get("safe_exit", False):
+        if partida.get("salida_segura", False):
             print("Cargando partida previa...")
-            self.cargar_partida()
-    
-        # IMPORTANTE: aquí marcamos automáticamente como salida NO segura
-        # a menos que el usuario cierre con Escape.
-        with open(meta_file, "w") as f:
-            json.dump({"safe_exit": False}, f)
-
-    def cargar_partida(self, archivo="savegame.json"):
-        print(f"DEBUG: iniciar carga desde {archivo}")
-        if not os.path.exists(archivo):
-            print("DEBUG: archivo de guardado no existe.")
-            return
-
-        with open(archivo, "r") as f:
-            try:
-                datos = json.load(f)
-            except Exception as e:
-                print("ERROR leyendo savegame:", e)
+            self.cargar_partida(partida)
+
+            # IMPORTANTE: aquí marcamos automáticamente como salida NO segura
+            # a menos que el usuario cierre con Escape. Los autoguardados la
+            # vuelven a marcar mientras la partida sigue, para retomarla si
+            # el juego se cierra de golpe.
+            self.guardado.marcar_salida(False)
+
+    def cargar_partida(self, partida=None):
+        if partida is None:
+            print(f"DEBUG: iniciar carga desde {self.guardado.ruta}")
+            partida = self.guardado.cargar()
+            if partida is None:
+                print("DEBUG: no hay partida guardada.")
                 return
+        datos = partida["estado"]
 
-        # LIMPIAR ESTADO
+        # Una partida de otro tamaño de tablero no se puede restaurar aquí
+        tamaño = (datos.get("filas", 9), datos.get("columnas", 5))
+        if tamaño != (self.motor.filas, self.motor.columnas):
+            print(f"WARN: la partida guardada es de {tamaño[0]}x{tamaño[1]}; se omite la carga.")
+            return
+
+        # LIMPIAR TABLERO
         print("DEBUG: limpiando estado actual y tablero...")
-        self.avatars = []
-        self.rooks = []
         try:
             self.tablero.limpiar_tablero()
         except Exception as e:
             print("WARN: tablero no tiene limpiar_tablero() o falló:", e)
 
-        # RESTAURAR economía
-        self.economia = datos.get("economia", 0)
-
-        # RESTAURAR NIVEL Y OLEADA
-        self.niveles_progresivos.nivel_actual = datos.get("nivel_actual", 1)
-        self.niveles_progresivos.oleada_actual = datos.get("oleada_actual", 1)
-        self.tablero.mostrar_nivel(
-            self.niveles_progresivos.niveles[self.niveles_progresivos.nivel_actual]["nombre"],
-            self.niveles_progresivos.oleada_actual,
-            self.niveles_progresivos.niveles[self.niveles_progresivos.nivel_actual]["oleadas"],
-            self.niveles_progresivos.niveles[self.niveles_progresivos.nivel_actual]["color"]
-        )
-
-        # RECONSTRUIR AVATARS
-        from avatars import Flechador, Escudero, Leñador, Canibal
-        mapa_clases_avatars = {
-            "Flechador": Flechador,
-            "Escudero": Escudero,
-            "Leñador": Leñador,
-            "Canibal": Canibal
-        }
-
-        for a in datos.get("avatars", []):
-            tipo = a.get("tipo")
-            print("DEBUG: cargar avatar:", a)
-            clase = mapa_clases_avatars.get(tipo)
-            if clase:
-                nuevo = clase(a["fila"], a["col"])
-                if "vida" in a:
-                    nuevo.vida = a["vida"]
-                self.avatars.append(nuevo)
-                self.tablero.actualizar_celda(nuevo.fila, nuevo.col, nuevo.simbolo)
-            else:
-                print(f"WARN: tipo avatar desconocido '{tipo}' - se omite")
-
-        # RECONSTRUIR ROOKS
-        from rooks import SandRook, RockRook, FireRook, WaterRook
-        mapa_clases_rooks = {
-            "SandRook": SandRook,
-            "RockRook": RockRook,
-            "FireRook": FireRook,
-            "WaterRook": WaterRook
-        }
-
-        for r in datos.get("rooks", []):
-            tipo = r.get("tipo")
-            print("DEBUG: cargar rook:", r)
-            clase = mapa_clases_rooks.get(tipo)
-            if clase:
-                nuevo = clase(r["fila"], r["col"])
-                if "vida" in r:
-                    nuevo.vida = r["vida"]
-                self.rooks.append(nuevo)
-                self.tablero.actualizar_celda(nuevo.fila, nuevo.col, nuevo.simbolo)
-            else:
-                print(f"WARN: tipo rook desconocido '{tipo}' - se omite")
-
-        # RESTAURAR FLAGS
-        self.game_over = datos.get("game_over", False)
-
-        # REFRESCAR TABLERO (asegura que todo lo pintado quede consistente)
-        try:
-            self.refrescar_tablero()
-        except Exception as e:
-            print("WARN: refrescar_tablero falló:", e)
-
-        print("DEBUG: carga completada. Avatars:", len(self.avatars), "Rooks:", len(self.rooks))
+        # RESTAURAR estado en el motor (avisa al tablero por eventos)
+        self.motor.restaurar_estado(datos)
+        if "cronometro" in datos:
+            self.tablero.cronometro.fijar(datos["cronometro"])
+            self.tablero.actualizar_display_cronometro(forzar=True)
+        self.refrescar_si_pendiente()
         self.actualizar_panel() 
+        # Los eventos pendientes cambiaron con la partida cargada
+        self.programar_tick()
 
-    def guardar_partida(self, archivo="savegame.json"):
+    def guardar_partida(self):
         print("DEBUG: iniciar guardado...")
+        # Que ningún autoguardado pendiente pise este guardado
+        self.autoguardado.cerrar()
 
-        datos = {
-            "economia": self.economia,
-            "nivel_actual": self.niveles_progresivos.nivel_actual,
-            "oleada_actual": self.niveles_progresivos.oleada_actual,
-            "game_over": self.game_over,
-            "avatars": [],
-            "rooks": [],
-            "monedas": []
-        }
-
-        # --- AVATARS ---
-        for a in self.avatars:
-            datos["avatars"].append({
-                "tipo": type(a).__name__,
-                "fila": a.fila,
-                "col": a.col,
-                "vida": a.vida
-            })
-
-        # --- ROOKS ---
-        for r in self.rooks:
-            datos["rooks"].append({
-                "tipo": type(r).__name__,
-                "fila": r.fila,
-                "col": r.col,
-                "vida": r.vida
-            })
-
-        # --- MONEDAS ---
-        for m in self.monedas:
-            datos["monedas"].append({
-                "fila": m.fila,
-                "col": m.col,
-                "valor": m.valor
-            })
-
-        # Guardar archivo
-        with open(archivo, "w") as f:
-            json.dump(datos, f, indent=4)
-        print(f"DEBUG: guardado en {archivo}")
-
-        # meta
-        with open("savegame_meta.json", "w") as f:
-            json.dump({"safe_exit": True}, f)
+        # Estado y marca de salida segura van juntos en una escritura atómica
+        self.guardado.guardar(self.foto_estado(), salida_segura=True)
+        print(f"DEBUG: guardado en {self.guardado.ruta}")
 
         print("Partida guardada. Cerrando juego...")
         self.salir_del_juego(called_from_save=True)
 
-    def salir_del_juego(self, called_from_save=False):
-        meta_file = "savegame_meta.json"
-        # Si venimos de guardar (called_from_save=True) no sobreescribimos la meta
+    def cerrar_sesion(self, called_from_save=False):
+        """
+        Deja la sesión cerrada: sin autoguardados pendientes, con la marca
+        de salida al día y la bitácora cerrada. Se puede llamar más de una
+        vez (Escape y después el cierre de la ventana).
+        """
+        if self._sesion_cerrada:
+            return
+        self._sesion_cerrada = True
+        self.timer.stop()
+        self.autoguardado.cerrar()
+        # Si venimos de guardar (called_from_save=True) no tocamos la marca
         if called_from_save:
-            print("DEBUG: salir_del_juego() llamado desde guardar -> NO tocar meta")
+            print("DEBUG: salir_del_juego() llamado desde guardar -> NO tocar la marca")
         else:
-            # escribir load_on_start = False porque cerramos normalmente
-            print("DEBUG: marcar meta load_on_start=False por cierre normal")
-            meta = {"load_on_start": False}
-            with open(meta_file, "w") as f:
-                json.dump(meta, f)
+            # cierre normal: la partida guardada no se carga al iniciar
+            print("DEBUG: marcar salida_segura=False por cierre normal")
+            self.guardado.marcar_salida(False)
+
+        self.bitacora.cerrar()
 
         # ✅ Cerrar conexión con MongoDB
         if self.database:
             self.database.cerrar_conexion()
 
+    def salir_del_juego(self, called_from_save=False):
+        self.cerrar_sesion(called_from_save)
+
         # Cerrar la aplicación (PySide)
         print("DEBUG: sys.exit()")
         import sys
@@ -429,51 +356,12 @@ class GameController:
 
     # monedas
     def spawn_coin(self):
-        import random
-        from moneda import Moneda
-
-        # Obtener posiciones libres
-        libres = []
-        for f in range(self.tablero.filas):
-            for c in range(self.tablero.columnas):
-                # No puede existir avatar, rook ni moneda en esa celda
-                ocupado_avatar = any(a.fila == f and a.col == c for a in self.avatars)
-                ocupado_rook = any(r.fila == f and r.col == c for r in self.rooks)
-                ocupado_moneda = any(m.fila == f and m.col == c for m in self.monedas)
-
-                if not (ocupado_avatar or ocupado_rook or ocupado_moneda):
-                    libres.append((f, c))
-
-        if not libres:
-            print("No hay espacio para monedas.")
-            return
-
-        fila, col = random.choice(libres)
-        nueva = Moneda(fila, col)
-        self.monedas.append(nueva)
-
-        # Pintar en tablero
-        self.tablero.actualizar_celda(fila, col, nueva.simbolo)
-        print(f"Spawn MONEDA en ({fila}, {col}) valor={nueva.valor}")
+        self.motor.spawn_coin()
+        self.refrescar_si_pendiente()
         
     def recoger_moneda_en(self, fila, col):
-        for m in self.monedas:
-            if m.fila == fila and m.col == col:
-                print(f"Moneda recogida en ({fila},{col}) +{m.valor}")
-
-                # Sumar a economía
-                self.economia += m.valor
-                print(f"Economía total: {self.economia}")
-                self.actualizar_panel()
-
-                # Borrar visualmente
-                self.tablero.actualizar_celda(fila, col, f"[{fila},{col}]")
-
-                # Quitar de la lista
-                self.monedas.remove(m)
-                return  # Solo puede haber una moneda en esa celda
-
-        print("No hay moneda en esta celda.")
+        self.motor.recoger_moneda_en(fila, col)
+        self.refrescar_si_pendiente()
 
     # Panel lateral
     def actualizar_panel(self):
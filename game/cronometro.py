@@ -1,35 +1,71 @@
 import time
 
+# Reloj monótono y de alta resolución (no salta con NTP ni con cambios de
+# hora). Lo comparten el cronómetro, el bucle del juego y los benchmarks.
+reloj = time.perf_counter
+
+
 class Cronometro:
-    def __init__(self):
+    """
+    Tiempo acumulado con pausas.
+
+    Por defecto mide tiempo real con `reloj`. Si se le da una `fuente`
+    (función que devuelve segundos, p. ej. MotorJuego.tiempo_juego) mide
+    tiempo de juego de la simulación: exacto y reproducible en las
+    repeticiones, y sin contar pausas ni atrasos de la máquina.
+    """
+
+    def __init__(self, fuente=None):
+        self._fuente = fuente or reloj
         self._inicio = None
         self._acumulado = 0
         self._corriendo = False
 
     def iniciar(self):
         if not self._corriendo:
-            self._inicio = time.time()
+            self._inicio = self._fuente()
             self._corriendo = True
 
     def pausar(self):
         if self._corriendo:
-            self._acumulado += time.time() - self._inicio
+            self._acumulado += self._fuente() - self._inicio
             self._corriendo = False
 
+    def usar_fuente(self, fuente=None):
+        """Cambia la fuente de tiempo conservando lo ya acumulado."""
+        corriendo = self._corriendo
+        self.pausar()
+        self._fuente = fuente or reloj
+        if corriendo:
+            self.iniciar()
+
+    def fijar(self, segundos):
+        """Pone el tiempo acumulado en `segundos` (al cargar una partida)."""
+        self._acumulado = segundos
+        if self._corriendo:
+            self._inicio = self._fuente()
+
     def reiniciar(self):
         self._inicio = None
         self._acumulado = 0
         self._corriendo = False
 
+    def corriendo(self):
+        return self._corriendo
+
     def tiempo(self):
         """Devuelve tiempo en segundos (float)."""
         if self._corriendo:
-            return self._acumulado + (time.time() - self._inicio)
+            return self._acumulado + (self._fuente() - self._inicio)
         return self._acumulado
 
-    def tiempo_formateado(self):
-        t = self.tiempo()
+    def tiempo_formateado(self, t=None, decimales=3):
+        """mm:ss.mmm del tiempo actual (o de t) con 0 a 3 decimales."""
+        if t is None:
+            t = self.tiempo()
         minutos = int(t // 60)
         segundos = int(t % 60)
-        milis   = int((t * 1000) % 1000)
-        return f"{minutos:02d}:{segundos:02d}.{milis:03d}"
+        if decimales <= 0:
+            return f"{minutos:02d}:{segundos:02d}"
+        fraccion = int((t % 1) * 10 ** decimales)
+        return f"{minutos:02d}:{segundos:02d}.{fraccion:0{decimales}d}"
@@ -0,0 +1,69 @@
+import heapq
+
+
+# Eventos del motor. Si varios caen en el mismo milisegundo se disparan
+# en este orden.
+TICK = "tick"
+SPAWN = "spawn"
+MONEDA = "moneda"
+TRANSICION = "transicion"
+PRIORIDAD = {TICK: 0, SPAWN: 1, MONEDA: 2, TRANSICION: 3}
+
+
+class PlanificadorEventos:
+    """
+    Cola de prioridad (heapq) de eventos del motor ordenada por tiempo de juego.
+
+    Hay como mucho un evento pendiente por tipo: programar un tipo que ya
+    estaba pendiente lo reemplaza. Las cancelaciones son perezosas (la
+    entrada vieja queda en el heap y se descarta al llegar a la cima).
+    """
+
+    def __init__(self):
+        self.limpiar()
+
+    def limpiar(self):
+        self._cola = []        # [tiempo_ms, prioridad, secuencia, tipo]
+        self._vigentes = {}    # tipo -> entrada de la cola
+        self._secuencia = 0
+
+    def programar(self, tipo, tiempo_ms):
+        entrada = [tiempo_ms, PRIORIDAD[tipo], self._secuencia, tipo]
+        self._secuencia += 1
+        self._vigentes[tipo] = entrada
+        heapq.heappush(self._cola, entrada)
+
+    def cancelar(self, tipo):
+        self._vigentes.pop(tipo, None)
+
+    def pendiente(self, tipo):
+        """Instante en que se disparará `tipo`, o None si no está programado."""
+        entrada = self._vigentes.get(tipo)
+        return entrada[0] if entrada is not None else None
+
+    def proximo(self):
+        """Instante del siguiente evento vigente, o None si no hay ninguno."""
+        cola = self._cola
+        while cola and self._vigentes.get(cola[0][3]) is not cola[0]:
+            heapq.heappop(cola)
+        return cola[0][0] if cola else None
+
+    def extraer(self):
+        """Saca el siguiente evento vigente y devuelve su tipo."""
+        if self.proximo() is None:
+            return None
+        tipo = heapq.heappop(self._cola)[3]
+        del self._vigentes[tipo]
+        return tipo
+
+    # --------------------------------------------
+    # PERSISTENCIA
+    # --------------------------------------------
+    def exportar(self, ahora_ms):
+        """{tipo: ms que faltan} de los eventos pendientes."""
+        return {tipo: entrada[0] - ahora_ms for tipo, entrada in self._vigentes.items()}
+
+    def restaurar(self, pendientes, ahora_ms):
+        self.limpiar()
+        for tipo in sorted(pendientes, key=PRIORIDAD.get):
+            self.programar(tipo, ahora_ms + pendientes[tipo])
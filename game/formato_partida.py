@@ -0,0 +1,226 @@
+import math
+import struct
+import zlib
+from eventos import PRIORIDAD
+
+
+# --------------------------------------------
+# FORMATO BINARIO DE PARTIDA
+# --------------------------------------------
+# Todo en little-endian.
+#
+#   Cabecera    "AVRP", versión u16, banderas u8, guardado_en f64
+#   Cuerpo      (comprimido con zlib si la bandera COMPRIMIDO está activa)
+#     general   filas u16, columnas u16, economía i32, nivel u8, oleada u16,
+#               banderas u8, tiempo_ms i64, resto_ms f64,
+#               spawn_interval i32 (-1 = sin spawns), cronómetro f64 (NaN = no hay)
+#     eventos   n u8, n × (tipo u8 = PRIORIDAD[tipo], ms que faltan i64)
+#     rng       presente u8 [versión u8, 625 × u32, tiene_gauss u8, gauss f64]
+#     nombres   n u8, n × (largo u8, utf-8): tabla de tipos de unidad
+#     avatars   n u32, n × (tipo u8, fila u16, col u16, vida i32, desde_avance i32, desde_ataque i32)
+#     rooks     n u32, n × (tipo u8, fila u16, col u16, vida i32, desde_ataque i32)
+#     monedas   n u32, n × (fila u16, col u16, valor i32)
+#
+# Los tipos de unidad van por índice a la tabla de nombres del propio
+# archivo, así que agregar una unidad nueva no obliga a cambiar de versión.
+# Los cooldowns son segundos enteros (el motor avanza de a un tick).
+
+MAGIA = b"AVRP"
+VERSION = 2          # la versión 1 es el JSON de Guardado
+
+SALIDA_SEGURA = 0x01
+COMPRIMIDO = 0x02
+
+CABECERA = struct.Struct("<4sHBd")
+GENERAL = struct.Struct("<HHiBHBqdid")
+EVENTO = struct.Struct("<Bq")
+RNG = struct.Struct("<B625IBd")
+AVATAR = struct.Struct("<BHHiii")
+ROOK = struct.Struct("<BHHii")
+MONEDA = struct.Struct("<HHi")
+U8 = struct.Struct("<B")
+U32 = struct.Struct("<I")
+
+GAME_OVER = 0x01
+VICTORIA = 0x02
+
+TIPOS_EVENTO = {codigo: tipo for tipo, codigo in PRIORIDAD.items()}
+
+
+class FormatoInvalido(ValueError):
+    """El contenido no es una partida binaria legible."""
+
+
+def es_binario(contenido):
+    return contenido[:len(MAGIA)] == MAGIA
+
+
+def codificar(estado, salida_segura=False, guardado_en=0.0, comprimir=True):
+    """Empaqueta un dict de MotorJuego.exportar_estado() en bytes."""
+    cuerpo = _codificar_estado(estado)
+    banderas = SALIDA_SEGURA if salida_segura else 0
+    if comprimir:
+        cuerpo = zlib.compress(cuerpo, 6)
+        banderas |= COMPRIMIDO
+    return CABECERA.pack(MAGIA, VERSION, banderas, guardado_en) + cuerpo
+
+
+def decodificar_cabecera(contenido):
+    """Devuelve {version, salida_segura, guardado_en} sin leer el cuerpo."""
+    if len(contenido) < CABECERA.size or not es_binario(contenido):
+        raise FormatoInvalido("no es una partida binaria")
+    _, version, banderas, guardado_en = CABECERA.unpack_from(contenido)
+    if version != VERSION:
+        raise FormatoInvalido(f"versión de partida no soportada: {version}")
+    return {
+        "version": version,
+        "salida_segura": bool(banderas & SALIDA_SEGURA),
+        "guardado_en": guardado_en,
+        "comprimido": bool(banderas & COMPRIMIDO)
+    }
+
+
+def decodificar(contenido):
+    """Devuelve {version, salida_segura, guardado_en, estado} de los bytes."""
+    partida = decodificar_cabecera(contenido)
+    cuerpo = memoryview(contenido)[CABECERA.size:]
+    try:
+        if partida.pop("comprimido"):
+            cuerpo = zlib.decompress(cuerpo)
+        partida["estado"] = _decodificar_estado(cuerpo)
+    except (zlib.error, struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+        raise FormatoInvalido(f"partida dañada: {e}") from e
+    return partida
+
+
+def con_salida_segura(contenido, salida_segura):
+    """Los mismos bytes con la marca salida_segura cambiada (sin decodificar)."""
+    decodificar_cabecera(contenido)
+    magia, version, banderas, guardado_en = CABECERA.unpack_from(contenido)
+    banderas = (banderas | SALIDA_SEGURA) if salida_segura else (banderas & ~SALIDA_SEGURA)
+    return CABECERA.pack(magia, version, banderas, guardado_en) + contenido[CABECERA.size:]
+
+
+# --------------------------------------------
+# CUERPO
+# --------------------------------------------
+def _codificar_estado(estado):
+    partes = []
+    banderas = (GAME_OVER if estado.get("game_over") else 0) | (VICTORIA if estado.get("victoria") else 0)
+    spawn_interval = estado.get("spawn_interval")
+    cronometro = estado.get("cronometro")
+    partes.append(GENERAL.pack(
+        # Las partidas del formato anterior no guardaban el tamaño: eran de 9x5
+        estado.get("filas", 9), estado.get("columnas", 5), estado.get("economia", 0),
+        estado.get("nivel_actual", 1), estado.get("oleada_actual", 0), banderas,
+        estado.get("tiempo_ms", 0), estado.get("resto_ms", 0.0),
+        -1 if spawn_interval is None else spawn_interval,
+        math.nan if cronometro is None else cronometro
+    ))
+
+    eventos = estado.get("eventos", {})
+    partes.append(U8.pack(len(eventos)))
+    for tipo, restante in eventos.items():
+        partes.append(EVENTO.pack(PRIORIDAD[tipo], restante))
+
+    rng = estado.get("rng")
+    if rng is None:
+        partes.append(U8.pack(0))
+    else:
+        version, interno, gauss = rng
+        partes.append(U8.pack(1))
+        partes.append(RNG.pack(version, *interno, gauss is not None, gauss or 0.0))
+
+    avatars = estado.get("avatars", [])
+    rooks = estado.get("rooks", [])
+    nombres = {}
+    for entidad in avatars + rooks:
+        nombres.setdefault(entidad["tipo"], len(nombres))
+    partes.append(U8.pack(len(nombres)))
+    for nombre in nombres:
+        codificado = nombre.encode("utf-8")
+        partes.append(U8.pack(len(codificado)) + codificado)
+
+    partes.append(U32.pack(len(avatars)))
+    partes.extend(
+        AVATAR.pack(nombres[a["tipo"]], a["fila"], a["col"], a["vida"],
+                    a.get("tiempo_desde_avance", 0), a.get("tiempo_desde_ataque", 0))
+        for a in avatars
+    )
+    partes.append(U32.pack(len(rooks)))
+    partes.extend(
+        ROOK.pack(nombres[r["tipo"]], r["fila"], r["col"], r["vida"], r.get("tiempo_desde_ataque", 0))
+        for r in rooks
+    )
+    monedas = estado.get("monedas", [])
+    partes.append(U32.pack(len(monedas)))
+    partes.extend(MONEDA.pack(m["fila"], m["col"], m["valor"]) for m in monedas)
+    return b"".join(partes)
+
+
+def _decodificar_estado(cuerpo):
+    (filas, columnas, economia, nivel, oleada, banderas, tiempo_ms, resto_ms,
+     spawn_interval, cronometro) = GENERAL.unpack_from(cuerpo)
+    pos = GENERAL.size
+    estado = {
+        "filas": filas,
+        "columnas": columnas,
+        "economia": economia,
+        "nivel_actual": nivel,
+        "oleada_actual": oleada,
+        "game_over": bool(banderas & GAME_OVER),
+        "victoria": bool(banderas & VICTORIA),
+        "tiempo_ms": tiempo_ms,
+        "resto_ms": resto_ms,
+        "spawn_interval": None if spawn_interval < 0 else spawn_interval
+    }
+    if not math.isnan(cronometro):
+        estado["cronometro"] = cronometro
+
+    n = cuerpo[pos]
+    pos += 1
+    eventos = {}
+    for codigo, restante in EVENTO.iter_unpack(cuerpo[pos:pos + n * EVENTO.size]):
+        eventos[TIPOS_EVENTO[codigo]] = restante
+    pos += n * EVENTO.size
+    estado["eventos"] = eventos
+
+    pos += 1
+    if cuerpo[pos - 1]:
+        valores = RNG.unpack_from(cuerpo, pos)
+        pos += RNG.size
+        gauss = valores[627] if valores[626] else None
+        estado["rng"] = (valores[0], valores[1:626], gauss)
+
+    n = cuerpo[pos]
+    pos += 1
+    nombres = []
+    for _ in range(n):
+        largo = cuerpo[pos]
+        nombres.append(bytes(cuerpo[pos + 1:pos + 1 + largo]).decode("utf-8"))
+        pos += 1 + largo
+
+    (n,) = U32.unpack_from(cuerpo, pos)
+    pos += U32.size
+    estado["avatars"] = [
+        {"tipo": nombres[t], "fila": f, "col": c, "vida": v,
+         "tiempo_desde_avance": avance, "tiempo_desde_ataque": ataque}
+        for t, f, c, v, avance, ataque in AVATAR.iter_unpack(cuerpo[pos:pos + n * AVATAR.size])
+    ]
+    pos += n * AVATAR.size
+
+    (n,) = U32.unpack_from(cuerpo, pos)
+    pos += U32.size
+    estado["rooks"] = [
+        {"tipo": nombres[t], "fila": f, "col": c, "vida": v, "tiempo_desde_ataque": ataque}
+        for t, f, c, v, ataque in ROOK.iter_unpack(cuerpo[pos:pos + n * ROOK.size])
+    ]
+    pos += n * ROOK.size
+
+    (n,) = U32.unpack_from(cuerpo, pos)
+    pos += U32.size
+    estado["monedas"] = [
+        {"fila": f, "col": c, "valor": v}
+        for f, c, v in MONEDA.iter_unpack(cuerpo[pos:pos + n * MONEDA.size])
+    ]
+    return estado
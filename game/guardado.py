@@ -0,0 +1,164 @@
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+import formato_partida
+from formato_partida import FormatoInvalido
+
+
+NOMBRE_APP = "AvatarsVsRooks"
+ARCHIVO_PARTIDA = "partida.avr"
+
+# Versión 1: el mismo contenido en JSON, en la carpeta del usuario
+ARCHIVO_JSON = "savegame.json"
+VERSION_JSON = 1
+
+# Formato anterior: dos archivos en el directorio de trabajo
+ARCHIVO_LEGADO = "savegame.json"
+META_LEGADO = "savegame_meta.json"
+
+
+def carpeta_usuario():
+    """
+    Carpeta de datos del usuario para el juego.
+
+    Se puede forzar con la variable de entorno AVR_DATOS (útil en pruebas
+    y benchmarks); si no, se usa la ubicación estándar de cada sistema.
+    """
+    forzada = os.environ.get("AVR_DATOS")
+    if forzada:
+        return Path(forzada)
+    if os.name == "nt":
+        base = os.environ.get("APPDATA") or Path.home() / "AppData" / "Roaming"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Application Support"
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / NOMBRE_APP
+
+
+def escribir_atomico(ruta, contenido):
+    """
+    Escribe bytes en `ruta` sin dejarla nunca a medio escribir.
+
+    Se escribe un temporal en la misma carpeta, se fuerza a disco con
+    fsync y se renombra encima del archivo final con os.replace (atómico
+    en el mismo sistema de archivos). Si algo falla, el archivo anterior
+    queda intacto.
+    """
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    fd, temporal = tempfile.mkstemp(prefix=f".{ruta.name}.", suffix=".tmp", dir=ruta.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.unlink(temporal)
+        except OSError:
+            pass
+        raise
+
+    # Que el renombrado también sobreviva a un corte de luz
+    if os.name != "nt":
+        carpeta = os.open(ruta.parent, os.O_RDONLY)
+        try:
+            os.fsync(carpeta)
+        finally:
+            os.close(carpeta)
+
+
+class Guardado:
+    """
+    Partida guardada del jugador.
+
+    Un único archivo binario en la carpeta del usuario (ver
+    formato_partida) con el estado del motor y la marca salida_segura
+    (antes iba en savegame_meta.json). Todas las escrituras son atómicas,
+    así que un cierre inesperado deja la partida anterior o la nueva,
+    nunca un archivo corrupto.
+
+    Las partidas de formatos anteriores (JSON) se siguen leyendo; al
+    guardar de nuevo quedan en el formato actual.
+    """
+
+    VERSION = formato_partida.VERSION
+
+    def __init__(self, carpeta=None):
+        self.carpeta = Path(carpeta) if carpeta is not None else carpeta_usuario()
+        self.ruta = self.carpeta / ARCHIVO_PARTIDA
+        self.ruta_json = self.carpeta / ARCHIVO_JSON
+
+    def guardar(self, estado, salida_segura=False):
+        contenido = formato_partida.codificar(estado, salida_segura, time.time())
+        escribir_atomico(self.ruta, contenido)
+
+    def cargar(self):
+        """Devuelve la partida guardada ({salida_segura, estado, ...}) o None."""
+        if not self.ruta.exists():
+            return self._cargar_json()
+        try:
+            return formato_partida.decodificar(self.ruta.read_bytes())
+        except (OSError, FormatoInvalido) as e:
+            print(f"ERROR leyendo partida guardada {self.ruta}: {e}")
+            return None
+
+    def marcar_salida(self, salida_segura):
+        """Actualiza la marca salida_segura de la partida existente."""
+        if self.ruta.exists():
+            # Solo cambia un bit de la cabecera: no hace falta decodificar
+            try:
+                contenido = self.ruta.read_bytes()
+                if formato_partida.decodificar_cabecera(contenido)["salida_segura"] == salida_segura:
+                    return
+            except (OSError, FormatoInvalido) as e:
+                print(f"ERROR leyendo partida guardada {self.ruta}: {e}")
+                return
+            escribir_atomico(self.ruta, formato_partida.con_salida_segura(contenido, salida_segura))
+            return
+
+        partida = self.cargar()
+        if partida is None or partida.get("salida_segura") == salida_segura:
+            return
+        self.guardar(partida["estado"], salida_segura)
+
+    def _cargar_json(self):
+        """Partida de la versión 1 (JSON en la carpeta del usuario), si hay."""
+        if not self.ruta_json.exists():
+            return self._cargar_legado()
+        try:
+            with open(self.ruta_json, "r", encoding="utf-8") as f:
+                partida = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"ERROR leyendo partida guardada {self.ruta_json}: {e}")
+            return None
+        if partida.get("version") != VERSION_JSON:
+            print(f"WARN: versión de partida no soportada: {partida.get('version')}")
+            return None
+        return partida
+
+    def _cargar_legado(self, carpeta="."):
+        """
+        Lee savegame.json + savegame_meta.json del directorio de trabajo
+        (formato anterior). No los borra; al guardar de nuevo se usa la
+        carpeta del usuario.
+        """
+        archivo = Path(carpeta) / ARCHIVO_LEGADO
+        meta = Path(carpeta) / META_LEGADO
+        if not archivo.exists() or not meta.exists() or archivo.resolve() == self.ruta_json.resolve():
+            return None
+        try:
+            with open(archivo, "r") as f:
+                estado = json.load(f)
+            with open(meta, "r") as f:
+                salida_segura = json.load(f).get("safe_exit", False)
+        except (OSError, ValueError) as e:
+            print(f"ERROR leyendo savegame anterior: {e}")
+            return None
+        print(f"Partida del formato anterior encontrada en {archivo.resolve()}")
+        return {"version": 0, "salida_segura": salida_segura, "estado": estado}
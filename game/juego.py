@@ -1,3 +1,4 @@
+import argparse
 import sys
 from PySide6.QtWidgets import QApplication
 from tablero import Tablero
@@ -8,14 +9,26 @@ from rooks import SandRook, RockRook, FireRook, WaterRook
 
 
 def main():
-    app = QApplication(sys.argv)
-
-    tablero = Tablero()
+    parser = argparse.ArgumentParser(description="Avatars VS Rooks")
+    parser.add_argument("--filas", type=int, default=9)
+    parser.add_argument("--columnas", type=int, default=5)
+    parser.add_argument("--cronometro-hz", type=int, default=10,
+                        help="refrescos por segundo del cronómetro en pantalla")
+    parser.add_argument("--emoji", action="store_true",
+                        help="dibujar las unidades con emoji en vez de imágenes")
+    args, resto = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + resto)
+
+    tablero = Tablero(args.filas, args.columnas, sprites=not args.emoji,
+                      frecuencia_cronometro=args.cronometro_hz)
     tablero.show()
 
     game = GameController(tablero)
     
     tablero.iniciar_cronometro()
+    # Con el cronómetro corriendo el timer también se arma para refrescarlo
+    game.programar_tick()
 
 
 
@@ -0,0 +1,127 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRectF, QLineF
+from PySide6.QtGui import QPainter, QColor, QFont, QPen
+
+
+# Mismos colores que ESTILO_MATRIZ: (fondo, texto, borde)
+COLORES_ESTADO = {
+    "normal": ("#1c1c1c", "#6b8e23", "#3d3d3d"),
+    "ocupada": ("#242424", "#e0e0e0", "#4a4a4a"),
+    "roja": ("#940901", "#630601", "#630601"),
+    "seleccionada": ("#3a2a2a", "#ffcc00", "#ffcc00")
+}
+COLOR_FONDO = "#2d2d2d"
+TAM_MINIMO = 200   # píxeles del lienzo como mínimo (todo el tablero)
+FUENTE_MINIMA = 4   # píxeles del texto como mínimo
+MAX_CELDAS_SUCIAS = 256   # más cambios por frame -> se repinta todo
+
+
+class LienzoTablero(QWidget):
+    """
+    Matriz del tablero dibujada por un solo widget.
+
+    Para tableros grandes (p. ej. 200x40) reemplaza a los QLabel por celda:
+    lee textos y estados del Tablero, y cada cambio solo invalida el
+    rectángulo de su celda, así paintEvent redibuja únicamente esa zona.
+    Las celdas se estiran o se achican para llenar el widget, así el
+    tablero entero entra en la ventana sin importar cuántas filas tenga.
+    Si el tablero tiene atlas de sprites, las unidades se dibujan con sus
+    imágenes.
+    """
+
+    def __init__(self, tablero):
+        super().__init__()
+        self.tablero = tablero
+        # Sin mínimo por celda: con 200 filas pediría más alto que la pantalla
+        self.setMinimumSize(TAM_MINIMO, TAM_MINIMO)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        self._fondo = QColor(COLOR_FONDO)
+        self._colores = {
+            estado: tuple(QColor(color) for color in colores)
+            for estado, colores in COLORES_ESTADO.items()
+        }
+        self._fuente = QFont("Courier")
+        self._fuente.setBold(True)
+        self._sucias = 0
+
+    def _tam_celda(self):
+        return self.width() / self.tablero.columnas, self.height() / self.tablero.filas
+
+    def rect_celda(self, fila, col):
+        ancho, alto = self._tam_celda()
+        return QRectF(col * ancho, fila * alto, ancho, alto)
+
+    def actualizar_celda(self, fila, col):
+        """Programa el repintado de una sola celda."""
+        self._sucias += 1
+        if self._sucias < MAX_CELDAS_SUCIAS:
+            self.update(self.rect_celda(fila, col).toAlignedRect())
+        elif self._sucias == MAX_CELDAS_SUCIAS:
+            # Pantallas completas (transición, victoria): un solo rectángulo
+            self.update()
+
+    def resizeEvent(self, event):
+        ancho, alto = self._tam_celda()
+        self._fuente.setPixelSize(max(FUENTE_MINIMA, int(min(ancho, alto) * 0.5)))
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        self._sucias = 0
+        painter = QPainter(self)
+        painter.setFont(self._fuente)
+        # La región suele ser un puñado de celdas sueltas: se pintan por
+        # separado en vez de su rectángulo envolvente
+        for area in event.region():
+            painter.setClipRect(area)
+            self._pintar_zona(painter, area)
+        painter.end()
+
+    def _pintar_zona(self, painter, area):
+        tablero = self.tablero
+        ancho, alto = self._tam_celda()
+        f0 = max(0, int(area.top() // alto))
+        f1 = min(tablero.filas - 1, int(area.bottom() // alto))
+        c0 = max(0, int(area.left() // ancho))
+        c1 = min(tablero.columnas - 1, int(area.right() // ancho))
+
+        # Fondo y rejilla en estado "normal" de una sola vez
+        fondo, _, borde = self._colores["normal"]
+        painter.fillRect(area, self._fondo)
+        painter.fillRect(QRectF(c0 * ancho, f0 * alto, (c1 - c0 + 1) * ancho, (f1 - f0 + 1) * alto), fondo)
+        painter.setPen(borde)
+        lineas = [QLineF(c * ancho, f0 * alto, c * ancho, (f1 + 1) * alto) for c in range(c0, c1 + 2)]
+        lineas += [QLineF(c0 * ancho, f * alto, (c1 + 1) * ancho, f * alto) for f in range(f0, f1 + 2)]
+        painter.drawLines(lineas)
+
+        # Solo las celdas con otro estado o con texto se dibujan aparte
+        atlas = tablero.atlas
+        pluma = QPen()
+        for f in range(f0, f1 + 1):
+            textos = tablero._textos[f]
+            estados = tablero._estados[f]
+            for c in range(c0, c1 + 1):
+                estado = estados[c]
+                texto = textos[c]
+                if estado == "normal" and not texto:
+                    continue
+                fondo, color, color_borde = self._colores[estado]
+                rect = QRectF(c * ancho, f * alto, ancho, alto)
+                if estado != "normal":
+                    painter.fillRect(rect, fondo)
+                    pluma.setColor(color_borde)
+                    pluma.setWidthF(2 if estado == "seleccionada" else 1)
+                    painter.setPen(pluma)
+                    painter.drawRect(rect.adjusted(0.5, 0.5, -0.5, -0.5))
+                if not texto:
+                    continue
+                sprite = atlas.pixmap(texto, ancho, alto) if atlas is not None else None
+                if sprite is not None:
+                    painter.drawPixmap(
+                        int(rect.center().x() - sprite.width() / 2),
+                        int(rect.center().y() - sprite.height() / 2),
+                        sprite
+                    )
+                else:
+                    painter.setPen(color)
+                    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, texto)
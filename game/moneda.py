@@ -1,11 +1,22 @@
 import random
 
+VALORES_MONEDA = [25, 50, 100]
+
+# Símbolo ya formateado para cada valor (compartido por todas las monedas)
+SIMBOLOS_MONEDA = {valor: f"💰{valor}" for valor in VALORES_MONEDA}
+
 class Moneda:
-    def __init__(self, fila, col):
+    __slots__ = ("fila", "col", "valor")
+
+    def __init__(self, fila, col, valor=None):
         self.fila = fila
         self.col = col
-        self.valor = random.choice([25, 50, 100])
-        self.simbolo = f"💰{self.valor}"
+        self.valor = valor if valor is not None else random.choice(VALORES_MONEDA)
+
+    @property
+    def simbolo(self):
+        simbolo = SIMBOLOS_MONEDA.get(self.valor)
+        return simbolo if simbolo is not None else f"💰{self.valor}"
 
     def __repr__(self):
         return f"Moneda({self.fila},{self.col}, valor={self.valor})"
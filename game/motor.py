@@ -0,0 +1,509 @@
+import random
+from niveles_progresivos import NivelManager
+from moneda import Moneda, VALORES_MONEDA
+from ocupacion import GrillaOcupacion
+from eventos import PlanificadorEventos, TICK, SPAWN, MONEDA, TRANSICION
+from avatars import Flechador, Escudero, Leñador, Canibal
+from rooks import SandRook, RockRook, FireRook, WaterRook
+
+
+# Clases por nombre (usado al guardar/cargar partidas)
+CLASES_AVATARS = {
+    "Flechador": Flechador,
+    "Escudero": Escudero,
+    "Leñador": Leñador,
+    "Canibal": Canibal
+}
+
+CLASES_ROOKS = {
+    "SandRook": SandRook,
+    "RockRook": RockRook,
+    "FireRook": FireRook,
+    "WaterRook": WaterRook
+}
+
+# Tipo de rook según la tecla seleccionada (1-4)
+TIPOS_ROOK = {
+    1: SandRook,
+    2: RockRook,
+    3: FireRook,
+    4: WaterRook
+}
+
+
+class MotorJuego:
+    """
+    Reglas del juego sin dependencias de Qt.
+
+    El motor guarda avatars, rooks, monedas, economía y el estado de
+    oleadas, y avanza solo cuando se llama a step(dt). La interfaz (o un
+    script sin ventana) se registra como observador y recibe los eventos
+    llamando a sus métodos al_* si existen.
+
+    Ticks, oleadas, monedas y transiciones de nivel salen de una única
+    cola de eventos ordenada por tiempo de juego (self.eventos), así que
+    pausar, guardar o avanzar rápido no desincroniza unos de otros.
+
+    Toda la aleatoriedad sale de self.rng, sembrado con `semilla`, así que
+    una partida se puede reproducir exactamente. Si se pasa una Bitacora,
+    se anotan en ella las acciones del jugador y los spawns.
+    """
+
+    TICK_MS = 1000            # 1 tick de combate por segundo
+    MONEDA_MS = 5000          # 1 moneda cada 5 segundos
+    TRANSICION_MS = 5000      # pausa entre niveles
+    RECOMPENSA_AVATAR = 75
+
+    def __init__(self, filas=9, columnas=5, observador=None, verbose=True,
+                 semilla=None, bitacora=None):
+        self.filas = filas
+        self.columnas = columnas
+        self.observador = observador
+        self.verbose = verbose
+
+        # RNG propio de la sesión
+        if semilla is None:
+            semilla = random.randrange(2 ** 32)
+        self.semilla = semilla
+        self.rng = random.Random(semilla)
+
+        self.bitacora = bitacora
+        if bitacora is not None:
+            bitacora.escribir_cabecera(semilla=semilla, filas=filas, columnas=columnas)
+
+        self.grilla = self._crear_grilla()
+        self.limpiar_entidades()
+        self.economia = 0
+        self.game_over = False
+        self.victoria = False
+
+        # Reloj de juego (milisegundos) y eventos programados
+        self.tiempo_ms = 0
+        self._resto_ms = 0.0
+        self.spawn_interval = None      # None = spawns detenidos
+        self.eventos = PlanificadorEventos()
+        self.eventos.programar(TICK, self.TICK_MS)
+        self.eventos.programar(MONEDA, self.MONEDA_MS)
+
+        self.niveles_progresivos = NivelManager(self)
+
+    # --------------------------------------------
+    # OBSERVADOR Y LOG
+    # --------------------------------------------
+    def notificar(self, evento, *args):
+        """Llama observador.<evento>(*args) si el observador lo implementa."""
+        if self.observador is None:
+            return
+        manejador = getattr(self.observador, evento, None)
+        if manejador is not None:
+            manejador(*args)
+
+    def log(self, *args):
+        if self.verbose:
+            print(*args)
+
+    def registrar(self, tipo, *datos):
+        """Anota una entrada en la bitácora con el tiempo de juego actual."""
+        if self.bitacora is not None:
+            self.bitacora.registrar(self.tiempo_ms, tipo, *datos)
+
+    # --------------------------------------------
+    # CICLO DE VIDA
+    # --------------------------------------------
+    def iniciar(self):
+        """Arranca el nivel actual."""
+        self.niveles_progresivos.iniciar_nivel()
+
+    def simbolos(self):
+        """Símbolo visible de cada celda ocupada: {(fila, col): simbolo}."""
+        return self.grilla.simbolos()
+
+    def terminado(self):
+        return self.game_over or self.victoria
+
+    def tiempo_juego(self):
+        """Tiempo de juego transcurrido en segundos."""
+        return self.tiempo_ms / 1000
+
+    # --------------------------------------------
+    # RELOJ
+    # --------------------------------------------
+    def step(self, dt):
+        """
+        Avanza la simulación dt segundos de tiempo de juego.
+
+        Los eventos (ticks, oleadas, monedas y transición de nivel) se
+        disparan en orden aunque dt abarque varios de ellos.
+        """
+        self._resto_ms += dt * 1000
+        restante = int(self._resto_ms)
+        self._resto_ms -= restante
+        self._avanzar_ms(restante)
+
+    def avanzar_hasta(self, tiempo_ms):
+        """Avanza hasta el instante exacto tiempo_ms (usado en repeticiones)."""
+        if tiempo_ms > self.tiempo_ms:
+            self._avanzar_ms(tiempo_ms - self.tiempo_ms)
+
+    def _avanzar_ms(self, restante):
+        """Salta de evento en evento hasta tiempo_ms + restante."""
+        objetivo = self.tiempo_ms + restante
+        while not self.terminado():
+            siguiente = self.eventos.proximo()
+            if siguiente is None or siguiente > objetivo:
+                break
+            self.tiempo_ms = siguiente
+            self._disparar(self.eventos.extraer())
+
+        # Al terminar la partida el reloj se queda en el último evento
+        if not self.terminado():
+            self.tiempo_ms = objetivo
+
+    def _disparar(self, tipo):
+        # Los eventos periódicos se reprograman antes de ejecutarse, así
+        # el propio evento puede cancelarlos (p. ej. detener_spawns)
+        if tipo == TICK:
+            self.eventos.programar(TICK, self.tiempo_ms + self.TICK_MS)
+            self.tick()
+        elif tipo == SPAWN:
+            self.eventos.programar(SPAWN, self.tiempo_ms + self.spawn_interval)
+            self.niveles_progresivos.spawn_avatar()
+        elif tipo == MONEDA:
+            self.eventos.programar(MONEDA, self.tiempo_ms + self.MONEDA_MS)
+            self.spawn_coin()
+        elif tipo == TRANSICION:
+            self.niveles_progresivos.iniciar_nivel()
+
+    def iniciar_spawns(self, intervalo_ms):
+        self.spawn_interval = intervalo_ms
+        self.eventos.programar(SPAWN, self.tiempo_ms + intervalo_ms)
+
+    def detener_spawns(self):
+        self.spawn_interval = None
+        self.eventos.cancelar(SPAWN)
+
+    def programar_transicion(self):
+        """Inicia el siguiente nivel tras TRANSICION_MS."""
+        self.eventos.programar(TRANSICION, self.tiempo_ms + self.TRANSICION_MS)
+
+    def en_transicion(self):
+        return self.eventos.pendiente(TRANSICION) is not None
+
+    # --------------------------------------------
+    # REGISTRO DE ENTIDADES
+    # --------------------------------------------
+    def _crear_grilla(self):
+        return GrillaOcupacion(self.filas, self.columnas)
+
+    def cantidad_avatars(self):
+        return len(self.avatars)
+
+    # Quien agrega entidades avisa con al_refrescar una sola vez al final,
+    # así una oleada completa se pinta en un único refresco.
+    def agregar_avatar(self, avatar):
+        self.avatars.append(avatar)
+        self.grilla.agregar_avatar(avatar)
+
+    def agregar_rook(self, rook):
+        self.rooks.append(rook)
+        self.grilla.agregar_rook(rook)
+
+    def agregar_moneda(self, moneda):
+        self.monedas.append(moneda)
+        self.grilla.agregar_moneda(moneda)
+
+    def limpiar_entidades(self):
+        self.avatars = []
+        self.rooks = []
+        self.monedas = []
+        self.grilla.limpiar()
+
+    # --------------------------------------------
+    # TICK DEL JUEGO
+    # --------------------------------------------
+    def tick(self):
+        if self.terminado():
+            return
+
+        self.mover_avatars()
+        if self.game_over:
+            return
+        self.combate()
+        self.limpiar_muertos()
+        self.notificar("al_refrescar")
+
+        # Verificar si completó el nivel (no durante la transición)
+        niveles = self.niveles_progresivos
+        if not self.en_transicion() and niveles.oleada_actual >= niveles.niveles[niveles.nivel_actual]["oleadas"]:
+            if self.cantidad_avatars() == 0:  # No quedan avatars
+                niveles.completar_nivel()
+
+    # --------------------------------------------
+    # MOVIMIENTO DE AVATARS
+    # --------------------------------------------
+    def mover_avatars(self):
+        for avatar in self.avatars:
+
+            # Si un avatar llega a la fila roja → game over
+            if avatar.fila == 0:
+                self.game_over = True
+                self.detener_spawns()
+                self.registrar("f", "derrota")
+                self.log("💀 GAME OVER")
+                self.notificar("al_game_over")
+                return
+
+            # Movimiento si cooldown lo permite
+            if avatar.puede_mover(1):
+                # Verificar si hay rook en la casilla hacia donde quiere avanzar
+                destino_fila = avatar.fila - 1
+
+                if self.grilla.rook_en(destino_fila, avatar.col) is None:
+                    self.grilla.mover_avatar(avatar, destino_fila, avatar.col)
+
+    # --------------------------------------------
+    # COMBATE ENTRE AVATARS Y ROOKS
+    # --------------------------------------------
+    def combate(self):
+        """
+        Resuelve el combate carril por carril.
+
+        La grilla agrupa las entidades por celda, así que cada rook solo
+        mira la celda de enfrente (fila + 1, misma columna) en vez de
+        recorrer todos los avatars. Los golpes de un tick son simultáneos
+        y los muertos se retiran después, en limpiar_muertos().
+        """
+        for rook in self.rooks:
+            enfrente = self.grilla.avatars_en(rook.fila + 1, rook.col)
+            if not enfrente:
+                continue
+
+            # Avatars atacan a la rook que tienen delante
+            for avatar in enfrente:
+                if avatar.esta_vivo() and avatar.puede_atacar(1):
+                    rook.recibir_daño(avatar.ataque)
+
+            # Rook ataca al primer avatar vivo de la celda
+            objetivo = next((a for a in enfrente if a.esta_vivo()), None)
+            if objetivo is not None and rook.puede_atacar(1):
+                objetivo.recibir_daño(rook.ataque)
+                # Si el avatar muere → sumar economía
+                if not objetivo.esta_vivo():
+                    self.economia += self.RECOMPENSA_AVATAR
+                    self.log(f"Avatar derrotado. Economía = {self.economia}")
+                    self.notificar("al_cambiar_economia", self.economia)
+
+    # --------------------------------------------
+    # ELIMINAR ENTIDADES MUERTAS
+    # --------------------------------------------
+    def limpiar_muertos(self):
+        """Compacta las listas en una sola pasada y actualiza la grilla."""
+        vivos = []
+        for a in self.avatars:
+            if a.esta_vivo():
+                vivos.append(a)
+            else:
+                self.grilla.quitar_avatar(a)
+        self.avatars = vivos
+
+        vivas = []
+        for r in self.rooks:
+            if r.esta_vivo():
+                vivas.append(r)
+            else:
+                self.grilla.quitar_rook(r)
+        self.rooks = vivas
+
+    # --------------------------------------------
+    # ACCIONES DEL JUGADOR
+    # --------------------------------------------
+    def colocar_rook(self, fila, col, tipo):
+        """Coloca una rook del tipo 1-4. Devuelve True si se colocó."""
+        self.registrar("r", fila, col, tipo)
+
+        # Verificar colisiones
+        if self.grilla.rook_en(fila, col) is not None:
+            self.log("Ya hay una rook ahí.")
+            return False
+
+        if self.grilla.hay_avatar(fila, col):
+            self.log("No se puede poner una rook encima de un avatar.")
+            return False
+
+        if self.grilla.moneda_en(fila, col) is not None:
+            self.log("No se puede poner una rook encima de una moneda.")
+            return False
+
+        clase = TIPOS_ROOK.get(tipo)
+        if clase is None:
+            self.log("Tipo inválido")
+            return False
+        nueva = clase(fila, col)
+
+        if self.economia < nueva.costo:
+            self.log(f"No tienes suficiente economía. Necesitas {nueva.costo}, tienes {self.economia}.")
+            return False
+
+        self.economia -= nueva.costo
+        self.log(f"Rook colocado. Economía restante: {self.economia}")
+        self.notificar("al_cambiar_economia", self.economia)
+
+        self.agregar_rook(nueva)
+        self.notificar("al_refrescar")
+        return True
+
+    def recoger_moneda_en(self, fila, col):
+        """Recoge la moneda de la celda. Devuelve True si había una."""
+        self.registrar("m", fila, col)
+        m = self.grilla.moneda_en(fila, col)
+        if m is None:
+            self.log("No hay moneda en esta celda.")
+            return False
+
+        self.log(f"Moneda recogida en ({fila},{col}) +{m.valor}")
+
+        # Sumar a economía
+        self.economia += m.valor
+        self.log(f"Economía total: {self.economia}")
+        self.notificar("al_cambiar_economia", self.economia)
+
+        # Quitar de la lista
+        self.monedas.remove(m)
+        self.grilla.quitar_moneda(m)
+        self.notificar("al_refrescar")
+        return True
+
+    # --------------------------------------------
+    # MONEDAS
+    # --------------------------------------------
+    def spawn_coin(self):
+        # Celdas libres (sin avatar, rook ni moneda) que mantiene la grilla
+        libres = self.grilla.celdas_libres()
+
+        if not libres:
+            self.log("No hay espacio para monedas.")
+            return
+
+        fila, col = self.rng.choice(libres)
+        nueva = Moneda(fila, col, self.rng.choice(VALORES_MONEDA))
+        self.agregar_moneda(nueva)
+        self.registrar("c", fila, col, nueva.valor)
+        self.notificar("al_refrescar")
+        self.log(f"Spawn MONEDA en ({fila}, {col}) valor={nueva.valor}")
+
+    # --------------------------------------------
+    # FIN DE PARTIDA
+    # --------------------------------------------
+    def finalizar_victoria(self):
+        self.victoria = True
+        self.detener_spawns()
+        self.registrar("f", "victoria")
+        self.notificar("al_victoria")
+
+    # --------------------------------------------
+    # PERSISTENCIA
+    # --------------------------------------------
+    def exportar_estado(self):
+        """Devuelve el estado de la partida como dict serializable."""
+        return {
+            "filas": self.filas,
+            "columnas": self.columnas,
+            "economia": self.economia,
+            "nivel_actual": self.niveles_progresivos.nivel_actual,
+            "oleada_actual": self.niveles_progresivos.oleada_actual,
+            "game_over": self.game_over,
+            "victoria": self.victoria,
+            "avatars": [
+                {"tipo": type(a).__name__, "fila": a.fila, "col": a.col, "vida": a.vida,
+                 "tiempo_desde_avance": a.tiempo_desde_avance,
+                 "tiempo_desde_ataque": a.tiempo_desde_ataque}
+                for a in self.avatars
+            ],
+            "rooks": [
+                {"tipo": type(r).__name__, "fila": r.fila, "col": r.col, "vida": r.vida,
+                 "tiempo_desde_ataque": r.tiempo_desde_ataque}
+                for r in self.rooks
+            ],
+            "monedas": [
+                {"fila": m.fila, "col": m.col, "valor": m.valor}
+                for m in self.monedas
+            ],
+            # Eventos pendientes como ms que faltan: al cargar se retoman
+            # exactamente en la misma fase
+            "tiempo_ms": self.tiempo_ms,
+            "resto_ms": self._resto_ms,
+            "spawn_interval": self.spawn_interval,
+            "eventos": self.eventos.exportar(self.tiempo_ms),
+            # Con el estado del RNG, la partida cargada sigue igual que la original
+            "rng": self.rng.getstate()
+        }
+
+    def restaurar_estado(self, datos):
+        """Reemplaza el estado actual por el de un dict de exportar_estado()."""
+        self.registrar("e", datos)
+        self.limpiar_entidades()
+
+        # RESTAURAR economía
+        self.economia = datos.get("economia", 0)
+
+        # RESTAURAR NIVEL Y OLEADA
+        niveles = self.niveles_progresivos
+        niveles.nivel_actual = datos.get("nivel_actual", 1)
+        niveles.oleada_actual = datos.get("oleada_actual", 1)
+
+        # RECONSTRUIR AVATARS
+        for a in datos.get("avatars", []):
+            tipo = a.get("tipo")
+            clase = CLASES_AVATARS.get(tipo)
+            if clase:
+                nuevo = clase(a["fila"], a["col"])
+                if "vida" in a:
+                    nuevo.vida = a["vida"]
+                nuevo.tiempo_desde_avance = a.get("tiempo_desde_avance", 0)
+                nuevo.tiempo_desde_ataque = a.get("tiempo_desde_ataque", 0)
+                self.agregar_avatar(nuevo)
+            else:
+                self.log(f"WARN: tipo avatar desconocido '{tipo}' - se omite")
+
+        # RECONSTRUIR ROOKS
+        for r in datos.get("rooks", []):
+            tipo = r.get("tipo")
+            clase = CLASES_ROOKS.get(tipo)
+            if clase:
+                nuevo = clase(r["fila"], r["col"])
+                if "vida" in r:
+                    nuevo.vida = r["vida"]
+                nuevo.tiempo_desde_ataque = r.get("tiempo_desde_ataque", 0)
+                self.agregar_rook(nuevo)
+            else:
+                self.log(f"WARN: tipo rook desconocido '{tipo}' - se omite")
+
+        # RECONSTRUIR MONEDAS
+        for m in datos.get("monedas", []):
+            nueva = Moneda(m["fila"], m["col"], m.get("valor", VALORES_MONEDA[0]))
+            self.agregar_moneda(nueva)
+
+        # RESTAURAR FLAGS
+        self.game_over = datos.get("game_over", False)
+        self.victoria = datos.get("victoria", False)
+
+        # RESTAURAR RELOJ Y RNG (las partidas viejas no los traen)
+        if "tiempo_ms" in datos:
+            self.tiempo_ms = datos["tiempo_ms"]
+            self._resto_ms = datos.get("resto_ms", 0.0)
+        if "rng" in datos:
+            version, interno, gauss = datos["rng"]
+            self.rng.setstate((version, tuple(interno), gauss))
+
+        # RESTAURAR EVENTOS (las partidas viejas conservan los actuales)
+        if "eventos" in datos:
+            self.spawn_interval = datos.get("spawn_interval")
+            self.eventos.restaurar(datos["eventos"], self.tiempo_ms)
+
+        config = niveles.niveles[niveles.nivel_actual]
+        self.notificar("al_iniciar_nivel", config["nombre"], niveles.oleada_actual,
+                       config["oleadas"], config["color"])
+        self.notificar("al_cambiar_oleada", niveles.oleada_actual, config["oleadas"])
+        self.notificar("al_cambiar_economia", self.economia)
+        self.notificar("al_refrescar")
+        self.log("DEBUG: carga completada. Avatars:", self.cantidad_avatars(), "Rooks:", len(self.rooks))
@@ -0,0 +1,340 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo necesita este backend
+    np = None
+
+from motor import MotorJuego, CLASES_AVATARS, CLASES_ROOKS
+from ocupacion import GrillaOcupacion
+
+
+TIPOS_AVATAR = list(CLASES_AVATARS.values())
+TIPOS_ROOK = list(CLASES_ROOKS.values())
+SIMBOLOS_AVATAR = [clase.simbolo for clase in TIPOS_AVATAR]
+SIMBOLOS_ROOK = [clase.simbolo for clase in TIPOS_ROOK]
+CAPACIDAD_INICIAL = 64
+
+# Arreglos por entidad (uno por atributo, todos int64). Crecer y compactar
+# recorre exactamente estas listas.
+ARREGLOS_AVATAR = (
+    "_av_fila", "_av_col", "_av_vida", "_av_ataque", "_av_vel_avance",
+    "_av_vel_ataque", "_av_t_avance", "_av_t_ataque", "_av_tipo", "_av_llegada"
+)
+ARREGLOS_ROOK = (
+    "_rk_fila", "_rk_col", "_rk_vida", "_rk_ataque", "_rk_vel_ataque",
+    "_rk_t_ataque", "_rk_tipo"
+)
+
+
+class LibresNumpy:
+    """Celdas libres (índices fila-mayor de un arreglo) indexables como tuplas."""
+
+    def __init__(self, indices, columnas):
+        self.indices = indices
+        self.columnas = columnas
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, k):
+        return divmod(int(self.indices[k]), self.columnas)
+
+
+class GrillaNumpy(GrillaOcupacion):
+    """
+    Ocupación del tablero leída de los arreglos de MotorNumpy.
+
+    Avatars y rooks se consultan en matrices filas x columnas (conteo de
+    avatars e índice de rook); las monedas usan el dict de la clase base.
+    Las celdas libres se calculan con una máscara sobre esas matrices en
+    vez de llevarse al día entidad por entidad.
+    """
+
+    def __init__(self, motor):
+        self.motor = motor
+        super().__init__(motor.filas, motor.columnas)
+
+    def limpiar(self):
+        self._monedas = {}
+        self.conteo_avatars = np.zeros((self.filas, self.columnas), dtype=np.int32)
+        self.indice_rook = np.full((self.filas, self.columnas), -1, dtype=np.int64)
+
+    def _ocupar(self, clave):
+        pass
+
+    def _desocupar(self, clave):
+        pass
+
+    def celdas_libres(self):
+        libre = (self.conteo_avatars == 0) & (self.indice_rook < 0)
+        for fila, col in self._monedas:
+            libre[fila, col] = False
+        return LibresNumpy(np.flatnonzero(libre), self.columnas)
+
+    def _dentro(self, fila, col):
+        # Sin esto un índice negativo de NumPy leería el otro borde
+        return 0 <= fila < self.filas and 0 <= col < self.columnas
+
+    def avatars_en(self, fila, col):
+        if not self._dentro(fila, col) or self.conteo_avatars[fila, col] == 0:
+            return []
+        # Solo se reconstruyen los avatars de la celda, no los de todo el tablero
+        motor = self.motor
+        n = motor._n_av
+        indices = np.flatnonzero((motor._av_fila[:n] == fila) & (motor._av_col[:n] == col))
+        return [motor._avatar_en_indice(i) for i in indices]
+
+    def hay_avatar(self, fila, col):
+        return self._dentro(fila, col) and self.conteo_avatars[fila, col] > 0
+
+    def rook_en(self, fila, col):
+        if not self._dentro(fila, col):
+            return None
+        i = self.indice_rook[fila, col]
+        return self.motor.rook_en_indice(i) if i >= 0 else None
+
+    def ocupada(self, fila, col):
+        if not self._dentro(fila, col):
+            return False
+        return (
+            self.conteo_avatars[fila, col] > 0
+            or self.indice_rook[fila, col] >= 0
+            or (fila, col) in self._monedas
+        )
+
+    def simbolos(self):
+        motor = self.motor
+        n = motor._n_av
+        frame = {}
+        # El avatar visible es el último en llegar a la celda
+        for i in np.argsort(motor._av_llegada[:n], kind="stable"):
+            frame[(int(motor._av_fila[i]), int(motor._av_col[i]))] = SIMBOLOS_AVATAR[motor._av_tipo[i]]
+        for i in range(motor._n_rk):
+            frame[(int(motor._rk_fila[i]), int(motor._rk_col[i]))] = SIMBOLOS_ROOK[motor._rk_tipo[i]]
+        for clave, moneda in self._monedas.items():
+            frame[clave] = moneda.simbolo
+        return frame
+
+
+class MotorNumpy(MotorJuego):
+    """
+    Backend struct-of-arrays del MotorJuego.
+
+    Posiciones, vida, ataque y acumuladores de cooldown de avatars y rooks
+    viven en arreglos NumPy, y movimiento, cooldowns y combate por carril
+    se resuelven con operaciones vectorizadas sobre todas las entidades.
+    Con la misma semilla produce exactamente la misma partida que
+    MotorJuego. Compensa en tableros grandes y oleadas de cientos de
+    avatars; en el tablero 9x5 el motor por objetos es más rápido.
+
+    `avatars` y `rooks` devuelven copias (objetos Avatar/Rook) reconstruidas
+    de los arreglos: sirven para leer, guardar o pintar, no para modificar.
+    """
+
+    def __init__(self, *args, **kwargs):
+        if np is None:
+            raise RuntimeError("El backend NumPy requiere instalar numpy (pip install numpy)")
+        super().__init__(*args, **kwargs)
+
+    def _crear_grilla(self):
+        return GrillaNumpy(self)
+
+    # --------------------------------------------
+    # ARREGLOS
+    # --------------------------------------------
+    def limpiar_entidades(self):
+        cap = CAPACIDAD_INICIAL
+        self._n_av = 0
+        for nombre in ARREGLOS_AVATAR:
+            setattr(self, nombre, np.zeros(cap, dtype=np.int64))
+        self._llegadas = 0
+
+        self._n_rk = 0
+        for nombre in ARREGLOS_ROOK:
+            setattr(self, nombre, np.zeros(cap, dtype=np.int64))
+
+        self.monedas = []
+        self.grilla.limpiar()
+
+    def _asegurar_capacidad(self, nombres, n):
+        actual = len(getattr(self, nombres[0]))
+        if n <= actual:
+            return
+        nueva = max(n, actual * 2)
+        for nombre in nombres:
+            viejo = getattr(self, nombre)
+            arr = np.zeros(nueva, dtype=viejo.dtype)
+            arr[:actual] = viejo
+            setattr(self, nombre, arr)
+
+    # --------------------------------------------
+    # VISTAS COMO OBJETOS
+    # --------------------------------------------
+    @property
+    def avatars(self):
+        return [self._avatar_en_indice(i) for i in range(self._n_av)]
+
+    @property
+    def rooks(self):
+        return [self.rook_en_indice(i) for i in range(self._n_rk)]
+
+    def _avatar_en_indice(self, i):
+        a = TIPOS_AVATAR[self._av_tipo[i]](int(self._av_fila[i]), int(self._av_col[i]))
+        a.vida = int(self._av_vida[i])
+        a.tiempo_desde_avance = int(self._av_t_avance[i])
+        a.tiempo_desde_ataque = int(self._av_t_ataque[i])
+        return a
+
+    def rook_en_indice(self, i):
+        r = TIPOS_ROOK[self._rk_tipo[i]](int(self._rk_fila[i]), int(self._rk_col[i]))
+        r.vida = int(self._rk_vida[i])
+        r.tiempo_desde_ataque = int(self._rk_t_ataque[i])
+        return r
+
+    def cantidad_avatars(self):
+        return self._n_av
+
+    # --------------------------------------------
+    # REGISTRO DE ENTIDADES
+    # --------------------------------------------
+    def agregar_avatar(self, avatar):
+        i = self._n_av
+        self._asegurar_capacidad(ARREGLOS_AVATAR, i + 1)
+        self._av_fila[i] = avatar.fila
+        self._av_col[i] = avatar.col
+        self._av_vida[i] = avatar.vida
+        self._av_ataque[i] = avatar.ataque
+        self._av_vel_avance[i] = avatar.vel_avance
+        self._av_vel_ataque[i] = avatar.vel_ataque
+        self._av_t_avance[i] = avatar.tiempo_desde_avance
+        self._av_t_ataque[i] = avatar.tiempo_desde_ataque
+        self._av_tipo[i] = TIPOS_AVATAR.index(type(avatar))
+        self._llegadas += 1
+        self._av_llegada[i] = self._llegadas
+        self._n_av += 1
+        self.grilla.conteo_avatars[avatar.fila, avatar.col] += 1
+
+    def agregar_rook(self, rook):
+        i = self._n_rk
+        self._asegurar_capacidad(ARREGLOS_ROOK, i + 1)
+        self._rk_fila[i] = rook.fila
+        self._rk_col[i] = rook.col
+        self._rk_vida[i] = rook.vida
+        self._rk_ataque[i] = rook.ataque
+        self._rk_vel_ataque[i] = rook.vel_ataque
+        self._rk_t_ataque[i] = rook.tiempo_desde_ataque
+        self._rk_tipo[i] = TIPOS_ROOK.index(type(rook))
+        self._n_rk += 1
+        self.grilla.indice_rook[rook.fila, rook.col] = i
+
+    # --------------------------------------------
+    # MOVIMIENTO (vectorizado)
+    # --------------------------------------------
+    def mover_avatars(self):
+        n = self._n_av
+        if n == 0:
+            return
+        fila = self._av_fila[:n]
+        col = self._av_col[:n]
+
+        # Igual que el motor por objetos: el primer avatar (en orden de la
+        # lista) que está en la fila roja termina la partida, y solo los
+        # anteriores llegan a moverse en este tick.
+        en_base = np.flatnonzero(fila == 0)
+        limite = int(en_base[0]) if en_base.size else n
+
+        t = self._av_t_avance[:limite]
+        t += 1
+        listos = np.flatnonzero(t >= self._av_vel_avance[:limite])
+        t[listos] = 0
+
+        if listos.size:
+            destino = fila[listos] - 1
+            mueven = listos[self.grilla.indice_rook[destino, col[listos]] < 0]
+            if mueven.size:
+                conteo = self.grilla.conteo_avatars
+                np.subtract.at(conteo, (fila[mueven], col[mueven]), 1)
+                fila[mueven] -= 1
+                np.add.at(conteo, (fila[mueven], col[mueven]), 1)
+                self._av_llegada[mueven] = self._llegadas + np.arange(1, mueven.size + 1)
+                self._llegadas += mueven.size
+
+        if en_base.size:
+            self.game_over = True
+            self.detener_spawns()
+            self.registrar("f", "derrota")
+            self.log("💀 GAME OVER")
+            self.notificar("al_game_over")
+
+    # --------------------------------------------
+    # COMBATE POR CARRIL (vectorizado)
+    # --------------------------------------------
+    def combate(self):
+        n = self._n_av
+        if n == 0 or self._n_rk == 0:
+            return
+        fila = self._av_fila[:n]
+        col = self._av_col[:n]
+
+        # Rook que cada avatar tiene delante (-1 si ninguna)
+        frente = np.full(n, -1, dtype=np.int64)
+        validos = fila >= 1
+        frente[validos] = self.grilla.indice_rook[fila[validos] - 1, col[validos]]
+        enfrentados = np.flatnonzero(frente >= 0)
+        if enfrentados.size == 0:
+            return
+
+        # Avatars atacan a la rook que tienen delante
+        t = self._av_t_ataque
+        t[enfrentados] += 1
+        atacan = enfrentados[t[enfrentados] >= self._av_vel_ataque[enfrentados]]
+        t[atacan] = 0
+        np.subtract.at(self._rk_vida, frente[atacan], self._av_ataque[atacan])
+
+        # Cada rook ataca al primer avatar que llegó a su celda de enfrente
+        orden = enfrentados[np.lexsort((self._av_llegada[enfrentados], frente[enfrentados]))]
+        rooks = frente[orden]
+        primero = np.ones(orden.size, dtype=bool)
+        primero[1:] = rooks[1:] != rooks[:-1]
+        objetivos = orden[primero]
+        rooks = rooks[primero]
+
+        tr = self._rk_t_ataque
+        tr[rooks] += 1
+        listas = tr[rooks] >= self._rk_vel_ataque[rooks]
+        rooks = rooks[listas]
+        objetivos = objetivos[listas]
+        tr[rooks] = 0
+        self._av_vida[objetivos] -= self._rk_ataque[rooks]
+
+        # Si el avatar muere → sumar economía
+        for _ in range(int(np.count_nonzero(self._av_vida[objetivos] <= 0))):
+            self.economia += self.RECOMPENSA_AVATAR
+            self.log(f"Avatar derrotado. Economía = {self.economia}")
+            self.notificar("al_cambiar_economia", self.economia)
+
+    # --------------------------------------------
+    # ELIMINAR ENTIDADES MUERTAS
+    # --------------------------------------------
+    def limpiar_muertos(self):
+        n = self._n_av
+        vivos = self._av_vida[:n] > 0
+        if not vivos.all():
+            muertos = ~vivos
+            np.subtract.at(self.grilla.conteo_avatars, (self._av_fila[:n][muertos], self._av_col[:n][muertos]), 1)
+            k = int(np.count_nonzero(vivos))
+            for nombre in ARREGLOS_AVATAR:
+                arr = getattr(self, nombre)
+                arr[:k] = arr[:n][vivos]
+            self._n_av = k
+
+        m = self._n_rk
+        vivas = self._rk_vida[:m] > 0
+        if not vivas.all():
+            k = int(np.count_nonzero(vivas))
+            for nombre in ARREGLOS_ROOK:
+                arr = getattr(self, nombre)
+                arr[:k] = arr[:m][vivas]
+            self._n_rk = k
+            indice = self.grilla.indice_rook
+            indice.fill(-1)
+            indice[self._rk_fila[:k], self._rk_col[:k]] = np.arange(k)
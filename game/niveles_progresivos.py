@@ -1,9 +1,8 @@
-import random
 from avatars import Flechador, Escudero, Leñador, Canibal
 
 class NivelManager:
-    def __init__(self, controlador):
-        self.controlador = controlador
+    def __init__(self, motor):
+        self.motor = motor
         self.nivel_actual = 1
         self.oleada_actual = 0
         self.max_niveles = 3
@@ -44,55 +43,52 @@ class NivelManager:
         self.oleada_actual = 0
 
         # Configurar economía inicial
-        self.controlador.economia = config["economia_inicial"]
-
-        # Configurar intervalo del spawn
-        self.controlador.spawn_timer.setInterval(config["spawn_interval"])
+        self.motor.economia = config["economia_inicial"]
 
         # Limpiar estado de listas
-        self.controlador.avatars = []
-        self.controlador.rooks = []
-        self.controlador.monedas = []
-        self.controlador.game_over = False
+        self.motor.limpiar_entidades()
+        self.motor.game_over = False
 
         # Actualizar UI
-        self.controlador.tablero.mostrar_nivel(
+        self.motor.notificar(
+            "al_iniciar_nivel",
             config["nombre"],
             self.oleada_actual,
             config["oleadas"],
             config["color"]
         )
-        self.controlador.actualizar_panel()
+        self.motor.notificar("al_cambiar_economia", self.motor.economia)
+        self.motor.notificar("al_refrescar")
 
-        print(f"🎮 {config['nombre']} iniciado")
-        print(f"💰 Economía inicial: {config['economia_inicial']}")
-        print(f"📊 Oleadas totales: {config['oleadas']}")
-        self.controlador.spawn_timer.start()
+        self.motor.log(f"🎮 {config['nombre']} iniciado")
+        self.motor.log(f"💰 Economía inicial: {config['economia_inicial']}")
+        self.motor.log(f"📊 Oleadas totales: {config['oleadas']}")
+
+        # Configurar intervalo del spawn
+        self.motor.iniciar_spawns(config["spawn_interval"])
 
     def spawn_avatar(self):
-        print("🚨 spawn_avatar llamado")
         """Genera avatars según el nivel actual"""
-        if self.controlador.game_over:
-            print("Spawn cancelado: game over")
+        if self.motor.game_over:
+            self.motor.log("Spawn cancelado: game over")
             return
 
         config = self.niveles[self.nivel_actual]
-        self.controlador.spawn_timer.setInterval(config["spawn_interval"])
 
         # Verificar si aún quedan oleadas
         if self.oleada_actual >= config["oleadas"]:
-            print("No más oleadas; completando nivel...")
+            self.motor.log("No más oleadas; completando nivel...")
             self.completar_nivel()
             return
 
         # AVANZAR oleada
         self.oleada_actual += 1
 
-        print(f"🌊 Oleada {self.oleada_actual}/{config['oleadas']}")
+        self.motor.log(f"🌊 Oleada {self.oleada_actual}/{config['oleadas']}")
 
         # Actualizar UI
-        self.controlador.tablero.actualizar_oleada(
-            self.oleada_actual, config["oleadas"]
+        self.motor.notificar(
+            "al_cambiar_oleada", self.oleada_actual, config["oleadas"]
         )
 
         # Variables necesarias
@@ -102,30 +98,32 @@ class NivelManager:
         # GENERAR AVATARS
         for _ in range(num_avatars):
 
-            col = random.randint(0, self.controlador.tablero.columnas - 1)
-            fila = self.controlador.tablero.filas - 1
+            col = self.motor.rng.randint(0, self.motor.columnas - 1)
+            fila = self.motor.filas - 1
 
-            tipo_avatar = random.choice(tipos_disponibles)
+            tipo_avatar = self.motor.rng.choice(tipos_disponibles)
             nuevo = tipo_avatar(fila, col)
 
-            self.controlador.agregar_avatar(nuevo)
-            self.controlador.refrescar_tablero()
+            self.motor.agregar_avatar(nuevo)
+            self.motor.registrar("a", fila, col, tipo_avatar.__name__)
 
-            print(f"  └─ Spawn {tipo_avatar.__name__} en ({fila}, {col})")
+            self.motor.log(f"  └─ Spawn {tipo_avatar.__name__} en ({fila}, {col})")
+
+        self.motor.notificar("al_refrescar")
 
     
     def completar_nivel(self):
         """Se ejecuta cuando se completan todas las oleadas"""
         # Verificar si quedan avatars vivos
-        if len(self.controlador.avatars) > 0:
-            print("⏳ Esperando a que se eliminen todos los avatars...")
+        if self.motor.cantidad_avatars() > 0:
+            self.motor.log("⏳ Esperando a que se eliminen todos los avatars...")
             return
         
         config = self.niveles[self.nivel_actual]
-        print(f"✅ {config['nombre']} COMPLETADO!")
+        self.motor.log(f"✅ {config['nombre']} COMPLETADO!")
         
         # Detener spawns
-        self.controlador.spawn_timer.stop()
+        self.motor.detener_spawns()
         
         # Verificar si es el último nivel
         if self.nivel_actual >= self.max_niveles:
@@ -138,38 +136,26 @@ class NivelManager:
         self.nivel_actual += 1
         
         # Mostrar pantalla de transición
-        self.controlador.tablero.mostrar_transicion_nivel(
+        self.motor.notificar(
+            "al_transicion_nivel",
             self.nivel_actual,
             self.niveles[self.nivel_actual]["nombre"]
         )
         
         # Dar bonus de economía
         bonus = 200
-        self.controlador.economia += bonus
-        print(f"💰 Bonus de nivel: +{bonus} oro")
+        self.motor.economia += bonus
+        self.motor.log(f"💰 Bonus de nivel: +{bonus} oro")
         
-        # Esperar 5 segundos antes de iniciar el siguiente nivel
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(5000, self.iniciar_nivel)
+        # Esperar 5 segundos (de juego) antes de iniciar el siguiente nivel
+        self.motor.programar_transicion()
     
     def victoria_total(self):
         """Se ejecuta cuando se completan todos los niveles"""
-        print("🏆 ¡VICTORIA TOTAL! ¡HAS COMPLETADO TODOS LOS NIVELES!")
-        
-        self.controlador.timer.stop()
-        self.controlador.coin_timer.stop()
-        
-        # Mostrar pantalla de victoria
-        self.controlador.tablero.mostrar_victoria()
+        self.motor.log("🏆 ¡VICTORIA TOTAL! ¡HAS COMPLETADO TODOS LOS NIVELES!")
         
-        # Agregar al Hall of Fame
-        try:
-            from ventanas.hallOfFame import HallOfFameWindow
-            # Aquí necesitarías obtener el username del jugador
-            # Por ahora usaremos un placeholder
-            HallOfFameWindow.add_winner("Jugador")
-        except Exception as e:
-            print(f"⚠️ No se pudo agregar al Hall of Fame: {e}")
+        # Detiene el motor y avisa a la UI (pantalla de victoria, Hall of Fame)
+        self.motor.finalizar_victoria()
     
     def obtener_progreso(self):
         """Retorna el progreso actual"""
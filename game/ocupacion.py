@@ -0,0 +1,191 @@
+class CeldasLibres:
+    """
+    Conjunto ordenado de celdas libres con acceso por posición.
+
+    Las celdas se guardan en un árbol de Fenwick sobre el orden fila-mayor
+    del tablero: agregar, quitar y obtener la k-ésima celda libre cuestan
+    O(log celdas) y len() es O(1). Como se puede indexar, rng.choice(libres)
+    elige exactamente la misma celda que sobre la lista recorrida fila por
+    fila, así que las partidas con semilla no cambian.
+    """
+
+    def __init__(self, filas, columnas):
+        self.filas = filas
+        self.columnas = columnas
+        n = filas * columnas
+        self._presente = bytearray(b"\x01" * n)
+        # Árbol con todas las celdas presentes: cada nodo cubre (i & -i) celdas
+        self._arbol = [i & -i for i in range(n + 1)]
+        self._cantidad = n
+        self._escalon = 1 << (n.bit_length() - 1) if n else 0
+
+    def __len__(self):
+        return self._cantidad
+
+    def __contains__(self, celda):
+        fila, col = celda
+        return 0 <= fila < self.filas and 0 <= col < self.columnas and \
+            self._presente[fila * self.columnas + col] == 1
+
+    def _sumar(self, indice, delta):
+        arbol = self._arbol
+        i = indice + 1
+        while i < len(arbol):
+            arbol[i] += delta
+            i += i & -i
+
+    def agregar(self, celda):
+        fila, col = celda
+        if not (0 <= fila < self.filas and 0 <= col < self.columnas):
+            return
+        indice = fila * self.columnas + col
+        if not self._presente[indice]:
+            self._presente[indice] = 1
+            self._cantidad += 1
+            self._sumar(indice, 1)
+
+    def quitar(self, celda):
+        fila, col = celda
+        if not (0 <= fila < self.filas and 0 <= col < self.columnas):
+            return
+        indice = fila * self.columnas + col
+        if self._presente[indice]:
+            self._presente[indice] = 0
+            self._cantidad -= 1
+            self._sumar(indice, -1)
+
+    def __getitem__(self, k):
+        """k-ésima celda libre en orden fila-mayor."""
+        if not 0 <= k < self._cantidad:
+            raise IndexError(k)
+        arbol = self._arbol
+        pos = 0
+        paso = self._escalon
+        while paso:
+            siguiente = pos + paso
+            if siguiente < len(arbol) and arbol[siguiente] <= k:
+                pos = siguiente
+                k -= arbol[siguiente]
+            paso >>= 1
+        return divmod(pos, self.columnas)
+
+
+class GrillaOcupacion:
+    """
+    Índice de qué entidad ocupa cada celda del tablero.
+
+    Se mantiene de forma incremental (al aparecer, moverse o morir una
+    entidad) para que las consultas por (fila, col) sean O(1) en vez de
+    recorrer las listas de avatars, rooks y monedas.
+    Solo guarda las celdas ocupadas, así que el tamaño del tablero no
+    afecta al costo. Además lleva al día las celdas libres (CeldasLibres)
+    para ubicar monedas sin recorrer el tablero.
+    """
+
+    def __init__(self, filas, columnas):
+        self.filas = filas
+        self.columnas = columnas
+        self.limpiar()
+
+    def limpiar(self):
+        self._avatars = {}   # (fila, col) -> [avatar, ...] (pueden apilarse)
+        self._rooks = {}     # (fila, col) -> rook
+        self._monedas = {}   # (fila, col) -> moneda
+        self._libres = CeldasLibres(self.filas, self.columnas)
+
+    def _ocupar(self, clave):
+        self._libres.quitar(clave)
+
+    def _desocupar(self, clave):
+        if not self.ocupada(*clave):
+            self._libres.agregar(clave)
+
+    # --------------------------------------------
+    # AVATARS
+    # --------------------------------------------
+    def agregar_avatar(self, avatar):
+        clave = (avatar.fila, avatar.col)
+        self._avatars.setdefault(clave, []).append(avatar)
+        self._ocupar(clave)
+
+    def quitar_avatar(self, avatar):
+        clave = (avatar.fila, avatar.col)
+        celda = self._avatars.get(clave)
+        if celda is None:
+            return
+        celda.remove(avatar)
+        if not celda:
+            del self._avatars[clave]
+            self._desocupar(clave)
+
+    def mover_avatar(self, avatar, fila, col):
+        """Mueve el avatar a (fila, col) actualizando sus coordenadas."""
+        self.quitar_avatar(avatar)
+        avatar.fila = fila
+        avatar.col = col
+        self.agregar_avatar(avatar)
+
+    def avatars_en(self, fila, col):
+        return self._avatars.get((fila, col), ())
+
+    def hay_avatar(self, fila, col):
+        return (fila, col) in self._avatars
+
+    # --------------------------------------------
+    # ROOKS
+    # --------------------------------------------
+    def agregar_rook(self, rook):
+        clave = (rook.fila, rook.col)
+        self._rooks[clave] = rook
+        self._ocupar(clave)
+
+    def quitar_rook(self, rook):
+        clave = (rook.fila, rook.col)
+        if self._rooks.get(clave) is rook:
+            del self._rooks[clave]
+            self._desocupar(clave)
+
+    def rook_en(self, fila, col):
+        return self._rooks.get((fila, col))
+
+    # --------------------------------------------
+    # MONEDAS
+    # --------------------------------------------
+    def agregar_moneda(self, moneda):
+        clave = (moneda.fila, moneda.col)
+        self._monedas[clave] = moneda
+        self._ocupar(clave)
+
+    def quitar_moneda(self, moneda):
+        clave = (moneda.fila, moneda.col)
+        if self._monedas.get(clave) is moneda:
+            del self._monedas[clave]
+            self._desocupar(clave)
+
+    def moneda_en(self, fila, col):
+        return self._monedas.get((fila, col))
+
+    # --------------------------------------------
+    # CONSULTAS GENERALES
+    # --------------------------------------------
+    def ocupada(self, fila, col):
+        clave = (fila, col)
+        return clave in self._avatars or clave in self._rooks or clave in self._monedas
+
+    def celdas_libres(self):
+        """Celdas sin avatar, rook ni moneda, indexables en orden fila-mayor."""
+        return self._libres
+
+    def simbolos(self):
+        """
+        Símbolo visible por celda ocupada: {(fila, col): simbolo}.
+
+        Si hay varias entidades en la misma celda se muestra la moneda,
+        luego la rook y por último el avatar.
+        """
+        frame = {clave: celda[-1].simbolo for clave, celda in self._avatars.items()}
+        for clave, rook in self._rooks.items():
+            frame[clave] = rook.simbolo
+        for clave, moneda in self._monedas.items():
+            frame[clave] = moneda.simbolo
+        return frame
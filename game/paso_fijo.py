@@ -0,0 +1,100 @@
+import math
+from cronometro import reloj
+
+
+# Velocidades disponibles (None = sin límite, tan rápido como se pueda)
+VELOCIDADES = (1, 2, 8, None)
+
+
+class BuclePasoFijo:
+    """
+    Avanza el motor en pasos fijos según el tiempo real transcurrido.
+
+    Cada llamada a avanzar() mide con un reloj monótono cuánto pasó desde
+    la anterior, lo multiplica por la velocidad y ejecuta tantos pasos de
+    PASO_MS como hagan falta para ponerse al día. Así el tiempo de juego
+    no depende de cuándo dispare el QTimer.
+
+    Si la máquina se atrasa más de MAX_PASOS pasos, el resto se descarta
+    (el juego se ralentiza en vez de congelarse intentando recuperarlo).
+    Con velocidad None se avanza sin límite durante PRESUPUESTO_S segundos
+    reales por llamada, para no bloquear la interfaz.
+    """
+
+    PASO_MS = 50
+    MAX_PASOS = 40
+    PRESUPUESTO_S = 0.012
+
+    def __init__(self, motor, velocidad=1, reloj=reloj):
+        self.motor = motor
+        self.velocidad = velocidad
+        self.reloj = reloj
+        self.pausado = False
+        self._acumulado_ms = 0.0
+        self._ultimo = None
+
+    def cambiar_velocidad(self, velocidad):
+        self.velocidad = velocidad
+        self._acumulado_ms = 0.0
+
+    def siguiente_velocidad(self):
+        """Pasa a la siguiente velocidad de VELOCIDADES y la devuelve."""
+        i = VELOCIDADES.index(self.velocidad) if self.velocidad in VELOCIDADES else -1
+        self.cambiar_velocidad(VELOCIDADES[(i + 1) % len(VELOCIDADES)])
+        return self.velocidad
+
+    def pausar(self):
+        self.pausado = True
+
+    def reanudar(self):
+        # El tiempo en pausa no se recupera
+        self.pausado = False
+        self._ultimo = None
+
+    def ms_hasta(self, tiempo_ms):
+        """
+        Milisegundos reales que faltan para que avanzar() lleve el motor
+        hasta el instante de juego `tiempo_ms` (el primer paso que lo
+        alcance). None si no hay instante o la velocidad es sin límite.
+        """
+        if tiempo_ms is None or self.velocidad is None:
+            return None
+        pasos = max(0, math.ceil((tiempo_ms - self.motor.tiempo_ms) / self.PASO_MS))
+        faltan = pasos * self.PASO_MS - self._acumulado_ms
+        return max(0.0, faltan / self.velocidad)
+
+    def avanzar(self):
+        """Ejecuta los pasos pendientes. Devuelve cuántos se ejecutaron."""
+        ahora = self.reloj()
+        if self._ultimo is None:
+            self._ultimo = ahora
+        real = ahora - self._ultimo
+        self._ultimo = ahora
+
+        if self.pausado or self.motor.terminado():
+            return 0
+
+        if self.velocidad is None:
+            return self._avanzar_sin_limite(ahora)
+
+        self._acumulado_ms += real * 1000 * self.velocidad
+        pasos = int(self._acumulado_ms // self.PASO_MS)
+        if pasos > self.MAX_PASOS:
+            self.motor.log(f"⚠️ Atraso de {pasos} pasos, se descartan {pasos - self.MAX_PASOS}")
+            pasos = self.MAX_PASOS
+            self._acumulado_ms = 0.0
+        else:
+            self._acumulado_ms -= pasos * self.PASO_MS
+
+        for _ in range(pasos):
+            if self.motor.terminado():
+                break
+            self.motor.step(self.PASO_MS / 1000)
+        return pasos
+
+    def _avanzar_sin_limite(self, inicio):
+        pasos = 0
+        while not self.motor.terminado() and self.reloj() - inicio < self.PRESUPUESTO_S:
+            self.motor.step(self.PASO_MS / 1000)
+            pasos += 1
+        return pasos
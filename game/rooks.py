@@ -1,15 +1,19 @@
 class Rook:
-    def __init__(self, fila, col, vida, ataque, costo, simbolo):
+    # Solo el estado que cambia vive en cada instancia; las estadísticas
+    # del tipo (vida inicial, ataque, costo, símbolo) son de la clase.
+    __slots__ = ("fila", "col", "vida", "tiempo_desde_ataque")
+
+    vida_inicial = 1
+    ataque = 0
+    costo = 0
+    simbolo = "R"
+    vel_ataque = 3  # Para ataques por tiempo (puedes ajustarlo luego)
+
+    def __init__(self, fila, col):
         self.fila = fila
         self.col = col
-        self.vida = vida
-        self.ataque = ataque
-        self.costo = costo
-        self.simbolo = simbolo
-
-        # Para ataques por tiempo
+        self.vida = self.vida_inicial
         self.tiempo_desde_ataque = 0
-        self.vel_ataque = 3  # Puedes ajustarlo luego
 
     def recibir_daño(self, dmg):
         self.vida -= dmg
@@ -30,44 +34,32 @@ class Rook:
 # -------------------------
 
 class SandRook(Rook):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=3,
-            ataque=2,
-            costo=50,
-            simbolo="⛱️"
-        )
+    __slots__ = ()
+    vida_inicial = 3
+    ataque = 2
+    costo = 50
+    simbolo = "⛱️"
 
 
 class RockRook(Rook):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=14,
-            ataque=4,
-            costo=100,
-            simbolo="🪨"
-        )
+    __slots__ = ()
+    vida_inicial = 14
+    ataque = 4
+    costo = 100
+    simbolo = "🪨"
 
 
 class FireRook(Rook):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=16,
-            ataque=8,
-            costo=150,
-            simbolo="🔥"
-        )
+    __slots__ = ()
+    vida_inicial = 16
+    ataque = 8
+    costo = 150
+    simbolo = "🔥"
 
 
 class WaterRook(Rook):
-    def __init__(self, fila, col):
-        super().__init__(
-            fila, col,
-            vida=16,
-            ataque=8,
-            costo=150,
-            simbolo="💧"
-        )
+    __slots__ = ()
+    vida_inicial = 16
+    ataque = 8
+    costo = 150
+    simbolo = "💧"
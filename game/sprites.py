@@ -0,0 +1,81 @@
+from pathlib import Path
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap, QPixmapCache
+from avatars import Flechador, Escudero, Leñador, Canibal
+from rooks import SandRook, RockRook, FireRook, WaterRook
+
+
+CARPETA_IMAGENES = Path(__file__).resolve().parents[1] / "imagenes"
+
+# Imagen de cada tipo de unidad, indexada por el símbolo que usa el motor
+IMAGENES = {
+    Flechador.simbolo: "flechador",
+    Escudero.simbolo: "escudero",
+    Leñador.simbolo: "lenador",
+    Canibal.simbolo: "canibal",
+    SandRook.simbolo: "torrearena",
+    RockRook.simbolo: "torrepiedra",
+    FireRook.simbolo: "torrefuego",
+    WaterRook.simbolo: "torreagua"
+}
+
+TAM_MAESTRO = 256       # las imágenes se reducen a esto al cargarlas
+ESCALA_EN_CELDA = 0.85  # fracción de la celda que ocupa el sprite
+
+
+class AtlasSprites:
+    """
+    Sprites de unidades escalados al tamaño de celda.
+
+    Cada PNG de imagenes/ se lee una sola vez al crear el atlas (reducido
+    a TAM_MAESTRO, para no trabar el primer frame de la partida) y
+    las versiones escaladas se guardan en QPixmapCache con clave
+    tipo + tamaño. Al cambiar el tamaño de las celdas no se recalcula nada
+    por adelantado: la primera celda que pide el tamaño nuevo lo genera.
+    """
+
+    def __init__(self, carpeta=CARPETA_IMAGENES):
+        self.carpeta = Path(carpeta)
+        self._maestros = {}
+        for nombre in IMAGENES.values():
+            self._maestro(nombre)
+
+    def tiene(self, simbolo):
+        return simbolo in IMAGENES and self._maestro(IMAGENES[simbolo]) is not None
+
+    def _maestro(self, nombre):
+        if nombre not in self._maestros:
+            imagen = QPixmap(str(self.carpeta / f"{nombre}.png"))
+            if imagen.isNull():
+                print(f"⚠️ No se pudo cargar la imagen {nombre}.png")
+                imagen = None
+            elif max(imagen.width(), imagen.height()) > TAM_MAESTRO:
+                imagen = imagen.scaled(
+                    TAM_MAESTRO, TAM_MAESTRO,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            self._maestros[nombre] = imagen
+        return self._maestros[nombre]
+
+    def pixmap(self, simbolo, ancho, alto):
+        """Sprite del símbolo para una celda de ancho x alto, o None si no hay imagen."""
+        nombre = IMAGENES.get(simbolo)
+        if nombre is None:
+            return None
+        ancho = max(1, int(ancho * ESCALA_EN_CELDA))
+        alto = max(1, int(alto * ESCALA_EN_CELDA))
+        clave = f"avr:{nombre}:{ancho}x{alto}"
+
+        sprite = QPixmapCache.find(clave)
+        if sprite is None:
+            maestro = self._maestro(nombre)
+            if maestro is None:
+                return None
+            sprite = maestro.scaled(
+                ancho, alto,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            QPixmapCache.insert(clave, sprite)
+        return sprite
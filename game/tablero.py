@@ -1,18 +1,84 @@
 from PySide6.QtWidgets import QWidget, QGridLayout, QLabel, QVBoxLayout, QHBoxLayout, QMainWindow
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont
-from cronometro import Cronometro
+from cronometro import Cronometro, reloj
+from lienzo import LienzoTablero
+from sprites import AtlasSprites
+
+
+# Estilos de celda: se parsean una sola vez (hoja de estilo del contenedor)
+# y cada celda elige el suyo con la propiedad dinámica "estado".
+ESTILO_MATRIZ = """
+    QWidget#matriz {
+        background-color: #2d2d2d;
+        border: 3px solid #4a3520;
+        border-radius: 5px;
+    }
+    QLabel[estado="normal"] {
+        background-color: #1c1c1c;
+        color: #6b8e23;
+        border: 2px inset #3d3d3d;
+        border-radius: 3px;
+        padding: 5px;
+    }
+    QLabel[estado="ocupada"] {
+        background-color: #242424;
+        color: #e0e0e0;
+        border: 2px inset #4a4a4a;
+        border-radius: 3px;
+        padding: 5px;
+    }
+    QLabel[estado="roja"] {
+        background-color: #940901;
+        color: #630601;
+        border: 2px inset #630601;
+        border-radius: 3px;
+        padding: 5px;
+    }
+    QLabel[estado="seleccionada"] {
+        background-color: #3a2a2a;
+        color: #ffcc00;
+        border: 3px solid #ffcc00;
+        border-radius: 3px;
+        padding: 5px;
+    }
+"""
+
+# Veces por segundo (reales) que se refresca el cronómetro en pantalla;
+# siempre se muestra como mm:ss.mmm
+FRECUENCIA_CRONOMETRO = 10
+
+# A partir de esta cantidad de celdas la matriz se dibuja con un único
+# LienzoTablero en vez de un QLabel por celda.
+MAX_CELDAS_QLABEL = 200
 
 
 class Tablero(QMainWindow):
-    def __init__(self):
+    def __init__(self, filas=9, columnas=5, sprites=True,
+                 frecuencia_cronometro=FRECUENCIA_CRONOMETRO):
         super().__init__()
-        self.filas = 9
-        self.columnas = 5
+        self.filas = filas
+        self.columnas = columnas
+        self.lienzo = None
+        # Unidades dibujadas con las imágenes de imagenes/ (o emoji si False)
+        self.atlas = AtlasSprites() if sprites else None
+        self._reaplicar_pendiente = False
         self.sel_fila = 0
         self.sel_columna = 0
         self.celdas = []
-        self.celdas_rojas = []
+        self.celdas_rojas = set()
+        self._estados = [["normal"] * self.columnas for _ in range(self.filas)]
+        self._celda_resaltada = None
+
+        # Render incremental: texto actual de cada celda y último frame pintado
+        # (en tableros grandes las celdas vacías no llevan coordenadas)
+        if self.es_grande():
+            self.textos_base = [[""] * self.columnas for _ in range(self.filas)]
+        else:
+            self.textos_base = [[f"[{f},{c}]" for c in range(self.columnas)] for f in range(self.filas)]
+        self._textos = [fila[:] for fila in self.textos_base]
+        self._frame = {}
+        self._frame_valido = True
         self.colocar_rook_callback = None
         self.rook_seleccionada = 1  # valor por defecto
         
@@ -21,16 +87,13 @@ class Tablero(QMainWindow):
         
         # ✅ Inicializar cronómetro
         self.cronometro = Cronometro()
+        self.frecuencia_cronometro = frecuencia_cronometro
+        self._ultimo_refresco_cronometro = None
         
         self.init_ui()
         self.fila_roja(0)
         self.resaltar_celda(0, 0)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        
-        # ✅ Timer para actualizar el cronómetro en la UI
-        self.timer_cronometro = QTimer()
-        self.timer_cronometro.timeout.connect(self.actualizar_display_cronometro)
-        self.timer_cronometro.start(50)  # Actualiza cada 50ms
     
     def init_ui(self):
         # Configurar ventana principal
@@ -54,42 +117,38 @@ class Tablero(QMainWindow):
         
         # Widget contenedor para la matriz
         contenedor_matriz = QWidget()
-        contenedor_matriz.setStyleSheet("""
-            background-color: #2d2d2d;
-            border: 3px solid #4a3520;
-            border-radius: 5px;
-        """)
+        contenedor_matriz.setObjectName("matriz")
+        self.contenedor_matriz = contenedor_matriz
+        contenedor_matriz.setStyleSheet(ESTILO_MATRIZ)
         
         # Grid layout para la matriz
         grid_layout = QGridLayout()
         grid_layout.setSpacing(3)
         grid_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Crear matriz 9x5
-        for fila in range(self.filas):
-            fila_celdas = []
-            for col in range(self.columnas):
-                celda = QLabel(f"[{fila},{col}]")
-                celda.setFont(QFont("Courier", 11, QFont.Weight.Bold))
-                celda.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                celda.setMinimumSize(100, 60)
-                celda.setStyleSheet("""
-                    QLabel {
-                        background-color: #1c1c1c;
-                        color: #6b8e23;
-                        border: 2px inset #3d3d3d;
-                        border-radius: 3px;
-                        padding: 5px;
-                    }
-                """)
-                
-                grid_layout.addWidget(celda, fila, col)
-                fila_celdas.append(celda)
-            
-            self.celdas.append(fila_celdas)
+        # Crear matriz filas x columnas
+        if self.es_grande():
+            self.lienzo = LienzoTablero(self)
+            grid_layout.addWidget(self.lienzo, 0, 0)
+        else:
+            fuente_celda = QFont("Courier", 11, QFont.Weight.Bold)
+            for fila in range(self.filas):
+                fila_celdas = []
+                for col in range(self.columnas):
+                    celda = QLabel(self.textos_base[fila][col])
+                    celda.setFont(fuente_celda)
+                    celda.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                    celda.setMinimumSize(100, 60)
+                    celda.setProperty("estado", "normal")
+
+                    grid_layout.addWidget(celda, fila, col)
+                    fila_celdas.append(celda)
+
+                self.celdas.append(fila_celdas)
         
         contenedor_matriz.setLayout(grid_layout)
-        layout_centro.addWidget(contenedor_matriz)
+        # El lienzo se queda con todo el alto disponible
+        layout_centro.addWidget(contenedor_matriz, stretch=1 if self.lienzo else 0)
 
         # Panel de información lateral
         panel_lateral = QVBoxLayout()
@@ -100,7 +159,7 @@ class Tablero(QMainWindow):
         info_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # ✅ CREAR el label del cronómetro ANTES de usarlo
-        self.lbl_cronometro = QLabel("⏱️ 00:00.000")
+        self.lbl_cronometro = QLabel(f"⏱️ {self._formatear_cronometro(0)}")
         self.lbl_cronometro.setFont(QFont("Courier", 13, QFont.Weight.Bold))
         self.lbl_cronometro.setStyleSheet("color: #00FF00; padding: 8px; background-color: #0a0a0a; border: 1px solid #333;")
         self.lbl_cronometro.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -136,105 +195,101 @@ class Tablero(QMainWindow):
         # Añadir layouts
         layout_principal.addLayout(layout_centro, stretch=3)
         layout_principal.addLayout(panel_lateral, stretch=1)
+
+        # El lienzo no pide tamaño por celda: la ventana arranca ocupando
+        # la mayor parte de la pantalla y el tablero se ajusta a ella
+        if self.lienzo is not None and self.screen() is not None:
+            pantalla = self.screen().availableGeometry()
+            self.resize(int(pantalla.width() * 0.8), int(pantalla.height() * 0.8))
         
         
+    def es_grande(self):
+        """True si la matriz se dibuja con LienzoTablero."""
+        return self.filas * self.columnas > MAX_CELDAS_QLABEL
+
         # ✅ Métodos para controlar el cronómetro
     def iniciar_cronometro(self):
         """Inicia el cronómetro cuando comienza el juego."""
         self.cronometro.iniciar()
     
     def pausar_cronometro(self):
-        """Pausa el cronómetro."""
+        """Pausa el cronómetro (y deja visible el valor exacto)."""
         self.cronometro.pausar()
+        self.actualizar_display_cronometro(forzar=True)
     
     def reiniciar_cronometro(self):
         """Reinicia el cronómetro."""
         self.cronometro.reiniciar()
-        self.lbl_cronometro.setText("⏱️ 00:00.000")
-    
-    def actualizar_display_cronometro(self):
-        """Actualiza el display del cronómetro en la UI."""
-        tiempo_formateado = self.cronometro.tiempo_formateado()
-        self.lbl_cronometro.setText(f"⏱️ {tiempo_formateado}")
+        self._ultimo_refresco_cronometro = None
+        self.lbl_cronometro.setText(f"⏱️ {self._formatear_cronometro(0)}")
+
+    def obtener_tiempo_cronometro(self):
+        """Segundos medidos por el cronómetro."""
+        return self.cronometro.tiempo()
+
+    def obtener_tiempo_formateado(self):
+        return self.cronometro.tiempo_formateado()
+
+    def _formatear_cronometro(self, segundos):
+        return self.cronometro.tiempo_formateado(segundos)
+
+    def actualizar_display_cronometro(self, forzar=False):
+        """
+        Refresca el cronómetro en pantalla. Lo llama el bucle del juego en
+        cada disparo: hace setText como mucho una vez por
+        1/frecuencia_cronometro segundos reales (a cualquier velocidad de
+        juego) y nada si está pausado.
+        """
+        if not forzar and not self.cronometro.corriendo():
+            return
+        ahora = reloj()
+        ultimo = self._ultimo_refresco_cronometro
+        # Margen del 10%: el timer puede disparar un poco antes de tiempo
+        if not forzar and ultimo is not None and ahora - ultimo < 0.9 / self.frecuencia_cronometro:
+            return
+        self._ultimo_refresco_cronometro = ahora
+        texto = f"⏱️ {self._formatear_cronometro(self.cronometro.tiempo())}"
+        if texto != self.lbl_cronometro.text():
+            self.lbl_cronometro.setText(texto)
     
     def resaltar_celda(self, fila, col):
-        """Redibujar todas las celdas según el estado actual del juego"""
-        for f in range(self.filas):
-            for c in range(self.columnas):
-                contenido = f"[{f},{c}]"  # default
-
-                # Si hay game_controller, pedimos contenido actual
-                if self.game_controller is not None:
-                    # ¿Hay moneda?
-                    if hasattr(self.game_controller, 'monedas'):
-                        for m in self.game_controller.monedas:
-                            if m.fila == f and m.col == c:
-                                contenido = m.simbolo
-
-                    # ¿Hay avatar?
-                    if hasattr(self.game_controller, 'avatars'):
-                        for a in self.game_controller.avatars:
-                            if a.fila == f and a.col == c:
-                                contenido = a.simbolo if hasattr(a, "simbolo") else "A"
-
-                    # ¿Hay rook?
-                    if hasattr(self.game_controller, 'rooks'):
-                        for r in self.game_controller.rooks:
-                            if r.fila == f and r.col == c:
-                                contenido = r.simbolo if hasattr(r, "simbolo") else "R"
-
-                # Actualizar texto
-                self.celdas[f][c].setText(contenido)
-
-                # Aplicar estilos
-                # ¿Es fila roja?
-                if (f, c) in self.celdas_rojas:
-                    self.celdas[f][c].setStyleSheet("""
-                        QLabel {
-                            background-color: #940901;
-                            color: #630601;
-                            border: 2px inset #630601;
-                            border-radius: 3px;
-                            padding: 5px;
-                        }
-                    """)
-                    continue
-
-                # Estilo normal
-                self.celdas[f][c].setStyleSheet("""
-                    QLabel {
-                        background-color: #1c1c1c;
-                        color: #6b8e23;
-                        border: 2px inset #3d3d3d;
-                        border-radius: 3px;
-                        padding: 5px;
-                    }
-                """)
-
-        # Resaltar celda seleccionada
-        self.celdas[fila][col].setStyleSheet("""
-            QLabel {
-                background-color: #3a2a2a;
-                color: #ffcc00;
-                border: 3px solid #ffcc00;
-                border-radius: 3px;
-                padding: 5px;
-            }
-        """)
+        """Mueve el resaltado: solo se re-estilan la celda anterior y la nueva"""
+        anterior = self._celda_resaltada
+        self._celda_resaltada = (fila, col)
+        if anterior is not None:
+            self._aplicar_estado(*anterior)
+        self._aplicar_estado(fila, col)
 
     def fila_roja(self, fila):
         """Marca toda una fila como roja (zona peligrosa)"""
-        self.celdas_rojas = [(fila, c) for c in range(self.columnas)]
-        for c in range(self.columnas):
-            self.celdas[fila][c].setStyleSheet("""
-                QLabel {
-                    background-color: #940901;
-                    color: #630601;
-                    border: 2px inset #630601;
-                    border-radius: 3px;
-                    padding: 5px;
-                }
-            """)
+        anteriores = self.celdas_rojas
+        self.celdas_rojas = {(fila, c) for c in range(self.columnas)}
+        for f, c in anteriores | self.celdas_rojas:
+            self._aplicar_estado(f, c)
+
+    def _estado_celda(self, fila, col):
+        """Estado visual de la celda: seleccionada > roja > ocupada > normal"""
+        if (fila, col) == self._celda_resaltada:
+            return "seleccionada"
+        if (fila, col) in self.celdas_rojas:
+            return "roja"
+        if self._textos[fila][col] != self.textos_base[fila][col]:
+            return "ocupada"
+        return "normal"
+
+    def _aplicar_estado(self, fila, col):
+        """Re-pule el widget solo si su estado cambió"""
+        estado = self._estado_celda(fila, col)
+        if self._estados[fila][col] == estado:
+            return
+        self._estados[fila][col] = estado
+        if self.lienzo is not None:
+            self.lienzo.actualizar_celda(fila, col)
+            return
+        celda = self.celdas[fila][col]
+        celda.setProperty("estado", estado)
+        celda.style().unpolish(celda)
+        celda.style().polish(celda)
         
     def keyPressEvent(self, event):
         """Maneja las teclas presionadas"""
@@ -288,6 +343,18 @@ class Tablero(QMainWindow):
                     self.game_controller.recoger_moneda_en(self.sel_fila, self.sel_columna)
             return
         
+        # Pausar / reanudar (tecla P)
+        elif tecla == Qt.Key.Key_P:
+            if self.game_controller is not None:
+                self.game_controller.pausar_o_reanudar()
+            return
+
+        # Cambiar velocidad del juego (tecla V)
+        elif tecla == Qt.Key.Key_V:
+            if self.game_controller is not None:
+                self.game_controller.cambiar_velocidad()
+            return
+
         # Guardar y salir (ESC)
         elif tecla == Qt.Key.Key_Escape:
             if self.game_controller is not None:
@@ -310,11 +377,79 @@ class Tablero(QMainWindow):
     def actualizar_celda(self, fila, col, texto):
         """Actualizar el contenido de una celda específica"""
         if 0 <= fila < self.filas and 0 <= col < self.columnas:
-            self.celdas[fila][col].setText(texto)
+            self._pintar(fila, col, texto)
+            # Se pintó fuera de renderizar(): el próximo frame repasa todo
+            self._frame_valido = False
+
+    def _pintar(self, fila, col, texto):
+        """setText solo si el texto de la celda realmente cambia."""
+        if self._textos[fila][col] != texto:
+            self._textos[fila][col] = texto
+            if self.lienzo is not None:
+                self.lienzo.actualizar_celda(fila, col)
+            else:
+                self._mostrar_en_celda(fila, col, texto)
+            self._aplicar_estado(fila, col)
+
+    def _mostrar_en_celda(self, fila, col, texto):
+        """Pone el sprite del símbolo en el QLabel o, si no tiene imagen, el texto."""
+        celda = self.celdas[fila][col]
+        sprite = None
+        if self.atlas is not None:
+            area = celda.contentsRect()
+            sprite = self.atlas.pixmap(texto, area.width(), area.height())
+        if sprite is not None:
+            celda.setPixmap(sprite)
+        else:
+            celda.setText(texto)
+
+    def closeEvent(self, event):
+        # Cerrar la ventana es una salida normal: la partida no se retoma
+        if self.game_controller is not None:
+            self.game_controller.cerrar_sesion()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Los sprites se re-escalan una vez que el layout fijó el tamaño nuevo
+        if self.atlas is not None and self.lienzo is None and not self._reaplicar_pendiente:
+            self._reaplicar_pendiente = True
+            QTimer.singleShot(0, self._reaplicar_sprites)
+
+    def _reaplicar_sprites(self):
+        self._reaplicar_pendiente = False
+        for f in range(self.filas):
+            for c in range(self.columnas):
+                if self.atlas.tiene(self._textos[f][c]):
+                    self._mostrar_en_celda(f, c, self._textos[f][c])
+
+    def renderizar(self, frame):
+        """
+        Pinta el estado del juego tocando solo las celdas que cambiaron.
+
+        frame es {(fila, col): simbolo} con las celdas ocupadas; el resto
+        muestra su texto base. Se compara con el frame anterior; Qt junta
+        los update() de las celdas cambiadas en un único repintado que
+        cubre solo esas celdas.
+        """
+        if self._frame_valido:
+            anterior = self._frame
+            for (f, c) in anterior.keys() - frame.keys():
+                self._pintar(f, c, self.textos_base[f][c])
+            for (f, c), simbolo in frame.items():
+                if anterior.get((f, c)) != simbolo:
+                    self._pintar(f, c, simbolo)
+        else:
+            for f in range(self.filas):
+                for c in range(self.columnas):
+                    self._pintar(f, c, frame.get((f, c), self.textos_base[f][c]))
+
+        self._frame = frame
+        self._frame_valido = True
     
     def obtener_celda(self, fila, col):
         """Obtener el widget de una celda específica"""
-        if 0 <= fila < self.filas and 0 <= col < self.columnas:
+        if self.lienzo is None and 0 <= fila < self.filas and 0 <= col < self.columnas:
             return self.celdas[fila][col]
         return None
     
@@ -327,7 +462,7 @@ class Tablero(QMainWindow):
         """Limpia todas las celdas del tablero"""
         for f in range(self.filas):
             for c in range(self.columnas):
-                self.actualizar_celda(f, c, f"[{f},{c}]")
+                self.actualizar_celda(f, c, self.textos_base[f][c])
     
     def actualizar_panel(self, rook_name, costo, economia):
         """Actualiza el panel lateral con información"""
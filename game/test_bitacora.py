@@ -0,0 +1,100 @@
+"""
+Pruebas de la bitácora de sesión: una partida grabada se reproduce igual.
+
+Uso:
+    python -m pytest game/test_bitacora.py
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bitacora import Bitacora, nueva_ruta, reproducir  # noqa: E402
+from motor import MotorJuego  # noqa: E402
+
+
+def grabar(ruta, semilla=11, segundos=90):
+    """Juega una partida con rooks, monedas y un checkpoint, grabándola en `ruta`."""
+    bitacora = Bitacora(str(ruta))
+    motor = MotorJuego(7, 4, verbose=False, semilla=semilla, bitacora=bitacora)
+    motor.iniciar()
+    for col in range(motor.columnas):
+        motor.colocar_rook(1, col, 1)
+    for paso in range(segundos * 2):
+        motor.step(0.5)
+        for moneda in list(motor.monedas):
+            motor.recoger_moneda_en(moneda.fila, moneda.col)
+        if paso == segundos:
+            # Como al cargar una partida guardada a mitad de la sesión
+            motor.restaurar_estado(motor.exportar_estado())
+    bitacora.cerrar()
+    return motor
+
+
+def test_reproducir_partida_grabada(tmp_path):
+    ruta = tmp_path / "partida.jsonl"
+    original = grabar(ruta)
+    cabecera, entradas = Bitacora.leer(ruta)
+    assert cabecera["semilla"] == 11 and (cabecera["filas"], cabecera["columnas"]) == (7, 4)
+    assert {e[1] for e in entradas} >= {"r", "m", "e", "a", "c"}
+
+    motor, diferencia = reproducir(cabecera, entradas)
+    assert diferencia is None
+    assert motor.economia == original.economia
+    assert len(motor.avatars) == len(original.avatars)
+
+
+def test_reproducir_detecta_diferencias(tmp_path):
+    ruta = tmp_path / "partida.jsonl"
+    grabar(ruta)
+    cabecera, entradas = Bitacora.leer(ruta)
+    # Un spawn de avatar alterado
+    i = next(i for i, e in enumerate(entradas) if e[1] == "a")
+    entradas[i] = entradas[i][:2] + [entradas[i][2], (entradas[i][3] + 1) % 4] + entradas[i][4:]
+    _, diferencia = reproducir(cabecera, entradas)
+    assert diferencia is not None and diferencia[1] == entradas[i]
+
+    # Eventos de más al final
+    _, entradas = Bitacora.leer(ruta)
+    extra = [entradas[-1][0], "c", 0, 0, 25]
+    _, diferencia = reproducir(cabecera, entradas + [extra])
+    assert diferencia is not None and diferencia[1:] == (extra, None)
+
+
+def test_una_sola_cabecera_por_archivo(tmp_path):
+    ruta = tmp_path / "partida.jsonl"
+    grabar(ruta, segundos=10)
+    with pytest.raises(FileExistsError):
+        Bitacora(str(ruta))
+
+    # Un archivo con dos sesiones pegadas no se acepta
+    contenido = ruta.read_text(encoding="utf-8")
+    ruta.write_text(contenido + contenido, encoding="utf-8")
+    with pytest.raises(ValueError):
+        Bitacora.leer(ruta)
+
+
+def test_version_no_soportada(tmp_path):
+    ruta = tmp_path / "partida.jsonl"
+    grabar(ruta, segundos=10)
+    cabecera, entradas = Bitacora.leer(ruta)
+    with pytest.raises(ValueError):
+        reproducir({**cabecera, "version": 99}, entradas)
+
+
+def test_nueva_ruta_rota_las_viejas(tmp_path):
+    for i in range(5):
+        (tmp_path / f"partida_2024010{i}_000000_aaaaaaaa.jsonl").write_text("{}\n")
+    (tmp_path / "otra_cosa.txt").write_text("")
+
+    ruta = nueva_ruta(tmp_path, conservar=3)
+    restantes = sorted(p.name for p in tmp_path.glob("partida_*.jsonl"))
+    # Con la nueva quedan como mucho 3: se borraron las más viejas
+    assert restantes == ["partida_20240103_000000_aaaaaaaa.jsonl",
+                         "partida_20240104_000000_aaaaaaaa.jsonl"]
+    assert (tmp_path / "otra_cosa.txt").exists()
+    assert os.path.dirname(ruta) == str(tmp_path)
+    assert os.path.basename(ruta) > restantes[-1]
+    assert nueva_ruta(tmp_path, conservar=3) != ruta
@@ -0,0 +1,105 @@
+"""
+Pruebas del combate por carril: cada rook pelea solo con la celda de enfrente.
+
+Uso:
+    python -m pytest game/test_combate.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from avatars import Flechador, Escudero  # noqa: E402
+from motor import MotorJuego  # noqa: E402
+from rooks import SandRook  # noqa: E402
+
+
+def preparar(*entidades):
+    motor = MotorJuego(verbose=False, semilla=1)
+    for entidad in entidades:
+        if isinstance(entidad, SandRook):
+            motor.agregar_rook(entidad)
+        else:
+            motor.agregar_avatar(entidad)
+    return motor
+
+
+def listos(*unidades):
+    """Deja el ataque de las unidades a punto de dispararse."""
+    for unidad in unidades:
+        unidad.tiempo_desde_ataque = unidad.vel_ataque - 1
+
+
+def test_solo_pelea_la_celda_de_enfrente():
+    rook = SandRook(1, 0)
+    lejos, al_lado = Flechador(3, 0), Flechador(2, 1)
+    motor = preparar(rook, lejos, al_lado)
+    listos(rook, lejos, al_lado)
+    motor.combate()
+    assert rook.vida == rook.vida_inicial
+    assert lejos.vida == lejos.vida_inicial
+    assert al_lado.vida == al_lado.vida_inicial
+
+
+def test_golpes_simultaneos():
+    rook, avatar = SandRook(1, 0), Flechador(2, 0)
+    motor = preparar(rook, avatar)
+    rook.vida = avatar.ataque
+    avatar.vida = rook.ataque
+    listos(rook, avatar)
+    motor.combate()
+    # Los dos golpean en el mismo tick aunque ambos queden muertos
+    assert not rook.esta_vivo() and not avatar.esta_vivo()
+
+
+def test_cooldown_de_la_rook_avanza_una_vez_por_tick():
+    rook = SandRook(1, 0)
+    primero, segundo = Escudero(2, 0), Escudero(2, 0)
+    motor = preparar(rook, primero, segundo)
+    for _ in range(rook.vel_ataque - 1):
+        motor.combate()
+        assert rook.tiempo_desde_ataque < rook.vel_ataque
+    motor.combate()
+    # Con dos avatars apilados golpea una sola vez, al primero vivo
+    assert primero.vida == primero.vida_inicial - rook.ataque
+    assert segundo.vida == segundo.vida_inicial
+
+
+def test_rook_ataca_al_primer_avatar_vivo():
+    rook = SandRook(1, 0)
+    muerto, vivo = Flechador(2, 0), Flechador(2, 0)
+    muerto.vida = 0
+    motor = preparar(rook, muerto, vivo)
+    listos(rook)
+    motor.combate()
+    assert vivo.vida == vivo.vida_inicial - rook.ataque
+
+
+def test_avatar_derrotado_paga_y_sale_de_la_grilla():
+    rook, avatar = SandRook(1, 0), Flechador(2, 0)
+    motor = preparar(rook, avatar)
+    avatar.vida = rook.ataque
+    listos(rook)
+    motor.combate()
+    assert motor.economia == MotorJuego.RECOMPENSA_AVATAR
+
+    motor.limpiar_muertos()
+    assert motor.avatars == []
+    assert not motor.grilla.hay_avatar(2, 0)
+    assert motor.rooks == [rook]
+
+
+def test_rook_destruida_libera_la_celda():
+    rook, avatar = SandRook(1, 0), Flechador(2, 0)
+    motor = preparar(rook, avatar)
+    rook.vida = avatar.ataque
+    listos(avatar)
+    motor.combate()
+    motor.limpiar_muertos()
+    assert motor.rooks == []
+    assert motor.grilla.rook_en(1, 0) is None
+
+    # Sin la rook, el avatar vuelve a avanzar
+    avatar.tiempo_desde_avance = avatar.vel_avance
+    motor.mover_avatars()
+    assert (avatar.fila, avatar.col) == (1, 0)
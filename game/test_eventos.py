@@ -0,0 +1,80 @@
+"""
+Pruebas de la cola de eventos del motor (PlanificadorEventos).
+
+Uso:
+    python -m pytest game/test_eventos.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from eventos import MONEDA, SPAWN, TICK, TRANSICION, PlanificadorEventos  # noqa: E402
+from motor import MotorJuego  # noqa: E402
+
+
+def vaciar(eventos):
+    tipos = []
+    while (tiempo := eventos.proximo()) is not None:
+        tipos.append((tiempo, eventos.extraer()))
+    return tipos
+
+
+def test_orden_por_tiempo_y_prioridad():
+    eventos = PlanificadorEventos()
+    eventos.programar(TRANSICION, 1000)
+    eventos.programar(MONEDA, 1000)
+    eventos.programar(SPAWN, 1000)
+    eventos.programar(TICK, 1500)
+    assert vaciar(eventos) == [(1000, SPAWN), (1000, MONEDA), (1000, TRANSICION), (1500, TICK)]
+    assert eventos.extraer() is None
+
+
+def test_reprogramar_reemplaza():
+    eventos = PlanificadorEventos()
+    eventos.programar(SPAWN, 500)
+    eventos.programar(SPAWN, 2000)
+    eventos.programar(TICK, 1000)
+    assert eventos.pendiente(SPAWN) == 2000
+    assert vaciar(eventos) == [(1000, TICK), (2000, SPAWN)]
+
+
+def test_cancelar():
+    eventos = PlanificadorEventos()
+    eventos.programar(SPAWN, 500)
+    eventos.programar(TICK, 1000)
+    eventos.cancelar(SPAWN)
+    eventos.cancelar(MONEDA)    # no estaba programado: no pasa nada
+    assert eventos.pendiente(SPAWN) is None
+    assert eventos.proximo() == 1000
+    assert vaciar(eventos) == [(1000, TICK)]
+
+
+def test_exportar_y_restaurar():
+    eventos = PlanificadorEventos()
+    eventos.programar(TICK, 1200)
+    eventos.programar(MONEDA, 1200)
+    eventos.programar(SPAWN, 900)
+    eventos.cancelar(SPAWN)
+    pendientes = eventos.exportar(1000)
+    assert pendientes == {TICK: 200, MONEDA: 200}
+
+    otra = PlanificadorEventos()
+    otra.restaurar(pendientes, 5000)
+    assert vaciar(otra) == [(5200, TICK), (5200, MONEDA)]
+
+
+def test_motor_dispara_en_orden():
+    motor = MotorJuego(verbose=False, semilla=1)
+    disparados = []
+    original = motor._disparar
+
+    def anotar(tipo):
+        disparados.append((motor.tiempo_ms, tipo))
+        original(tipo)
+
+    motor._disparar = anotar
+    motor.iniciar()
+    motor.step(30)
+    assert disparados == sorted(disparados, key=lambda e: e[0])
+    assert [t for t, tipo in disparados if tipo == TICK] == list(range(motor.TICK_MS, 30001, motor.TICK_MS))
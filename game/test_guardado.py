@@ -0,0 +1,140 @@
+"""
+Pruebas del guardado de partidas: escritura atómica, ida y vuelta del
+estado del motor y carga de formatos anteriores.
+
+Uso:
+    python -m pytest game/test_guardado.py
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bitacora import Bitacora  # noqa: E402
+import guardado as modulo_guardado  # noqa: E402
+from guardado import Guardado, escribir_atomico  # noqa: E402
+from motor import MotorJuego  # noqa: E402
+
+# savegame.json tal como lo escribía la versión anterior: sin filas/columnas,
+# ni cooldowns, ni eventos, ni RNG
+LEGADO = {
+    "economia": 150,
+    "nivel_actual": 1,
+    "oleada_actual": 2,
+    "game_over": False,
+    "avatars": [{"tipo": "Flechador", "fila": 8, "col": 2, "vida": 5}],
+    "rooks": [{"tipo": "SandRook", "fila": 0, "col": 1, "vida": 10}],
+    "monedas": [{"fila": 3, "col": 3, "valor": 25}]
+}
+
+
+def escribir_legado(carpeta, safe_exit=True):
+    with open(carpeta / "savegame.json", "w") as f:
+        json.dump(LEGADO, f, indent=4)
+    with open(carpeta / "savegame_meta.json", "w") as f:
+        json.dump({"safe_exit": safe_exit}, f)
+
+
+def test_restaurar_partida_legado(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    escribir_legado(tmp_path)
+
+    partida = Guardado(tmp_path / "usuario").cargar()
+    assert partida["version"] == 0 and partida["salida_segura"]
+
+    bitacora = Bitacora(str(tmp_path / "partida.jsonl"))
+    motor = MotorJuego(verbose=False, semilla=1, bitacora=bitacora)
+    motor.iniciar()
+    motor.restaurar_estado(partida["estado"])
+    bitacora.cerrar()
+
+    assert motor.economia == 150
+    assert [(a.fila, a.col) for a in motor.avatars] == [(8, 2)]
+    assert [(r.fila, r.col) for r in motor.rooks] == [(0, 1)]
+    assert len(motor.monedas) == 1
+
+
+def test_marcar_salida_partida_legado(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    escribir_legado(tmp_path)
+
+    guardado = Guardado(tmp_path / "usuario")
+    guardado.marcar_salida(False)
+
+    # Queda migrada al formato binario, con el tamaño por defecto
+    partida = guardado.cargar()
+    assert guardado.ruta.exists()
+    assert not partida["salida_segura"]
+    assert (partida["estado"]["filas"], partida["estado"]["columnas"]) == (9, 5)
+    assert partida["estado"]["economia"] == 150
+
+
+def test_escribir_atomico(tmp_path):
+    ruta = tmp_path / "sub" / "partida.avr"
+    escribir_atomico(ruta, b"uno")
+    escribir_atomico(ruta, b"dos")
+    assert ruta.read_bytes() == b"dos"
+    assert os.listdir(ruta.parent) == ["partida.avr"]
+
+
+def test_escribir_atomico_falla_sin_romper_el_anterior(tmp_path, monkeypatch):
+    ruta = tmp_path / "partida.avr"
+    escribir_atomico(ruta, b"anterior")
+
+    def falla(origen, destino):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(modulo_guardado.os, "replace", falla)
+    with pytest.raises(OSError):
+        escribir_atomico(ruta, b"nueva")
+    assert ruta.read_bytes() == b"anterior"
+    # El temporal no queda tirado en la carpeta
+    assert os.listdir(tmp_path) == ["partida.avr"]
+
+
+def test_guardar_y_cargar_ida_y_vuelta(tmp_path):
+    motor = MotorJuego(verbose=False, semilla=4)
+    motor.iniciar()
+    motor.colocar_rook(1, 2, 1)
+    motor.step(12.3)
+    estado = motor.exportar_estado()
+
+    guardado = Guardado(tmp_path)
+    guardado.guardar(estado, salida_segura=True)
+    partida = guardado.cargar()
+    assert partida["salida_segura"]
+    assert partida["estado"] == estado
+
+    # El motor restaurado sigue la misma partida que el original
+    copia = MotorJuego(verbose=False, semilla=99)
+    copia.iniciar()
+    copia.restaurar_estado(partida["estado"])
+    motor.step(40)
+    copia.step(40)
+    assert copia.exportar_estado() == motor.exportar_estado()
+
+
+def test_marcar_salida(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)    # sin savegame.json del formato anterior
+    motor = MotorJuego(verbose=False, semilla=4)
+    motor.iniciar()
+    estado = motor.exportar_estado()
+
+    guardado = Guardado(tmp_path)
+    guardado.marcar_salida(True)    # sin partida: no crea nada
+    assert guardado.cargar() is None
+
+    guardado.guardar(estado, salida_segura=True)
+    guardado.marcar_salida(False)
+    partida = guardado.cargar()
+    assert not partida["salida_segura"]
+    assert partida["estado"] == estado
+
+
+def test_partida_corrupta(tmp_path):
+    guardado = Guardado(tmp_path)
+    guardado.ruta.write_bytes(b"basura")
+    assert guardado.cargar() is None
@@ -0,0 +1,100 @@
+"""
+Pruebas del motor sin interfaz: corre sin Qt y con semilla es determinista.
+
+Uso:
+    python -m pytest game/test_motor.py
+"""
+import os
+import subprocess
+import sys
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, CARPETA)
+
+from bitacora import Bitacora  # noqa: E402
+from motor import MotorJuego  # noqa: E402
+
+
+class Observador:
+    """Anota los eventos al_* que recibe."""
+
+    def __init__(self):
+        self.eventos = []
+
+    def al_game_over(self):
+        self.eventos.append("game_over")
+
+    def al_cambiar_economia(self, economia):
+        self.eventos.append(("economia", economia))
+
+
+def jugar(semilla, segundos=120):
+    """Partida con una rook por carril; devuelve (motor, entradas de la bitácora)."""
+    bitacora = Bitacora()
+    motor = MotorJuego(verbose=False, semilla=semilla, bitacora=bitacora)
+    motor.iniciar()
+    for col in range(motor.columnas):
+        motor.colocar_rook(1, col, 1)
+    for _ in range(segundos * 4):
+        motor.step(0.25)
+        for moneda in list(motor.monedas):
+            motor.recoger_moneda_en(moneda.fila, moneda.col)
+    return motor, bitacora.entradas
+
+
+def test_motor_no_importa_qt():
+    codigo = "import sys, motor; sys.exit('PySide6' in sys.modules)"
+    resultado = subprocess.run([sys.executable, "-c", codigo], cwd=CARPETA)
+    assert resultado.returncode == 0
+
+
+def test_misma_semilla_misma_partida():
+    motor_a, entradas_a = jugar(7)
+    motor_b, entradas_b = jugar(7)
+    assert entradas_a == entradas_b
+    assert motor_a.exportar_estado() == motor_b.exportar_estado()
+
+
+def test_semilla_distinta_otra_partida():
+    _, entradas_a = jugar(7)
+    _, entradas_b = jugar(8)
+    spawns_a = [e for e in entradas_a if e[1] in ("a", "c")]
+    spawns_b = [e for e in entradas_b if e[1] in ("a", "c")]
+    assert spawns_a and spawns_a != spawns_b
+
+
+def test_step_en_partes_igual_que_de_una_vez():
+    motor_a = MotorJuego(verbose=False, semilla=3)
+    motor_b = MotorJuego(verbose=False, semilla=3)
+    motor_a.iniciar()
+    motor_b.iniciar()
+    for _ in range(600):
+        motor_a.step(0.05)
+    motor_b.step(30)
+    assert motor_a.exportar_estado() == motor_b.exportar_estado()
+
+
+def test_sin_defensa_termina_en_game_over():
+    observador = Observador()
+    motor = MotorJuego(observador=observador, verbose=False, semilla=1)
+    motor.iniciar()
+    for _ in range(3600):
+        motor.step(1)
+        if motor.terminado():
+            break
+    assert motor.game_over and not motor.victoria
+    assert observador.eventos.count("game_over") == 1
+
+
+def test_colocar_rook_cobra_y_avisa():
+    observador = Observador()
+    motor = MotorJuego(observador=observador, verbose=False, semilla=1)
+    motor.iniciar()
+    economia = motor.economia
+    assert motor.colocar_rook(1, 0, 1)
+    assert motor.economia == economia - 50
+    assert ("economia", economia - 50) in observador.eventos
+    # Celda ocupada o tipo inválido: no se cobra nada
+    assert not motor.colocar_rook(1, 0, 2)
+    assert not motor.colocar_rook(1, 1, 9)
+    assert motor.economia == economia - 50
@@ -0,0 +1,167 @@
+"""
+Pruebas de la grilla de ocupación (GrillaOcupacion).
+
+Uso:
+    python -m pytest game/test_ocupacion.py
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from avatars import Flechador, Escudero  # noqa: E402
+from moneda import Moneda  # noqa: E402
+from motor import MotorJuego  # noqa: E402
+from ocupacion import CeldasLibres, GrillaOcupacion  # noqa: E402
+from rooks import SandRook  # noqa: E402
+
+
+def test_avatars_apilados_y_movimiento():
+    grilla = GrillaOcupacion(9, 5)
+    a, b = Flechador(4, 2), Escudero(4, 2)
+    grilla.agregar_avatar(a)
+    grilla.agregar_avatar(b)
+    assert list(grilla.avatars_en(4, 2)) == [a, b]
+
+    grilla.mover_avatar(a, 3, 2)
+    assert (a.fila, a.col) == (3, 2)
+    assert list(grilla.avatars_en(3, 2)) == [a]
+    assert list(grilla.avatars_en(4, 2)) == [b]
+
+    grilla.quitar_avatar(b)
+    assert not grilla.hay_avatar(4, 2)
+    assert not grilla.ocupada(4, 2)
+    assert grilla.ocupada(3, 2)
+
+
+def test_rooks_y_monedas():
+    grilla = GrillaOcupacion(9, 5)
+    rook = SandRook(1, 0)
+    moneda = Moneda(2, 3, 25)
+    grilla.agregar_rook(rook)
+    grilla.agregar_moneda(moneda)
+    assert grilla.rook_en(1, 0) is rook
+    assert grilla.moneda_en(2, 3) is moneda
+    assert grilla.rook_en(0, 0) is None
+
+    grilla.quitar_rook(rook)
+    grilla.quitar_moneda(moneda)
+    assert grilla.rook_en(1, 0) is None and not grilla.ocupada(1, 0)
+    assert grilla.moneda_en(2, 3) is None and not grilla.ocupada(2, 3)
+
+
+def test_motor_mantiene_la_grilla_al_dia():
+    motor = MotorJuego(verbose=False, semilla=5)
+    motor.iniciar()
+    for _ in range(300):
+        motor.step(1)
+        if motor.terminado():
+            break
+        for avatar in motor.avatars:
+            assert avatar in motor.grilla.avatars_en(avatar.fila, avatar.col)
+        for rook in motor.rooks:
+            assert motor.grilla.rook_en(rook.fila, rook.col) is rook
+        for moneda in motor.monedas:
+            assert motor.grilla.moneda_en(moneda.fila, moneda.col) is moneda
+
+
+def test_rook_frena_al_avatar():
+    motor = MotorJuego(verbose=False, semilla=1)
+    avatar = Flechador(3, 0)
+    motor.agregar_avatar(avatar)
+    motor.agregar_rook(SandRook(2, 0))
+    avatar.tiempo_desde_avance = avatar.vel_avance
+    motor.mover_avatars()
+    assert (avatar.fila, avatar.col) == (3, 0)
+
+
+def test_colocar_rook_sobre_avatar_o_moneda():
+    motor = MotorJuego(verbose=False, semilla=1)
+    motor.economia = 1000
+    motor.agregar_avatar(Flechador(3, 0))
+    motor.agregar_moneda(Moneda(3, 1, 50))
+    assert not motor.colocar_rook(3, 0, 1)
+    assert not motor.colocar_rook(3, 1, 1)
+    assert motor.economia == 1000
+
+    assert motor.recoger_moneda_en(3, 1)
+    assert motor.economia == 1050
+    assert motor.colocar_rook(3, 1, 1)
+
+
+def lista_de(libres):
+    """Celdas libres recorriendo el tablero fila por fila."""
+    return [(f, c) for f in range(libres.filas) for c in range(libres.columnas)
+            if (f, c) in libres]
+
+
+def test_celdas_libres_empieza_lleno():
+    libres = CeldasLibres(3, 4)
+    assert len(libres) == 12
+    assert [libres[k] for k in range(12)] == lista_de(libres)
+    assert (3, 0) not in libres and (0, -1) not in libres
+
+
+def test_celdas_libres_agregar_y_quitar():
+    libres = CeldasLibres(3, 4)
+    libres.quitar((0, 0))
+    libres.quitar((0, 0))
+    libres.quitar((1, 2))
+    assert len(libres) == 10
+    assert (0, 0) not in libres
+    assert libres[0] == (0, 1)
+    assert libres[5] == (1, 3)
+
+    libres.agregar((0, 0))
+    libres.agregar((0, 0))
+    assert len(libres) == 11 and libres[0] == (0, 0)
+
+    # Fuera del tablero no cambia nada
+    libres.quitar((5, 5))
+    libres.agregar((-1, 0))
+    assert len(libres) == 11
+
+
+def test_celdas_libres_indice_fuera_de_rango():
+    libres = CeldasLibres(2, 2)
+    for celda in lista_de(libres):
+        libres.quitar(celda)
+    assert len(libres) == 0
+    for k in (0, -1):
+        with pytest.raises(IndexError):
+            libres[k]
+
+
+def test_celdas_libres_igual_que_la_lista():
+    rng = random.Random(0)
+    libres = CeldasLibres(9, 5)
+    for _ in range(500):
+        celda = (rng.randrange(9), rng.randrange(5))
+        if rng.random() < 0.5:
+            libres.quitar(celda)
+        else:
+            libres.agregar(celda)
+        lista = lista_de(libres)
+        assert len(libres) == len(lista)
+        assert [libres[k] for k in range(len(libres))] == lista
+        # rng.choice elige la misma celda que sobre la lista
+        if lista:
+            semilla = rng.random()
+            assert random.Random(semilla).choice(libres) == random.Random(semilla).choice(lista)
+
+
+def test_grilla_lleva_las_celdas_libres():
+    grilla = GrillaOcupacion(4, 3)
+    avatar = Flechador(2, 1)
+    grilla.agregar_avatar(avatar)
+    grilla.agregar_rook(SandRook(0, 0))
+    grilla.agregar_moneda(Moneda(3, 2, 25))
+    libres = grilla.celdas_libres()
+    assert len(libres) == 9
+    assert (2, 1) not in libres and (0, 0) not in libres and (3, 2) not in libres
+
+    grilla.mover_avatar(avatar, 1, 1)
+    assert (2, 1) in libres and (1, 1) not in libres
@@ -0,0 +1,333 @@
+"""
+Benchmarks del juego con semillas fijas.
+
+Mide, sobre un GameController real con Qt en modo offscreen:
+  - throughput de GameController.tick con distintas cantidades de avatars
+  - latencia de spawn_coin y colocar_rook
+  - costo de refrescar_tablero y resaltar_celda
+  - ida y vuelta de guardar_partida / cargar_partida
+
+Los resultados se escriben en JSON para poder comparar corridas.
+
+Uso:
+    python tools/benchmark.py
+    python tools/benchmark.py --salida antes.json
+    python tools/benchmark.py --salida despues.json --comparar antes.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Los módulos del juego usan imports planos (se ejecutan desde game/)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "game"))
+
+# Sin ventana: Qt dibuja en memoria
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from tablero import Tablero  # noqa: E402
+from controlador import GameController  # noqa: E402
+from motor import CLASES_AVATARS, TIPOS_ROOK  # noqa: E402
+from cronometro import reloj  # noqa: E402
+
+VERSION = 1
+CANTIDADES_AVATARS = (0, 50, 500, 5000)
+TICKS_POR_MUESTRA = 10
+ECONOMIA_ILIMITADA = 10 ** 9
+
+
+# --------------------------------------------
+# MEDICIÓN
+# --------------------------------------------
+class RelojManual:
+    """Reloj para el BuclePasoFijo: cada tick avanza exactamente 1 s."""
+
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def medir(funcion, repeticiones, preparar=None, operaciones=1):
+    """
+    Cronometra `funcion` `repeticiones` veces con el reloj del juego.
+
+    preparar() se ejecuta antes de cada muestra, fuera del tiempo medido,
+    y lo que devuelva se pasa como argumentos a funcion. Si cada muestra
+    hace varias operaciones, los tiempos se reportan por operación.
+    """
+    muestras = []
+    for _ in range(repeticiones):
+        args = preparar() if preparar is not None else ()
+        inicio = reloj()
+        funcion(*args)
+        muestras.append((reloj() - inicio) / operaciones)
+
+    mediana = statistics.median(muestras)
+    return {
+        "muestras": repeticiones,
+        "operaciones_por_muestra": operaciones,
+        "min_us": min(muestras) * 1e6,
+        "mediana_us": mediana * 1e6,
+        "media_us": statistics.fmean(muestras) * 1e6,
+        "desviacion_us": statistics.pstdev(muestras) * 1e6,
+        "ops_por_segundo": 1 / mediana if mediana else None
+    }
+
+
+# --------------------------------------------
+# ESCENARIOS
+# --------------------------------------------
+def preparar_escenario(motor, avatars, semilla):
+    """
+    Deja el motor en un estado fijo: una rook por columna en la fila 1 y
+    `avatars` avatars repartidos desde la fila 2, con cooldowns al azar
+    para que se muevan y peleen durante la medición.
+    """
+    rng = random.Random(semilla)
+    motor.limpiar_entidades()
+    motor.rng = random.Random(semilla)
+    motor.game_over = False
+    motor.victoria = False
+    motor.economia = ECONOMIA_ILIMITADA
+    motor.detener_spawns()
+
+    clases_rook = list(TIPOS_ROOK.values())
+    for col in range(motor.columnas):
+        motor.agregar_rook(rng.choice(clases_rook)(1, col))
+
+    clases_avatar = list(CLASES_AVATARS.values())
+    for _ in range(avatars):
+        clase = rng.choice(clases_avatar)
+        avatar = clase(rng.randrange(2, motor.filas), rng.randrange(motor.columnas))
+        avatar.tiempo_desde_avance = rng.randrange(clase.vel_avance)
+        avatar.tiempo_desde_ataque = rng.randrange(clase.vel_ataque)
+        motor.agregar_avatar(avatar)
+
+    motor.notificar("al_refrescar")
+
+
+def celda_libre(motor, rng):
+    libres = [
+        (f, c)
+        for f in range(motor.filas)
+        for c in range(motor.columnas)
+        if not motor.grilla.ocupada(f, c)
+    ]
+    return rng.choice(libres)
+
+
+# --------------------------------------------
+# BENCHMARKS
+# --------------------------------------------
+def bench_tick(ctrl, semilla, repeticiones, cantidades):
+    # El bucle mide tiempo real; con un reloj manual cada tick es 1 s de juego
+    reloj = RelojManual()
+    ctrl.bucle.reloj = reloj
+    ctrl.bucle.reanudar()
+    ctrl.tick()
+
+    resultados = {}
+    for n in cantidades:
+        def preparar():
+            preparar_escenario(ctrl.motor, n, semilla)
+            ctrl.refrescar_si_pendiente()
+            return ()
+
+        def ticks():
+            for _ in range(TICKS_POR_MUESTRA):
+                reloj.ahora += 1.0
+                ctrl.tick()
+
+        resultados[f"tick[avatars={n}]"] = medir(
+            ticks, repeticiones, preparar, operaciones=TICKS_POR_MUESTRA
+        )
+    return resultados
+
+
+def bench_acciones(ctrl, semilla, repeticiones):
+    rng = random.Random(semilla)
+
+    def preparar_moneda():
+        preparar_escenario(ctrl.motor, 20, semilla)
+        ctrl.refrescar_si_pendiente()
+        return ()
+
+    def preparar_rook():
+        preparar_escenario(ctrl.motor, 20, semilla)
+        ctrl.refrescar_si_pendiente()
+        fila, col = celda_libre(ctrl.motor, rng)
+        return fila, col, rng.choice(list(TIPOS_ROOK))
+
+    return {
+        "spawn_coin": medir(ctrl.spawn_coin, repeticiones, preparar_moneda),
+        "colocar_rook": medir(ctrl.colocar_rook, repeticiones, preparar_rook)
+    }
+
+
+def bench_render(ctrl, tablero, semilla, repeticiones):
+    semillas = iter(range(semilla, semilla + repeticiones))
+
+    def preparar_sin_cambios():
+        ctrl.refrescar_tablero()
+        return ()
+
+    def preparar_frame_nuevo():
+        # Otro escenario: el diff toca la mayoría de las celdas
+        preparar_escenario(ctrl.motor, 30, next(semillas))
+        return ()
+
+    def preparar_completo():
+        tablero._frame_valido = False
+        return ()
+
+    resultados = {
+        "refrescar_tablero[sin_cambios]": medir(
+            ctrl.refrescar_tablero, repeticiones, preparar_sin_cambios
+        ),
+        "refrescar_tablero[frame_nuevo]": medir(
+            ctrl.refrescar_tablero, repeticiones, preparar_frame_nuevo
+        ),
+        "refrescar_tablero[completo]": medir(
+            ctrl.refrescar_tablero, repeticiones, preparar_completo
+        )
+    }
+
+    # Recorre el tablero como lo haría el cursor
+    celdas = [(f, c) for f in range(tablero.filas) for c in range(tablero.columnas)]
+    indice = iter(range(repeticiones))
+
+    def preparar_resaltado():
+        return celdas[next(indice) % len(celdas)]
+
+    resultados["resaltar_celda"] = medir(tablero.resaltar_celda, repeticiones, preparar_resaltado)
+    return resultados
+
+
+def bench_persistencia(ctrl, semilla, repeticiones):
+    def guardar():
+        # guardar_partida termina cerrando el juego con sys.exit()
+        try:
+            ctrl.guardar_partida()
+        except SystemExit:
+            pass
+
+    def preparar():
+        preparar_escenario(ctrl.motor, 200, semilla)
+        ctrl.refrescar_si_pendiente()
+        return ()
+
+    def ida_y_vuelta():
+        guardar()
+        ctrl.cargar_partida()
+
+    return {
+        "guardar_partida": medir(guardar, repeticiones, preparar),
+        "cargar_partida": medir(ctrl.cargar_partida, repeticiones, preparar),
+        "guardar_cargar": medir(ida_y_vuelta, repeticiones, preparar)
+    }
+
+
+# --------------------------------------------
+# CORRIDA COMPLETA
+# --------------------------------------------
+def correr(semilla, repeticiones, cantidades):
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    tablero = Tablero()
+    ctrl = GameController(tablero)
+    # El timer no corre sin event loop, pero se detiene igual; sin
+    # autoguardado para que no se mezcle con las mediciones
+    ctrl.timer.stop()
+    ctrl.autoguardado.cerrar()
+    ctrl.motor.verbose = False
+
+    resultados = {}
+    resultados.update(bench_tick(ctrl, semilla, repeticiones, cantidades))
+    resultados.update(bench_acciones(ctrl, semilla, repeticiones))
+    resultados.update(bench_render(ctrl, tablero, semilla, repeticiones))
+    # Al final: guardar_partida cierra la bitácora de la sesión
+    resultados.update(bench_persistencia(ctrl, semilla, repeticiones))
+
+    tablero.close()
+    app.processEvents()
+    return resultados
+
+
+def comparar(resultados, anterior):
+    print(f"\n📈 Comparación (mediana) contra {anterior['fecha']}:")
+    for nombre, actual in resultados.items():
+        previo = anterior["resultados"].get(nombre)
+        if previo is None:
+            print(f"   {nombre:<34} (nuevo)")
+            continue
+        factor = previo["mediana_us"] / actual["mediana_us"] if actual["mediana_us"] else float("inf")
+        print(f"   {nombre:<34} {previo['mediana_us']:>11.1f} → {actual['mediana_us']:>11.1f} µs  x{factor:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de Avatars VS Rooks")
+    parser.add_argument("--semilla", type=int, default=1234)
+    parser.add_argument("--repeticiones", type=int, default=200)
+    parser.add_argument("--avatars", type=int, nargs="+", default=list(CANTIDADES_AVATARS),
+                        help="cantidades de avatars para medir tick")
+    parser.add_argument("--salida", help="archivo JSON de resultados (por defecto benchmarks/<fecha>.json)")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior para comparar")
+    args = parser.parse_args()
+
+    salida = Path(args.salida) if args.salida else (
+        ROOT / "benchmarks" / time.strftime("benchmark_%Y%m%d_%H%M%S.json")
+    )
+    salida = salida.resolve()
+
+    print(f"⏱️ Benchmarks con semilla {args.semilla} y {args.repeticiones} repeticiones...")
+    origen = os.getcwd()
+    # Bitácora y partidas guardadas van a una carpeta temporal
+    with tempfile.TemporaryDirectory() as carpeta:
+        os.chdir(carpeta)
+        os.environ["AVR_DATOS"] = carpeta
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                resultados = correr(args.semilla, args.repeticiones, args.avatars)
+        finally:
+            os.chdir(origen)
+
+    informe = {
+        "version": VERSION,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "semilla": args.semilla,
+        "repeticiones": args.repeticiones,
+        "python": platform.python_version(),
+        "pyside": PySide6.__version__,
+        "plataforma": platform.platform(),
+        "resultados": resultados
+    }
+
+    for nombre, r in resultados.items():
+        print(f"   {nombre:<34} mediana {r['mediana_us']:>11.1f} µs  ({r['ops_por_segundo']:.0f}/s)")
+
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(informe, f, indent=4, ensure_ascii=False)
+    print(f"💾 Resultados guardados en {salida}")
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            comparar(resultados, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
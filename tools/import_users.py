@@ -0,0 +1,152 @@
+"""
+Alta masiva de usuarios desde un CSV (kioscos, cuentas de estudiantes...).
+
+El CSV lleva cabecera con las columnas username y password, y
+opcionalmente role. Los usuarios que ya existen se detectan con una sola
+consulta, las contraseñas se hashean en un pool de procesos (PBKDF2 es
+caro) y los documentos se insertan por lotes con insert_many, en el
+backend configurado (AVR_STORAGE=mongo|local).
+
+Uso:
+    python tools/import_users.py usuarios.csv
+    python tools/import_users.py usuarios.csv --role student --procesos 8
+    AVR_STORAGE=local python tools/import_users.py usuarios.csv --lote 500
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Agrega la raíz del proyecto al PATH para poder importar app.utils
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from app.utils.auth import new_user_document  # noqa: E402
+from app.database.storage import get_db  # noqa: E402
+from app.database.indexes import ensure_indexes  # noqa: E402
+from app.database.local_db import DuplicateKeyError  # noqa: E402
+
+MIN_USERNAME = 3   # mismas reglas que la ventana de registro
+MIN_PASSWORD = 4
+
+
+def read_rows(path, default_role):
+    """
+    Devuelve (válidas, fallidas). Cada fila válida es (línea, usuario,
+    contraseña, rol); cada fallida es (línea, usuario, motivo). Un usuario
+    repetido dentro del CSV solo se importa la primera vez.
+    """
+    valid, failed, seen = [], [], set()
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.DictReader(f)
+        missing = {"username", "password"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"Faltan columnas en el CSV: {', '.join(sorted(missing))}")
+        for row in reader:
+            line = reader.line_num
+            username = (row.get("username") or "").strip()
+            password = (row.get("password") or "").strip()
+            role = (row.get("role") or "").strip() or default_role
+            if len(username) < MIN_USERNAME:
+                failed.append((line, username, f"usuario de menos de {MIN_USERNAME} caracteres"))
+            elif len(password) < MIN_PASSWORD:
+                failed.append((line, username, f"contraseña de menos de {MIN_PASSWORD} caracteres"))
+            elif username in seen:
+                failed.append((line, username, "repetido en el CSV"))
+            else:
+                seen.add(username)
+                valid.append((line, username, password, role))
+    return valid, failed
+
+
+def existing_usernames(collection, usernames):
+    """Usuarios que ya están en la base, con una sola consulta."""
+    found = collection.find({"username": {"$in": list(usernames)}}, {"username": 1, "_id": 0})
+    return {doc["username"] for doc in found}
+
+
+def insert_batch(collection, rows, documents):
+    """
+    Inserta un lote sin detenerse en el primer error. Devuelve
+    (insertados, fallidas) con el mismo formato de fallidas que read_rows.
+    """
+    try:
+        result = collection.insert_many(documents, ordered=False)
+        return len(result.inserted_ids), []
+    except DuplicateKeyError as e:
+        # Backend local
+        failed = [(rows[i][0], rows[i][1], message) for i, message in e.errors]
+        return len(e.inserted_ids), failed
+    except Exception as e:
+        # Mongo: BulkWriteError trae el índice de cada documento rechazado
+        details = getattr(e, "details", None)
+        if not details:
+            return 0, [(line, username, str(e)) for line, username, *_ in rows]
+        failed = [
+            (rows[err["index"]][0], rows[err["index"]][1], err.get("errmsg", "error de escritura"))
+            for err in details.get("writeErrors", [])
+        ]
+        return details.get("nInserted", 0), failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alta masiva de usuarios de Avatars VS Rooks desde CSV")
+    parser.add_argument("csv", help="archivo con columnas username,password[,role]")
+    parser.add_argument("--role", default="user", help="rol para las filas sin columna role")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count(),
+                        help="procesos para hashear contraseñas")
+    parser.add_argument("--lote", type=int, default=1000, help="documentos por insert_many")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows, failed = read_rows(args.csv, args.role)
+    total = len(rows) + len(failed)
+    print(f"📄 {total} filas leídas de {args.csv} ({len(failed)} inválidas)")
+
+    # Con el índice único, un usuario creado entre la consulta y el insert falla por fila
+    ensure_indexes()
+    collection = get_db()["users"]
+    existing = existing_usernames(collection, [username for _, username, _, _ in rows])
+    skipped = [(line, username, "ya existe") for line, username, _, _ in rows if username in existing]
+    rows = [row for row in rows if row[1] not in existing]
+    print(f"🔍 {len(skipped)} usuarios ya existían")
+
+    # Hashear en paralelo (un PBKDF2 de 130.000 iteraciones por usuario)
+    hash_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.procesos) as pool:
+        documents = list(pool.map(
+            new_user_document,
+            [row[1] for row in rows], [row[2] for row in rows], [row[3] for row in rows],
+            chunksize=max(1, len(rows) // (args.procesos * 4))
+        ))
+    hash_seconds = time.perf_counter() - hash_start
+    if rows:
+        print(f"🔐 {len(rows)} contraseñas hasheadas en {hash_seconds:.2f}s "
+              f"({len(rows) / hash_seconds:.0f}/s con {args.procesos} procesos)")
+
+    # Insertar por lotes
+    insert_start = time.perf_counter()
+    created = 0
+    for i in range(0, len(documents), args.lote):
+        inserted, batch_failed = insert_batch(collection, rows[i:i + args.lote], documents[i:i + args.lote])
+        created += inserted
+        failed.extend(batch_failed)
+    insert_seconds = time.perf_counter() - insert_start
+
+    elapsed = time.perf_counter() - start
+    print(f"💾 {created} usuarios insertados en {insert_seconds:.2f}s")
+    print(f"✅ {created}/{total} creados en {elapsed:.2f}s ({created / elapsed:.0f} usuarios/s)")
+
+    problems = sorted(failed + skipped)
+    if problems:
+        print(f"⚠️ {len(problems)} filas no importadas:")
+        for line, username, reason in problems:
+            print(f"   línea {line}: {username or '(vacío)'} - {reason}")
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""
+Reproduce una partida registrada en una bitácora (repeticiones/*.jsonl en la
+carpeta de datos del usuario, ver guardado.carpeta_usuario) sin interfaz y a
+máxima velocidad, y verifica que los spawns coincidan.
+
+Uso:
+    python tools/reproducir_partida.py ~/.local/share/AvatarsVsRooks/repeticiones/partida_20250101_120000_1a2b3c4d.jsonl
+"""
+import sys
+from pathlib import Path
+
+# Los módulos del juego usan imports planos (se ejecutan desde game/)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "game"))
+
+from bitacora import Bitacora, reproducir  # noqa: E402
+from cronometro import reloj  # noqa: E402
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print("Uso: python tools/reproducir_partida.py <bitacora.jsonl> [--verbose]")
+        return 2
+
+    try:
+        cabecera, entradas = Bitacora.leer(args[0])
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo leer la bitácora: {e}")
+        return 2
+    print(f"🎲 Semilla {cabecera['semilla']} · tablero {cabecera['filas']}x{cabecera['columnas']} · {len(entradas)} entradas")
+
+    inicio = reloj()
+    motor, diferencia = reproducir(cabecera, entradas, verbose="--verbose" in args)
+    transcurrido = reloj() - inicio
+
+    if motor.victoria:
+        resultado = "victoria"
+    elif motor.game_over:
+        resultado = "derrota"
+    else:
+        resultado = "en curso"
+    print(f"⏱️ {motor.tiempo_juego():.0f}s de juego reproducidos en {transcurrido * 1000:.1f} ms")
+    print(f"📊 Resultado: {resultado} · nivel {motor.niveles_progresivos.nivel_actual} · economía {motor.economia}")
+
+    if diferencia is None:
+        print("✅ La repetición coincide con la bitácora")
+        return 0
+    indice, esperado, obtenido = diferencia
+    print(f"❌ Discrepancia en el evento {indice}: esperado {esperado}, obtenido {obtenido}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
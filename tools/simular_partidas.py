@@ -0,0 +1,245 @@
+"""
+Simulación Monte Carlo de partidas completas (niveles 1-3) sin interfaz.
+
+Corre N partidas del MotorJuego en un pool de procesos, cada una con su
+propia semilla, y reporta tasa de victoria, duración media, curva de
+economía y supervivencia por oleada.
+
+Uso:
+    python tools/simular_partidas.py -n 10000 --politica guion
+    python tools/simular_partidas.py -n 2000 --ajuste 1.economia_inicial=400
+    python tools/simular_partidas.py -n 10000 --backend numpy
+    python tools/simular_partidas.py -n 100 --filas 200 --columnas 40
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from multiprocessing import Pool
+from pathlib import Path
+
+# Los módulos del juego usan imports planos (se ejecutan desde game/)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "game"))
+
+from motor import MotorJuego  # noqa: E402
+from cronometro import reloj  # noqa: E402
+
+
+def clase_motor(backend):
+    if backend == "numpy":
+        from motor_numpy import MotorNumpy
+        return MotorNumpy
+    return MotorJuego
+
+
+MUESTREO_ECONOMIA = 10   # segundos de juego entre muestras de economía
+TIPOS_POR_PRIORIDAD = (3, 2, 1)   # FireRook, RockRook, SandRook
+
+
+# --------------------------------------------
+# POLÍTICAS DE COLOCACIÓN
+# --------------------------------------------
+def politica_aleatoria(motor, rng):
+    """Intenta una rook aleatoria en una celda aleatoria (30% de los segundos)."""
+    if rng.random() < 0.3:
+        fila = rng.randint(1, motor.filas - 2)
+        col = rng.randint(0, motor.columnas - 1)
+        motor.colocar_rook(fila, col, rng.randint(1, 4))
+
+
+def politica_guion(motor, rng):
+    """Defiende primero el carril con el avatar más cercano a la base."""
+    if not motor.avatars:
+        return
+    amenaza = min(motor.avatars, key=lambda a: a.fila)
+    for fila in range(1, amenaza.fila):
+        if motor.grilla.rook_en(fila, amenaza.col) is not None:
+            continue
+        for tipo in TIPOS_POR_PRIORIDAD:
+            if motor.colocar_rook(fila, amenaza.col, tipo):
+                return
+        return
+
+
+POLITICAS = {
+    "aleatoria": politica_aleatoria,
+    "guion": politica_guion
+}
+
+
+class ObservadorOleadas:
+    """Observador del motor que anota las oleadas alcanzadas."""
+
+    def __init__(self, motor):
+        self.motor = motor
+        self.oleadas = []
+
+    def al_cambiar_oleada(self, oleada, oleadas_totales):
+        self.oleadas.append((self.motor.niveles_progresivos.nivel_actual, oleada))
+
+
+# --------------------------------------------
+# UNA PARTIDA (se ejecuta en un proceso del pool)
+# --------------------------------------------
+def jugar_partida(args):
+    semilla, politica, max_segundos, ajustes, backend, filas, columnas = args
+    rng = random.Random(f"politica-{semilla}")
+    decidir = POLITICAS[politica]
+
+    motor = clase_motor(backend)(filas, columnas, verbose=False, semilla=semilla)
+    for nivel, clave, valor in ajustes:
+        motor.niveles_progresivos.niveles[nivel][clave] = valor
+    registro = ObservadorOleadas(motor)
+    motor.observador = registro
+    motor.iniciar()
+
+    economia = [motor.economia]
+    while not motor.terminado() and motor.tiempo_ms < max_segundos * 1000:
+        motor.step(1)
+        # El jugador simulado recoge todas las monedas y decide una jugada
+        for moneda in list(motor.monedas):
+            motor.recoger_moneda_en(moneda.fila, moneda.col)
+        decidir(motor, rng)
+        if motor.tiempo_ms % (MUESTREO_ECONOMIA * 1000) == 0:
+            economia.append(motor.economia)
+
+    if motor.victoria:
+        resultado = "victoria"
+    elif motor.game_over:
+        resultado = "derrota"
+    else:
+        resultado = "tiempo_agotado"
+
+    return {
+        "resultado": resultado,
+        "duracion": motor.tiempo_juego(),
+        "nivel": motor.niveles_progresivos.nivel_actual,
+        "economia": economia,
+        "oleadas": registro.oleadas
+    }
+
+
+# --------------------------------------------
+# AGREGACIÓN
+# --------------------------------------------
+def agregar_resultados(partidas):
+    total = len(partidas)
+    conteo = {"victoria": 0, "derrota": 0, "tiempo_agotado": 0}
+    duraciones_victoria = []
+    suma_economia = []
+    partidas_economia = []
+    alcanzadas = {}
+    superadas = {}
+
+    for p in partidas:
+        conteo[p["resultado"]] += 1
+        if p["resultado"] == "victoria":
+            duraciones_victoria.append(p["duracion"])
+
+        for i, valor in enumerate(p["economia"]):
+            if i == len(suma_economia):
+                suma_economia.append(0)
+                partidas_economia.append(0)
+            suma_economia[i] += valor
+            partidas_economia[i] += 1
+
+        # Una oleada se supera si la partida no terminó en derrota durante ella
+        for i, oleada in enumerate(p["oleadas"]):
+            alcanzadas[oleada] = alcanzadas.get(oleada, 0) + 1
+            ultima = i == len(p["oleadas"]) - 1
+            if not (ultima and p["resultado"] == "derrota"):
+                superadas[oleada] = superadas.get(oleada, 0) + 1
+
+    return {
+        "partidas": total,
+        "tasa_victoria": conteo["victoria"] / total if total else 0,
+        "resultados": conteo,
+        "duracion_media_victoria": (
+            sum(duraciones_victoria) / len(duraciones_victoria) if duraciones_victoria else None
+        ),
+        "duracion_media": sum(p["duracion"] for p in partidas) / total if total else 0,
+        "curva_economia": [
+            {"segundo": i * MUESTREO_ECONOMIA, "economia_media": s / n, "partidas": n}
+            for i, (s, n) in enumerate(zip(suma_economia, partidas_economia))
+        ],
+        "supervivencia_oleadas": [
+            {
+                "nivel": nivel,
+                "oleada": oleada,
+                "alcanzada": alcanzadas[(nivel, oleada)],
+                "supervivencia": superadas.get((nivel, oleada), 0) / alcanzadas[(nivel, oleada)]
+            }
+            for nivel, oleada in sorted(alcanzadas)
+        ]
+    }
+
+
+def parsear_ajuste(texto):
+    """'1.economia_inicial=400' -> (1, 'economia_inicial', 400)"""
+    clave, valor = texto.split("=", 1)
+    nivel, campo = clave.split(".", 1)
+    return int(nivel), campo, int(valor)
+
+
+def entero_minimo(minimo):
+    """Tipo de argparse: entero >= minimo."""
+    def convertir(texto):
+        valor = int(texto)
+        if valor < minimo:
+            raise argparse.ArgumentTypeError(f"debe ser al menos {minimo} (se dio {valor})")
+        return valor
+    return convertir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación masiva de partidas de Avatars VS Rooks")
+    parser.add_argument("-n", "--partidas", type=int, default=1000)
+    parser.add_argument("--semilla", type=int, default=0, help="semilla de la primera partida")
+    parser.add_argument("--politica", choices=sorted(POLITICAS), default="guion")
+    parser.add_argument("--backend", choices=["python", "numpy"], default="python",
+                        help="motor por objetos o struct-of-arrays con NumPy")
+    # Fila 0 = base y última = llegada de avatars: hacen falta 3 para colocar rooks
+    parser.add_argument("--filas", type=entero_minimo(3), default=9)
+    parser.add_argument("--columnas", type=entero_minimo(1), default=5)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count())
+    parser.add_argument("--max-segundos", type=int, default=3600,
+                        help="tiempo de juego máximo por partida")
+    parser.add_argument("--ajuste", action="append", default=[], type=parsear_ajuste,
+                        help="sobrescribe un parámetro de nivel, p. ej. 2.spawn_interval=6000")
+    parser.add_argument("--salida", help="archivo JSON donde guardar el resumen")
+    args = parser.parse_args()
+
+    tareas = [
+        (args.semilla + i, args.politica, args.max_segundos, args.ajuste, args.backend,
+         args.filas, args.columnas)
+        for i in range(args.partidas)
+    ]
+
+    print(f"🎲 Simulando {args.partidas} partidas ({args.politica}) con {args.procesos} procesos...")
+    inicio = reloj()
+    with Pool(args.procesos) as pool:
+        partidas = pool.map(jugar_partida, tareas, chunksize=max(1, len(tareas) // (args.procesos * 8)))
+    transcurrido = reloj() - inicio
+
+    resumen = agregar_resultados(partidas)
+    resumen["segundos_reales"] = transcurrido
+    resumen["partidas_por_segundo"] = args.partidas / transcurrido if transcurrido else None
+
+    print(f"✅ {args.partidas} partidas en {transcurrido:.2f}s ({resumen['partidas_por_segundo']:.0f}/s)")
+    print(f"🏆 Tasa de victoria: {resumen['tasa_victoria']:.1%}  {resumen['resultados']}")
+    if resumen["duracion_media_victoria"] is not None:
+        print(f"⏱️ Duración media de victoria: {resumen['duracion_media_victoria']:.1f}s de juego")
+    print("🌊 Supervivencia por oleada:")
+    for o in resumen["supervivencia_oleadas"]:
+        print(f"   Nivel {o['nivel']} oleada {o['oleada']:>2}: {o['supervivencia']:.1%} ({o['alcanzada']})")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(resumen, f, indent=4, ensure_ascii=False)
+        print(f"💾 Resumen guardado en {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
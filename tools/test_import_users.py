@@ -0,0 +1,108 @@
+"""
+Pruebas del alta masiva de usuarios desde CSV (import_users).
+
+Uso:
+    python -m pytest tools/test_import_users.py
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, CARPETA)
+
+import import_users  # noqa: E402
+from import_users import existing_usernames, insert_batch, read_rows  # noqa: E402
+from app.database.indexes import ensure_indexes  # noqa: E402
+from app.database.local_db import LocalDatabase  # noqa: E402
+
+
+def escribir_csv(ruta, texto):
+    ruta.write_text(texto, encoding="utf-8")
+    return ruta
+
+
+@pytest.fixture
+def users(tmp_path):
+    db = LocalDatabase(tmp_path / "db")
+    ensure_indexes(db)
+    return db["users"]
+
+
+def test_read_rows_valida_cada_fila(tmp_path):
+    ruta = escribir_csv(tmp_path / "u.csv", (
+        "username,password,role\n"
+        "ana,secreta,admin\n"
+        "al,secreta,\n"
+        "beto,abc,\n"
+        "ana,otra1234,\n"
+        " caro ,clave1,\n"
+    ))
+    validas, fallidas = read_rows(ruta, "student")
+    assert validas == [(2, "ana", "secreta", "admin"), (6, "caro", "clave1", "student")]
+    assert [(linea, usuario) for linea, usuario, _ in fallidas] == [(3, "al"), (4, "beto"), (5, "ana")]
+    assert "repetido" in fallidas[2][2]
+
+
+def test_read_rows_sin_columnas(tmp_path):
+    ruta = escribir_csv(tmp_path / "u.csv", "usuario,clave\nana,secreta\n")
+    with pytest.raises(ValueError):
+        read_rows(ruta, "user")
+
+
+def test_existing_usernames(users):
+    users.insert_many([{"username": "ana"}, {"username": "beto"}])
+    assert existing_usernames(users, ["ana", "caro", "beto"]) == {"ana", "beto"}
+    assert existing_usernames(users, []) == set()
+
+
+def test_insert_batch_informa_repetidos_por_fila(users):
+    users.insert_one({"username": "beto"})
+    filas = [(2, "ana", "x", "user"), (3, "beto", "x", "user"), (4, "caro", "x", "user")]
+    documentos = [{"username": usuario} for _, usuario, _, _ in filas]
+    insertados, fallidas = insert_batch(users, filas, documentos)
+    assert insertados == 2
+    assert [(linea, usuario) for linea, usuario, _ in fallidas] == [(3, "beto")]
+    assert users.count_documents({}) == 3
+
+
+def test_insert_batch_error_de_mongo():
+    class BulkWriteError(Exception):
+        details = {"nInserted": 1, "writeErrors": [{"index": 1, "errmsg": "E11000 duplicate key"}]}
+
+    class Coleccion:
+        def insert_many(self, documents, ordered=True):
+            raise BulkWriteError()
+
+    filas = [(2, "ana", "x", "user"), (3, "beto", "x", "user")]
+    insertados, fallidas = insert_batch(Coleccion(), filas, [{}, {}])
+    assert insertados == 1
+    assert fallidas == [(3, "beto", "E11000 duplicate key")]
+
+
+def test_main_con_backend_local(tmp_path):
+    ruta = escribir_csv(tmp_path / "u.csv", (
+        "username,password\n"
+        "ana,secreta\n"
+        "beto,x\n"
+        "caro,clave1\n"
+        "ana,secreta\n"
+    ))
+    entorno = {**os.environ, "AVR_STORAGE": "local", "AVR_LOCAL_DIR": str(tmp_path / "db")}
+    comando = [sys.executable, import_users.__file__, str(ruta), "--procesos", "1"]
+
+    primera = subprocess.run(comando, env=entorno, capture_output=True, text=True)
+    assert primera.returncode == 1, primera.stdout + primera.stderr
+    assert "2/4 creados" in primera.stdout
+
+    users = LocalDatabase(tmp_path / "db")["users"]
+    assert sorted(d["username"] for d in users.find()) == ["ana", "caro"]
+    assert all(d["hash"] and d["role"] == "user" for d in users.find())
+
+    # Repetir la importación no crea nada: los usuarios ya existen
+    segunda = subprocess.run(comando, env=entorno, capture_output=True, text=True)
+    assert "0/4 creados" in segunda.stdout
+    assert "2 usuarios ya existían" in segunda.stdout
+    assert LocalDatabase(tmp_path / "db")["users"].count_documents({}) == 2
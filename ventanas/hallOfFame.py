@@ -3,8 +3,7 @@ from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                               QHeaderView, QMessageBox)
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QColor
-from app.database.mongo_connection import db
-from datetime import datetime
+from app.utils.hall_of_fame_service import HallOfFameService, add_winner_async
 
 
 class HallOfFameWindow(QMainWindow):
@@ -12,7 +11,10 @@ class HallOfFameWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("🏆 SALÓN DE LA FAMA")
         self.setMinimumSize(600, 500)
-        self.collection = db["hall_of_fame"]
+        # La base se consulta en segundo plano; los resultados llegan por señales
+        self.service = HallOfFameService(self)
+        self.service.winners_loaded.connect(self.on_winners_loaded)
+        self.service.history_cleared.connect(self.on_history_cleared)
         
         # Widget central y layout
         central_widget = QWidget()
@@ -106,16 +108,34 @@ class HallOfFameWindow(QMainWindow):
         btn.clicked.connect(callback)
         return btn
     
+    def set_busy(self, busy):
+        """Deshabilita los botones que usan la base mientras hay una operación en curso"""
+        self.btn_refresh.setEnabled(not busy)
+        self.btn_clear.setEnabled(not busy)
+
     def load_winners(self):
-        """Carga los ganadores desde MongoDB"""
+        """Pide los ganadores a la base de datos (en segundo plano)"""
+        self.set_busy(True)
+        self.show_empty_table("⏳ Cargando...")
+        self.service.load()
+
+    def on_winners_loaded(self, winners, error):
+        """Muestra los ganadores (ordenados por fecha, más reciente primero)"""
+        self.set_busy(False)
+        if error:
+            print(f"❌ Error cargando ganadores: {error}")
+            self.show_empty_table()
+            return
+        self.show_winners(winners)
+
+    def show_winners(self, winners):
+        """Llena la tabla con los ganadores"""
         try:
-            # Obtener ganadores ordenados por fecha (más reciente primero)
-            winners = list(self.collection.find().sort("completed_at", -1))
-            
             if not winners:
                 self.show_empty_table()
                 return
             
+            self.table.clearSpans()
             self.table.setRowCount(len(winners))
             
             for row, winner in enumerate(winners):
@@ -180,10 +200,11 @@ class HallOfFameWindow(QMainWindow):
         }
         return colors.get(position, QColor(255, 255, 255))
     
-    def show_empty_table(self):
+    def show_empty_table(self, message="No hay ganadores aún"):
         """Muestra mensaje cuando no hay ganadores"""
+        self.table.clearSpans()
         self.table.setRowCount(1)
-        empty_item = QTableWidgetItem("No hay ganadores aún")
+        empty_item = QTableWidgetItem(message)
         empty_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         empty_item.setFont(QFont("Arial", 12))
         empty_item.setForeground(QColor(150, 150, 150))
@@ -207,43 +228,29 @@ class HallOfFameWindow(QMainWindow):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                result = self.collection.delete_many({})
-                print(f"🗑️ Eliminados {result.deleted_count} ganadores")
-                self.load_winners()
-                QMessageBox.information(
-                    self,
-                    "Historial Limpiado",
-                    "El Salón de la Fama ha sido limpiado exitosamente."
-                )
-            except Exception as e:
-                print(f"❌ Error limpiando historial: {e}")
-                QMessageBox.critical(self, "Error", f"No se pudo limpiar el historial: {str(e)}")
+            self.set_busy(True)
+            self.service.clear()
+
+    def on_history_cleared(self, deleted_count, error):
+        """Resultado de clear_history"""
+        self.set_busy(False)
+        if error:
+            print(f"❌ Error limpiando historial: {error}")
+            QMessageBox.critical(self, "Error", f"No se pudo limpiar el historial: {error}")
+            return
+        print(f"🗑️ Eliminados {deleted_count} ganadores")
+        self.load_winners()
+        QMessageBox.information(
+            self,
+            "Historial Limpiado",
+            "El Salón de la Fama ha sido limpiado exitosamente."
+        )
     
     @staticmethod
     def add_winner(username):
-        """Agrega un ganador al salón de la fama (método estático para usar desde cualquier parte)"""
-        try:
-            collection = db["hall_of_fame"]
-            
-            # Verificar si ya completó el juego
-            if collection.find_one({"username": username}):
-                print(f"ℹ️ {username} ya está en el Salón de la Fama")
-                return False
-            
-            # Agregar nuevo ganador
-            winner = {
-                "username": username,
-                "completed_at": datetime.now()
-            }
-            
-            result = collection.insert_one(winner)
-            
-            if result.inserted_id:
-                print(f"🏆 {username} agregado al Salón de la Fama!")
-                return True
-            return False
-            
-        except Exception as e:
-            print(f"❌ Error agregando ganador: {e}")
-            return False
\ No newline at end of file
+        """
+        Agrega un ganador al salón de la fama (método estático para usar desde
+        cualquier parte). Corre en segundo plano: devuelve un Future con True
+        si lo agregó.
+        """
+        return add_winner_async(username)
\ No newline at end of file